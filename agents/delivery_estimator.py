@@ -16,6 +16,7 @@ from enum import Enum
 import googlemaps
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
+from sqlalchemy.orm import lazyload
 
 from database import get_db_session
 from database.models import Order, OrderStatus, ActiveSession
@@ -324,7 +325,7 @@ class LoadCalculator:
         try:
             async with get_db_session() as session:
                 # Get orders currently in preparation or out for delivery
-                active_orders = session.query(Order).filter(
+                active_orders = session.query(Order).options(lazyload('*')).filter(
                     Order.order_status.in_([
                         OrderStatus.PREPARING.value,
                         OrderStatus.OUT_FOR_DELIVERY.value,
@@ -333,7 +334,7 @@ class LoadCalculator:
                 ).all()
                 
                 # Get orders awaiting preparation
-                pending_orders = session.query(Order).filter(
+                pending_orders = session.query(Order).options(lazyload('*')).filter(
                     Order.order_status == OrderStatus.PENDING.value
                 ).all()
                 
@@ -21,8 +21,8 @@ from langchain_openai import ChatOpenAI
 from .states import OrderState, StateManager, ValidationResult
 from .prompts import PromptManager
 from database import (
-    create_session, update_session, get_session, 
-    create_order, get_order, OrderManager
+    get_session, 
+    create_order, get_order, OrderManager, SessionManager
 )
 from validation import AddressValidator, OrderValidator, PaymentValidator
 from validation.error_formatter import format_validation_summary
@@ -813,7 +813,7 @@ class PizzaOrderingAgent:
             
             # Create order in database
             order_data = self._prepare_order_data_for_database(state, ticket_id)
-            order = create_order(order_data)
+            order = await OrderManager.acreate_order(order_data)
             
             if not order:
                 raise Exception("Failed to create order in database")
@@ -1658,7 +1658,7 @@ class PizzaOrderingAgent:
             if not session_state:
                 # Create new session
                 initial_state = self.state_manager.create_initial_state(session_id, interface_type)
-                create_session(session_id, {
+                await SessionManager.acreate_session(session_id, {
                     "interface_type": interface_type,
                     "agent_state": "greeting",
                     "order_data": initial_state
@@ -1676,7 +1676,7 @@ class PizzaOrderingAgent:
             result = self.graph.invoke(current_state, config)
             
             # Update session in database
-            update_session(session_id, {
+            await SessionManager.aupdate_session(session_id, {
                 "agent_state": result.get("current_state"),
                 "order_data": result
             })
@@ -10,14 +10,16 @@ from typing import List, Dict, Any, Optional
 from decimal import Decimal
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 
-from database import get_db_session
+from database import get_db_session, OrderManager
 from database.models import (
     Order, OrderStatus, PaymentStatus, ActiveSession, 
-    DeliveryEstimateRecord, PaymentTransaction
+    DeliveryEstimateRecord, PaymentTransaction, ORDER_STATUS_VALUES
 )
 from config.logging_config import get_logger
 from config.settings import settings
@@ -80,7 +82,9 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 
 # Data aggregation functions
-async def get_order_statistics(
+# These run synchronous ORM queries; handlers call them via run_in_threadpool
+# so the event loop keeps serving voice webhooks meanwhile.
+def get_order_statistics(
     session: Session,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None
@@ -128,7 +132,7 @@ async def get_order_statistics(
         
         # Revenue calculation
         revenue_query = base_query.filter(Order.payment_status == PaymentStatus.SUCCEEDED.value)
-        total_revenue = revenue_query.with_entities(func.sum(Order.total_amount)).scalar() or 0
+        total_revenue = (revenue_query.with_entities(func.sum(Order.total_amount_cents)).scalar() or 0) / 100
         
         # Average order value
         avg_order_value = (total_revenue / total_orders) if total_orders > 0 else 0
@@ -180,7 +184,7 @@ async def get_order_statistics(
         raise
 
 
-async def get_active_session_stats(session: Session) -> Dict[str, Any]:
+def get_active_session_stats(session: Session) -> Dict[str, Any]:
     """
     Get current active session statistics.
     
@@ -244,20 +248,6 @@ async def get_dashboard_status(
     try:
         logger.info("Dashboard status requested")
         
-        # Get current session statistics
-        session_stats = await get_active_session_stats(db)
-        
-        # Get today's order statistics
-        today_stats = await get_order_statistics(db)
-        
-        # Calculate system load
-        active_sessions = session_stats["active_sessions"]
-        max_sessions = session_stats["max_sessions"]
-        system_load = "low" if active_sessions < 5 else "normal" if active_sessions < 15 else "high"
-        
-        # Agent status based on current load
-        agent_status = "available" if active_sessions < max_sessions else "at_capacity"
-        
         # Active orders (non-completed)
         active_order_statuses = [
             OrderStatus.PENDING.value,
@@ -268,9 +258,23 @@ async def get_dashboard_status(
             OrderStatus.OUT_FOR_DELIVERY.value
         ]
         
-        active_orders_count = db.query(Order).filter(
-            Order.order_status.in_(active_order_statuses)
-        ).count()
+        def _load_status_data():
+            # Current session statistics, today's order statistics and active orders
+            return (
+                get_active_session_stats(db),
+                get_order_statistics(db),
+                db.query(Order).filter(Order.order_status.in_(active_order_statuses)).count()
+            )
+        
+        session_stats, today_stats, active_orders_count = await run_in_threadpool(_load_status_data)
+        
+        # Calculate system load
+        active_sessions = session_stats["active_sessions"]
+        max_sessions = session_stats["max_sessions"]
+        system_load = "low" if active_sessions < 5 else "normal" if active_sessions < 15 else "high"
+        
+        # Agent status based on current load
+        agent_status = "available" if active_sessions < max_sessions else "at_capacity"
         
         return {
             "success": True,
@@ -341,18 +345,16 @@ async def get_active_tickets(
             Order.order_status.in_(active_statuses)
         ).order_by(Order.created_at.desc()).limit(limit)
         
-        orders = query.all()
+        orders = await run_in_threadpool(query.all)
         
         # Format orders with additional details
         active_tickets = []
         for order in orders:
-            # Get delivery estimate if available
-            delivery_estimate = db.query(DeliveryEstimateRecord).filter(
-                and_(
-                    DeliveryEstimateRecord.order_id == order.id,
-                    DeliveryEstimateRecord.is_active == True
-                )
-            ).first()
+            # Get delivery estimate if available (preloaded via selectin)
+            delivery_estimate = next(
+                (estimate for estimate in order.delivery_estimates if estimate.is_active),
+                None
+            )
             
             # Calculate urgency (overdue orders)
             created_time = order.created_at
@@ -426,6 +428,33 @@ async def get_active_tickets(
         )
 
 
+@router.get("/orders/export")
+async def export_orders(
+    status: str = Query(...),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    GET /api/orders/export - Stream every order with a status as NDJSON.
+    
+    Orders are read and written one batch at a time, so large exports
+    neither build the full list in memory nor wait for it before the
+    first bytes go out.
+    """
+    if status not in ORDER_STATUS_VALUES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown order status: {status}"
+        )
+    
+    logger.info(f"Order export requested, status: {status}")
+    
+    def _ndjson_batches():
+        for batch in OrderManager.iter_orders_by_status(status):
+            yield b"".join(order.to_json_bytes() + b"\n" for order in batch)
+    
+    return StreamingResponse(_ndjson_batches(), media_type="application/x-ndjson")
+
+
 @router.post("/tickets/{ticket_id}/complete")
 async def complete_ticket(
     ticket_id: int,
@@ -443,47 +472,52 @@ async def complete_ticket(
     try:
         logger.info(f"Completing ticket {ticket_id}")
         
-        # Get the order
-        order = db.query(Order).filter(Order.id == ticket_id).first()
-        if not order:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Order {ticket_id} not found"
-            )
-        
-        # Validate current status - can only complete orders that are out for delivery
-        if order.order_status != OrderStatus.OUT_FOR_DELIVERY.value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot complete order with status: {order.order_status}"
-            )
-        
-        # Update order status
-        order.order_status = OrderStatus.DELIVERED.value
-        order.updated_at = datetime.utcnow()
-        
-        # Update delivery estimate with actual time if provided
-        if actual_delivery_time:
-            delivery_estimate = db.query(DeliveryEstimateRecord).filter(
-                and_(
-                    DeliveryEstimateRecord.order_id == order.id,
-                    DeliveryEstimateRecord.is_active == True
+        def _complete_order() -> Order:
+            # Get the order
+            order = db.query(Order).filter(Order.id == ticket_id).first()
+            if not order:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Order {ticket_id} not found"
                 )
-            ).first()
             
-            if delivery_estimate:
-                delivery_estimate.actual_delivery_time = actual_delivery_time
-                delivery_estimate.updated_at = datetime.utcnow()
+            # Validate current status - can only complete orders that are out for delivery
+            if order.order_status != OrderStatus.OUT_FOR_DELIVERY.value:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot complete order with status: {order.order_status}"
+                )
+            
+            # Update order status
+            order.order_status = OrderStatus.DELIVERED.value
+            
+            # Update delivery estimate with actual time if provided
+            if actual_delivery_time:
+                delivery_estimate = db.query(DeliveryEstimateRecord).filter(
+                    and_(
+                        DeliveryEstimateRecord.order_id == order.id,
+                        DeliveryEstimateRecord.is_active == True
+                    )
+                ).first()
+                
+                if delivery_estimate:
+                    delivery_estimate.actual_delivery_time = actual_delivery_time
+            
+            # Commit changes
+            db.commit()
+            db.refresh(order)
+            return order
         
-        # Commit changes
-        db.commit()
-        db.refresh(order)
+        order = await run_in_threadpool(_complete_order)
         
         # Background task: Update delivery estimates for pending orders
         background_tasks.add_task(update_pending_delivery_estimates, ticket_id)
         
         # Background task: Send completion notification (webhook/websocket)
-        background_tasks.add_task(send_completion_notification, order.to_dict())
+        background_tasks.add_task(
+            send_completion_notification,
+            order.to_dict(fields=('id', 'customer_name'))
+        )
         
         logger.info(f"Order {ticket_id} marked as completed")
         
@@ -503,7 +537,7 @@ async def complete_ticket(
         raise
     except Exception as e:
         logger.error(f"Error completing ticket {ticket_id}: {str(e)}")
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=500,
             detail="Failed to complete order"
@@ -533,11 +567,10 @@ async def get_agent_statistics(
         elif period == "month":
             start_date = end_date - timedelta(days=30)
         
-        # Get order statistics for the period
-        order_stats = await get_order_statistics(db, start_date, end_date)
-        
-        # Get current session statistics
-        session_stats = await get_active_session_stats(db)
+        # Get order statistics for the period and current session statistics
+        order_stats, session_stats = await run_in_threadpool(
+            lambda: (get_order_statistics(db, start_date, end_date), get_active_session_stats(db))
+        )
         
         # Calculate agent performance metrics
         total_orders = order_stats["totals"]["total_orders"]
@@ -166,7 +166,7 @@ class MetricsCalculator:
             
             # Average order value
             revenue_query = base_query.filter(Order.payment_status == PaymentStatus.SUCCEEDED.value)
-            total_revenue = revenue_query.with_entities(func.sum(Order.total_amount)).scalar() or 0
+            total_revenue = (revenue_query.with_entities(func.sum(Order.total_amount_cents)).scalar() or 0) / 100
             avg_order_value = (total_revenue / total_orders) if total_orders > 0 else 0
             
             # Completion rate
@@ -366,11 +366,11 @@ class MetricsCalculator:
                 )
             )
             
-            total_revenue = revenue_query.with_entities(func.sum(Order.total_amount)).scalar() or 0
+            total_revenue = (revenue_query.with_entities(func.sum(Order.total_amount_cents)).scalar() or 0) / 100
             order_count = revenue_query.count()
             
             # Revenue by interface type
-            phone_revenue = session.query(func.sum(Order.total_amount)).filter(
+            phone_revenue = session.query(func.sum(Order.total_amount_cents)).filter(
                 and_(
                     Order.created_at >= start_date,
                     Order.created_at <= end_date,
@@ -378,8 +378,9 @@ class MetricsCalculator:
                     Order.interface_type == 'phone'
                 )
             ).scalar() or 0
+            phone_revenue /= 100
             
-            web_revenue = session.query(func.sum(Order.total_amount)).filter(
+            web_revenue = session.query(func.sum(Order.total_amount_cents)).filter(
                 and_(
                     Order.created_at >= start_date,
                     Order.created_at <= end_date,
@@ -387,10 +388,11 @@ class MetricsCalculator:
                     Order.interface_type == 'web'
                 )
             ).scalar() or 0
+            web_revenue /= 100
             
             # Payment method breakdown
             payment_breakdown = {}
-            payment_methods = session.query(Order.payment_method, func.sum(Order.total_amount), func.count(Order.id)).filter(
+            payment_methods = session.query(Order.payment_method, func.sum(Order.total_amount_cents), func.count(Order.id)).filter(
                 and_(
                     Order.created_at >= start_date,
                     Order.created_at <= end_date,
@@ -398,7 +400,8 @@ class MetricsCalculator:
                 )
             ).group_by(Order.payment_method).all()
             
-            for method, revenue, count in payment_methods:
+            for method, revenue_cents, count in payment_methods:
+                revenue = revenue_cents / 100
                 payment_breakdown[method] = {
                     "revenue": float(revenue),
                     "orders": count,
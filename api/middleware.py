@@ -6,7 +6,7 @@ Provides comprehensive request/response handling for the dashboard API.
 import logging
 import time
 import asyncio
-from typing import Dict, Any, Optional, Callable, Awaitable
+from typing import Dict, Any, Optional, Callable, Awaitable, Iterable
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 
@@ -31,7 +31,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app,
         default_calls: int = 100,
         default_period: int = 3600,  # 1 hour
-        storage_cleanup_interval: int = 300  # 5 minutes
+        storage_cleanup_interval: int = 300,  # 5 minutes
+        exempt_paths: Optional[Iterable[str]] = None
     ):
         super().__init__(app)
         
@@ -61,6 +62,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "/favicon.ico"
         }
         
+        # Caller-supplied exact paths that skip rate limiting, e.g. webhooks
+        # already throttled upstream
+        if exempt_paths:
+            self.excluded_paths.update(exempt_paths)
+        
         logger.info("Rate limiting middleware initialized")
     
     async def dispatch(self, request: Request, call_next):
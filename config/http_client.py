@@ -0,0 +1,28 @@
+"""
+Shared outbound HTTP client configuration.
+
+One pooled httpx.AsyncClient is created at application startup and reused by
+every module that downloads from or calls out to external services, so
+connections (and their TLS sessions) are kept alive between requests instead
+of being re-established per call.
+"""
+
+import httpx
+
+
+def make_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled async HTTP client used for outbound calls.
+    
+    HTTP/2 lets concurrent requests to one host share a connection; redirects
+    are followed because Twilio recording URLs redirect to storage.
+    
+    Returns:
+        httpx.AsyncClient: Client to keep for the life of the process
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=10,
+        follow_redirects=True
+    )
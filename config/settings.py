@@ -77,6 +77,11 @@ class Settings(BaseSettings):
     # Server host and port
     host: str = Field(default="0.0.0.0", description="FastAPI server host")
     port: int = Field(default=8000, description="FastAPI server port", ge=1000, le=65535)
+    serve_static_files: bool = Field(
+        default=True,
+        description="Serve /static (TTS audio) from the app; disable when a reverse proxy serves it"
+    )
+    workers: int = Field(default=1, description="Uvicorn worker processes when run via main.py (ignored with reload)", ge=1)
     
     # Environment settings
     environment: str = Field(default="development", description="Environment mode")
@@ -6,18 +6,24 @@ and utility functions for orders and sessions.
 """
 
 # Import main components for easy access
-from .models import Base, Order, ActiveSession, create_tables, drop_tables
+from .base import Base
+from .models import (
+    Order, ActiveSession, create_tables, drop_tables, bulk_insert, copy_rows, make_engine, stream_rows
+)
 from .connection import (
     db_manager, 
     get_db_session, 
     init_database, 
     close_database,
+    init_database_async,
+    close_database_async,
     DatabaseManager
 )
 from .redis_client import (
     redis_client,
     init_redis,
     close_redis,
+    close_redis_async,
     get_redis_client,
     RedisClient
 )
@@ -40,7 +46,8 @@ from .utils import (
     update_session,
     get_active_sessions,
     cleanup_expired_sessions,
-    SessionManager
+    SessionManager,
+    session_write_buffer
 )
 
 # Package metadata
@@ -90,6 +97,7 @@ def close_all_databases():
     """
     try:
         logger.info("Closing database connections...")
+        session_write_buffer.close()
         close_database()
         close_redis()
         logger.info("All database connections closed")
@@ -122,13 +130,15 @@ def get_database_status():
 # Export all important components
 __all__ = [
     # Models
-    'Base', 'Order', 'ActiveSession', 'create_tables', 'drop_tables',
+    'Base', 'Order', 'ActiveSession', 'create_tables', 'drop_tables', 'bulk_insert',
+    'copy_rows', 'make_engine', 'stream_rows',
     
     # Connection management
-    'db_manager', 'get_db_session', 'init_database', 'close_database', 'DatabaseManager',
+    'db_manager', 'get_db_session', 'init_database', 'close_database',
+    'init_database_async', 'close_database_async', 'DatabaseManager',
     
     # Redis client
-    'redis_client', 'init_redis', 'close_redis', 'get_redis_client', 'RedisClient',
+    'redis_client', 'init_redis', 'close_redis', 'close_redis_async', 'get_redis_client', 'RedisClient',
     
     # Migrations
     'initialize_database', 'get_migration_status', 'backup_database', 'migrator',
@@ -136,7 +146,7 @@ __all__ = [
     # Utilities
     'create_order', 'get_order', 'get_active_orders', 'OrderManager',
     'create_session', 'get_session', 'update_session', 'get_active_sessions', 
-    'cleanup_expired_sessions', 'SessionManager',
+    'cleanup_expired_sessions', 'SessionManager', 'session_write_buffer',
     
     # Package functions
     'initialize_all_databases', 'close_all_databases', 'get_database_status'
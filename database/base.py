@@ -0,0 +1,11 @@
+"""
+Declarative base shared by all SQLAlchemy models.
+Every model module imports Base from here so all tables live in one MetaData.
+"""
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    """SQLAlchemy 2.0 declarative base class for all models."""
+    pass
@@ -4,19 +4,79 @@ Provides connection pooling, session handling, and database lifecycle management
 """
 
 import os
+import asyncio
 import logging
-from contextlib import contextmanager
-from typing import Generator, Optional
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncGenerator, Generator, Optional
 import time
-from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, NullPool, StaticPool, AsyncAdaptedQueuePool
+from sqlalchemy import event, text
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
-from .models import Base, create_tables
+from .base import Base
+from .models import create_tables, make_engine, json_dumps, json_loads, _sqlite_pragmas
 
 # Configure logging for database connections
 logger = logging.getLogger(__name__)
 
+# Async drivers substituted for the sync URL's driver by make_async_engine
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def make_async_engine(database_url, **kwargs):
+    """
+    Create an AsyncEngine for a sync database URL.
+    
+    The driver is swapped for its asyncio counterpart. SQLite keeps the
+    same pool choice and connection pragmas as make_engine; other backends get a warm
+    AsyncAdaptedQueuePool so requests reuse open connections instead of
+    paying the connect/auth handshake per call.
+    
+    Args:
+        database_url (str): SQLAlchemy database URL (sync form)
+        **kwargs: Extra create_async_engine options, overriding the defaults
+        
+    Returns:
+        AsyncEngine: Configured async SQLAlchemy engine
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend in _ASYNC_DRIVERS:
+        url = url.set(drivername=_ASYNC_DRIVERS[backend])
+    
+    options = {
+        "echo": False,
+        "query_cache_size": 1200,
+        "json_serializer": json_dumps,
+        "json_deserializer": json_loads
+    }
+    if backend == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+        else:
+            options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_recycle=1800,
+            pool_pre_ping=True
+        )
+    
+    options.update(kwargs)
+    engine = create_async_engine(url, **options)
+    if backend == "sqlite":
+        # Pool events fire on the sync engine behind the AsyncEngine
+        event.listen(engine.sync_engine, "connect", _sqlite_pragmas)
+    return engine
+
 
 class DatabaseManager:
     """
@@ -43,6 +103,10 @@ class DatabaseManager:
         self.SessionLocal = None
         self._initialized = False
         
+        # Async engine for event-loop callers, created by initialize_async()
+        self.async_engine = None
+        self.AsyncSessionLocal = None
+        
         logger.info(f"DatabaseManager initialized with URL: {self.database_url}")
     
     def initialize(self) -> None:
@@ -57,31 +121,11 @@ class DatabaseManager:
             return
         
         try:
-            # Create SQLite engine with connection pooling
-            # StaticPool keeps connections alive for better performance
-            self.engine = create_engine(
-                self.database_url,
-                poolclass=StaticPool,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections every hour
-                echo=False,          # Set to True for SQL query logging
-                connect_args={
-                    "check_same_thread": False  # Allow SQLite access from multiple threads
-                }
-            )
+            # Pool class is chosen per backend to match its locking model
+            self.engine = make_engine(self.database_url)
             
-            # Configure WAL mode for better concurrency
-            @event.listens_for(self.engine, "connect")
-            def set_sqlite_pragma(dbapi_connection, connection_record):
-                """Set SQLite pragmas for optimal performance and reliability."""
-                cursor = dbapi_connection.cursor()
-                # Enable WAL mode for better concurrency
-                cursor.execute("PRAGMA journal_mode=WAL")
-                # Set synchronous mode for reliability
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                # Set timeout for busy database
-                cursor.execute("PRAGMA busy_timeout=30000")
-                cursor.close()
+            # SQLite pragmas (WAL, synchronous, mmap, ...) are applied by the
+            # engine-wide connect listener in models.py
             
             # Create session factory
             self.SessionLocal = sessionmaker(
@@ -167,6 +211,125 @@ class DatabaseManager:
                 
                 time.sleep(wait_time)
     
+    async def initialize_async(self) -> None:
+        """
+        Create the long-lived async engine and session factory.
+        
+        Tables are created through the sync engine first, so this can be
+        called on its own from an async startup hook.
+        """
+        if self.async_engine is not None:
+            return
+        
+        if not self._initialized:
+            self.initialize()
+        
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        
+        try:
+            self.async_engine = make_async_engine(self.database_url)
+            self.AsyncSessionLocal = async_sessionmaker(
+                bind=self.async_engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            logger.info("Async database engine initialized")
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize async database engine: {e}")
+            raise
+    
+    async def prewarm_async(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled async connections ahead of the first requests.
+        
+        Checks out connections concurrently, runs SELECT 1 on each and
+        returns them to the pool, so early requests don't each pay the
+        connect/auth handshake. Pools that don't keep connections
+        (SQLite's NullPool/StaticPool) are left alone.
+        
+        Args:
+            connections (int): Connections to open, defaults to the pool size
+            
+        Returns:
+            int: Number of connections warmed
+        """
+        if self.async_engine is None:
+            await self.initialize_async()
+        
+        pool = self.async_engine.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return 0
+        
+        async def _ping() -> None:
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        
+        count = connections or pool.size()
+        await asyncio.gather(*(_ping() for _ in range(count)))
+        logger.info(f"Prewarmed {count} database connections")
+        return count
+    
+    @asynccontextmanager
+    async def get_async_session(self) -> AsyncGenerator["AsyncSession", None]:
+        """
+        Async context manager for database sessions on the shared async pool.
+        
+        Commits on success and rolls back on error, like get_session.
+        
+        Yields:
+            AsyncSession: SQLAlchemy async session for database operations
+        """
+        if self.async_engine is None:
+            await self.initialize_async()
+        
+        session = self.AsyncSessionLocal()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Async database session rolled back due to error: {e}")
+            raise
+        finally:
+            await session.close()
+    
+    async def execute_async_with_retry(self, operation, *args, **kwargs):
+        """
+        Async counterpart of execute_with_retry.
+        
+        Runs the same synchronous operation functions via AsyncSession.run_sync,
+        so a manager method can share one operation between its sync and async
+        forms while the connection comes from the warm async pool.
+        
+        Args:
+            operation: Function taking a sync Session as first argument
+            *args: Arguments to pass to operation
+            **kwargs: Keyword arguments to pass to operation
+            
+        Returns:
+            Result of the operation
+            
+        Raises:
+            SQLAlchemyError: If all retry attempts fail
+        """
+        for attempt in range(self.max_retries):
+            try:
+                async with self.get_async_session() as session:
+                    return await session.run_sync(operation, *args, **kwargs)
+            except (OperationalError, SQLAlchemyError) as e:
+                wait_time = 2 ** attempt  # Exponential backoff
+                logger.warning(
+                    f"Async database operation failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
+                    f"Retrying in {wait_time} seconds..."
+                )
+                
+                if attempt == self.max_retries - 1:
+                    logger.error(f"Async database operation failed after {self.max_retries} attempts")
+                    raise
+                
+                await asyncio.sleep(wait_time)
+    
     def health_check(self) -> bool:
         """
         Perform database health check to verify connectivity.
@@ -195,15 +358,23 @@ class DatabaseManager:
             return {"status": "not_initialized"}
         
         pool = self.engine.pool
-        return {
+        info = {
             "status": "connected" if self._initialized else "disconnected",
             "database_url": self.database_url.split('://')[-1],  # Hide credentials
-            "pool_size": pool.size(),
-            "checked_in": pool.checkedin(),
-            "checked_out": pool.checkedout(),
-            "overflow": pool.overflow(),
-            "invalid": pool.invalid()
+            "pool_class": type(pool).__name__,
+            "pool_status": pool.status()
         }
+        
+        # Only queue pools track size and checkout counters
+        if isinstance(pool, QueuePool):
+            info.update({
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow()
+            })
+        
+        return info
     
     def close(self) -> None:
         """
@@ -215,6 +386,19 @@ class DatabaseManager:
             self.engine.dispose()
             logger.info("Database connections closed")
         self._initialized = False
+    
+    async def close_async(self) -> None:
+        """
+        Dispose the async pool and the sync engine.
+        
+        Async counterpart of close() for event-loop shutdown hooks.
+        """
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
+            self.async_engine = None
+            self.AsyncSessionLocal = None
+            logger.info("Async database connections closed")
+        self.close()
 
 
 # Global database manager instance
@@ -250,6 +434,22 @@ def close_database() -> None:
     db_manager.close()
 
 
+async def init_database_async() -> None:
+    """
+    Initialize the database and its async connection pool.
+    
+    Should be called from the application's async startup hook.
+    """
+    await db_manager.initialize_async()
+
+
+async def close_database_async() -> None:
+    """
+    Close sync and async database connections from an async shutdown hook.
+    """
+    await db_manager.close_async()
+
+
 async def get_database_session() -> Generator[Session, None, None]:
     """
     Async version of get_db_session for async database operations.
@@ -10,7 +10,13 @@ from datetime import datetime
 from sqlalchemy import text, inspect
 from sqlalchemy.exc import SQLAlchemyError
 from ..connection import db_manager
-from ..models import Base, Order, ActiveSession
+from ..base import Base
+from ..models import (
+    Order, ActiveSession, WebhookEventPayload,
+    PAYMENT_STATUS_VALUES, ORDER_STATUS_VALUES,
+    INTERFACE_TYPE_VALUES, WEBHOOK_PROCESSING_STATUS_VALUES, ACTIVE_ORDER_SQL,
+    ORDER_PHONE_SUMMARY_COLUMNS
+)
 from ..redis_client import redis_client
 
 # Configure logging for migration operations
@@ -128,6 +134,46 @@ class DatabaseMigrator:
                 "version": "1.0.1", 
                 "description": "Add indexes for performance optimization",
                 "function": self._migration_v1_0_1
+            },
+            {
+                "version": "1.0.2",
+                "description": "Store order totals and estimate metrics as scaled integers",
+                "function": self._migration_v1_0_2
+            },
+            {
+                "version": "1.0.3",
+                "description": "Add epoch creation time to active sessions",
+                "function": self._migration_v1_0_3
+            },
+            {
+                "version": "1.0.4",
+                "description": "Store status and interface columns as integer codes",
+                "function": self._migration_v1_0_4
+            },
+            {
+                "version": "1.0.5",
+                "description": "Move webhook event payloads to a side table",
+                "function": self._migration_v1_0_5
+            },
+            {
+                "version": "1.0.6",
+                "description": "Index active session epoch creation time for batched cleanup",
+                "function": self._migration_v1_0_6
+            },
+            {
+                "version": "1.0.7",
+                "description": "Add partial index for active dashboard orders",
+                "function": self._migration_v1_0_7
+            },
+            {
+                "version": "1.0.8",
+                "description": "Add server-side defaults to order timestamps",
+                "function": self._migration_v1_0_8
+            },
+            {
+                "version": "1.0.9",
+                "description": "Replace phone index with covering phone/recency index",
+                "function": self._migration_v1_0_9
             }
         ]
         
@@ -209,6 +255,208 @@ class DatabaseMigrator:
             logger.error(f"Failed to create indexes: {e}")
             raise
     
+    def _migration_v1_0_2(self) -> None:
+        """Convert DECIMAL money/score columns to integer cents and basis points."""
+        logger.info("Converting DECIMAL columns to scaled integers...")
+        
+        # (table, old DECIMAL column, new INTEGER column, scale)
+        conversions = [
+            ("orders", "total_amount", "total_amount_cents", 100),
+            ("delivery_estimates", "distance_miles", "distance_hundredths_miles", 100),
+            ("delivery_estimates", "confidence_score", "confidence_bp", 10000)
+        ]
+        
+        try:
+            with db_manager.get_session() as session:
+                # Inspect through the session's own connection; an engine-level
+                # inspector would check out (and roll back) the shared StaticPool
+                # connection mid-transaction
+                inspector = inspect(session.connection())
+                
+                for table, old_column, new_column, scale in conversions:
+                    columns = {col['name'] for col in inspector.get_columns(table)}
+                    
+                    # Tables created from the current models already use the new column
+                    if old_column not in columns:
+                        continue
+                    
+                    if new_column not in columns:
+                        session.execute(text(f"ALTER TABLE {table} ADD COLUMN {new_column} INTEGER"))
+                    
+                    session.execute(text(
+                        f"UPDATE {table} SET {new_column} = CAST(ROUND({old_column} * {scale}) AS INTEGER)"
+                    ))
+                    session.execute(text(f"ALTER TABLE {table} DROP COLUMN {old_column}"))
+                    logger.info(f"Converted {table}.{old_column} -> {new_column}")
+            
+            logger.info("Scaled integer conversion completed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to convert DECIMAL columns: {e}")
+            raise
+    
+    def _migration_v1_0_3(self) -> None:
+        """Add and backfill active_sessions.created_at_epoch."""
+        logger.info("Adding epoch creation time to active sessions...")
+        
+        try:
+            with db_manager.get_session() as session:
+                inspector = inspect(session.connection())
+                columns = {col['name'] for col in inspector.get_columns('active_sessions')}
+                
+                if 'created_at_epoch' not in columns:
+                    session.execute(text("ALTER TABLE active_sessions ADD COLUMN created_at_epoch INTEGER"))
+                    if session.bind.dialect.name == "postgresql":
+                        epoch_sql = "EXTRACT(EPOCH FROM created_at)::bigint"
+                    else:
+                        epoch_sql = "CAST(strftime('%s', created_at) AS INTEGER)"
+                    session.execute(text(f"UPDATE active_sessions SET created_at_epoch = {epoch_sql}"))
+            
+            logger.info("Active session epoch column added successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to add active session epoch column: {e}")
+            raise
+    
+    def _migration_v1_0_4(self) -> None:
+        """Rewrite string status/interface values as their StatusCode integers."""
+        logger.info("Converting status columns to integer codes...")
+        
+        conversions = [
+            ("orders", "payment_status", PAYMENT_STATUS_VALUES),
+            ("orders", "order_status", ORDER_STATUS_VALUES),
+            ("orders", "interface_type", INTERFACE_TYPE_VALUES),
+            ("active_sessions", "interface_type", INTERFACE_TYPE_VALUES),
+            ("payment_transactions", "status", PAYMENT_STATUS_VALUES),
+            ("webhook_events", "processing_status", WEBHOOK_PROCESSING_STATUS_VALUES)
+        ]
+        
+        try:
+            with db_manager.get_session() as session:
+                for table, column, values in conversions:
+                    # Unknown legacy values are left as-is and read back unchanged
+                    cases = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values))
+                    session.execute(text(
+                        f"UPDATE {table} SET {column} = CASE {column} {cases} ELSE {column} END"
+                    ))
+            
+            logger.info("Status code conversion completed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to convert status columns: {e}")
+            raise
+    
+    def _migration_v1_0_5(self) -> None:
+        """Move webhook_events.event_data into webhook_event_payloads."""
+        logger.info("Moving webhook event payloads to side table...")
+        
+        try:
+            with db_manager.get_session() as session:
+                WebhookEventPayload.__table__.create(session.connection(), checkfirst=True)
+                
+                inspector = inspect(session.connection())
+                columns = {col['name'] for col in inspector.get_columns('webhook_events')}
+                
+                # Tables created from the current models never had the inline column
+                if 'event_data' in columns:
+                    session.execute(text("""
+                        INSERT INTO webhook_event_payloads (event_id, event_data)
+                        SELECT id, event_data FROM webhook_events WHERE event_data IS NOT NULL
+                    """))
+                    session.execute(text("ALTER TABLE webhook_events DROP COLUMN event_data"))
+            
+            logger.info("Webhook payload migration completed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to move webhook payloads: {e}")
+            raise
+    
+    def _migration_v1_0_6(self) -> None:
+        """Index active_sessions.created_at_epoch, the column expiry cleanup filters on."""
+        logger.info("Adding active session epoch index...")
+        
+        try:
+            with db_manager.get_session() as session:
+                session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_sessions_created_at_epoch "
+                    "ON active_sessions(created_at_epoch)"
+                ))
+            
+            logger.info("Active session epoch index created successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to create active session epoch index: {e}")
+            raise
+    
+    def _migration_v1_0_7(self) -> None:
+        """Add a partial index covering exactly the rows get_active_orders reads."""
+        logger.info("Adding active orders partial index...")
+        
+        try:
+            with db_manager.get_session() as session:
+                session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_orders_active "
+                    f"ON orders(created_at) WHERE {ACTIVE_ORDER_SQL}"
+                ))
+            
+            logger.info("Active orders partial index created successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to create active orders partial index: {e}")
+            raise
+    
+    def _migration_v1_0_8(self) -> None:
+        """Give orders.created_at/updated_at server defaults so COPY can omit them."""
+        logger.info("Adding server defaults to order timestamps...")
+        
+        try:
+            with db_manager.get_session() as session:
+                # SQLite can't alter column defaults, and COPY is PostgreSQL-only
+                if session.bind.dialect.name != "postgresql":
+                    logger.info("Skipping order timestamp defaults on non-PostgreSQL database")
+                    return
+                
+                for column in ("created_at", "updated_at"):
+                    session.execute(text(
+                        f"ALTER TABLE orders ALTER COLUMN {column} SET DEFAULT CURRENT_TIMESTAMP"
+                    ))
+            
+            logger.info("Order timestamp defaults added successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to add order timestamp defaults: {e}")
+            raise
+    
+    def _migration_v1_0_9(self) -> None:
+        """Index orders by phone and recency, covering the caller-ID summary columns."""
+        logger.info("Adding covering phone/recency index...")
+        
+        try:
+            with db_manager.get_session() as session:
+                if session.bind.dialect.name == "postgresql":
+                    covered = ", ".join(ORDER_PHONE_SUMMARY_COLUMNS)
+                    index_sql = (
+                        "CREATE INDEX IF NOT EXISTS idx_orders_phone_recent "
+                        f"ON orders(phone_number, created_at DESC) INCLUDE ({covered})"
+                    )
+                else:
+                    # No INCLUDE on SQLite; trailing key columns cover the same reads
+                    covered = ", ".join(c for c in ORDER_PHONE_SUMMARY_COLUMNS if c != "id")
+                    index_sql = (
+                        "CREATE INDEX IF NOT EXISTS idx_orders_phone_recent "
+                        f"ON orders(phone_number, created_at DESC, {covered})"
+                    )
+                session.execute(text(index_sql))
+                
+                # The new index leads with phone_number, so the old one only costs writes
+                session.execute(text("DROP INDEX IF EXISTS idx_orders_phone"))
+            
+            logger.info("Covering phone/recency index created successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to create covering phone/recency index: {e}")
+            raise
+    
     def _verify_database_integrity(self) -> bool:
         """
         Verify database schema and data integrity.
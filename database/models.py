@@ -3,22 +3,219 @@ SQLAlchemy database models for the pizza ordering system.
 Contains Order and ActiveSession models as specified in the PRD.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DECIMAL, TIMESTAMP, JSON, Boolean, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Integer, SmallInteger, String, Text, TIMESTAMP, JSON, Boolean, ForeignKey,
+    CheckConstraint, insert, delete, select, event, create_engine
+)
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 from enum import Enum
+from typing import List, Optional
+import csv
+import io
 import logging
+import time
+
+import orjson
+
+from .base import Base
 
 # Configure logging for database operations
 logger = logging.getLogger(__name__)
 
-# SQLAlchemy base class for all models
-Base = declarative_base()
+
+class JSONSerializableMixin:
+    """
+    Serialize a model straight to JSON bytes with orjson.
+    
+    Emits the same fields as to_dict, but orjson encodes datetimes natively,
+    so the response layer can write the bytes without building an
+    intermediate dict of pre-formatted strings and running json.dumps over it.
+    """
+    
+    _public_cols = ()
+    
+    def to_json_bytes(self):
+        """
+        Serialize the model's public fields to JSON.
+        
+        Returns:
+            bytes: UTF-8 encoded JSON object
+        """
+        return orjson.dumps({name: getattr(self, name) for name in self._public_cols})
 
 
-class Order(Base):
+def json_dumps(value):
+    """
+    JSON column serializer for the engines: orjson instead of json.dumps.
+    
+    Naive datetimes are written as UTC, numpy values are accepted and
+    non-str dict keys (e.g. int item IDs) are stringified as json.dumps did,
+    so session and order payloads need no pre-conversion.
+    """
+    return orjson.dumps(
+        value, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+# JSON column deserializer; orjson.loads accepts the str the drivers return
+json_loads = orjson.loads
+
+
+# Unbound isoformat so to_dict avoids a per-field attribute lookup
+_iso = datetime.isoformat
+
+
+def _serialize_value(value):
+    """Convert a column value to its JSON-friendly form for to_dict field subsets."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return _iso(value)
+    return value
+
+
+def _to_scaled_int(value, scale):
+    """Convert a decimal amount (float, str or Decimal) to an integer count of 1/scale units."""
+    if value is None:
+        return None
+    return int((Decimal(str(value)) * scale).quantize(Decimal(1)))
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Set SQLite pragmas for concurrency and read performance on every new connection.
+    
+    WAL lets readers proceed alongside the single writer, and the memory-mapped
+    I/O plus larger page cache avoid read() syscalls for hot pages.
+    make_engine and make_async_engine register this "connect" listener on
+    SQLite engines only; aiosqlite's adapted connection exposes the same
+    cursor API as sqlite3, so async engines get the same settings.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB (negative = KiB)
+    cursor.close()
+
+
+# Enums for payment and order status
+class PaymentStatus(Enum):
+    """Payment status enumeration."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELED = "canceled"
+    REQUIRES_ACTION = "requires_action"
+    REFUNDED = "refunded"
+    PARTIALLY_REFUNDED = "partially_refunded"
+
+
+class OrderStatus(Enum):
+    """Order status enumeration."""
+    PENDING = "pending"
+    PAYMENT_PROCESSING = "payment_processing"
+    PAYMENT_CONFIRMED = "payment_confirmed"
+    PAYMENT_FAILED = "payment_failed"
+    PREPARING = "preparing"
+    READY = "ready"
+    OUT_FOR_DELIVERY = "out_for_delivery"
+    DELIVERED = "delivered"
+    CANCELED = "canceled"
+    REFUNDED = "refunded"
+
+
+
+# Stored vocabularies for StatusCode columns. A value's position is its
+# on-disk code, so new values must only ever be appended.
+PAYMENT_STATUS_VALUES = tuple(status.value for status in PaymentStatus) + (
+    "completed",  # Legacy order payment status written by OrderManager
+)
+ORDER_STATUS_VALUES = tuple(status.value for status in OrderStatus) + (
+    "confirmed",  # Status assigned by the agent when a ticket is generated
+)
+INTERFACE_TYPE_VALUES = ("phone", "web", "unknown")
+
+# Orders shown on the kitchen dashboard. The SQL form is shared by the
+# get_active_orders query and the partial index over it: SQLite only uses a
+# partial index when the query repeats the index's WHERE terms, and the
+# status columns hold integer codes.
+ACTIVE_ORDER_STATUSES = ("pending", "preparing", "ready")
+ACTIVE_ORDER_SQL = (
+    f"payment_status = {PAYMENT_STATUS_VALUES.index('completed')} AND order_status IN ("
+    + ", ".join(str(ORDER_STATUS_VALUES.index(status)) for status in ACTIVE_ORDER_STATUSES)
+    + ")"
+)
+
+# Columns carried by the phone/recency index after its (phone_number,
+# created_at) key, so recent-order summaries can be answered from the index.
+# id needs no entry on SQLite, where it is the rowid every index carries.
+ORDER_PHONE_SUMMARY_COLUMNS = ("id", "order_status", "total_amount_cents", "estimated_delivery")
+WEBHOOK_PROCESSING_STATUS_VALUES = ("received", "processing", "completed", "failed")
+
+
+class StatusCode(TypeDecorator):
+    """
+    Store a fixed vocabulary of status strings as small integers.
+    
+    Application code keeps reading and writing the string values (Enum
+    members are accepted too); only the stored representation changes, so
+    rows stay narrow and filters compare integers instead of strings.
+    Rows written before the conversion are returned unchanged.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, values):
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {value: code for code, value in enumerate(self.values)}
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, Enum):
+            value = value.value
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"Unknown status value {value!r}; expected one of {self.values}")
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str) and not value.isdigit():
+            return value
+        return self.values[int(value)]
+
+
+def _status_check(column_name, values):
+    """CHECK constraint limiting a StatusCode column to its known codes."""
+    return CheckConstraint(f"{column_name} BETWEEN 0 AND {len(values) - 1}")
+
+
+def _order_row(data):
+    """Column dict for an Order insert, converting a total_amount key to cents."""
+    row = dict(data)
+    if 'total_amount' in row:
+        row['total_amount_cents'] = _to_scaled_int(row.pop('total_amount'), 100)
+    return row
+
+
+class Order(JSONSerializableMixin, Base):
     """
     Order model representing a complete pizza order.
     
@@ -28,71 +225,190 @@ class Order(Base):
     __tablename__ = 'orders'
     
     # Primary key - auto-incrementing integer
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Customer information
-    customer_name = Column(String(255), nullable=False, comment="Full customer name")
-    phone_number = Column(String(20), nullable=False, comment="Customer phone number")
-    address = Column(Text, nullable=False, comment="Full delivery address")
+    customer_name: Mapped[str] = mapped_column(String(255), nullable=False, comment="Full customer name")
+    phone_number: Mapped[str] = mapped_column(String(20), nullable=False, comment="Customer phone number")
+    address: Mapped[str] = mapped_column(Text, nullable=False, comment="Full delivery address")
     
     # Order details stored as JSON to handle complex pizza configurations
-    order_details = Column(JSON, nullable=False, comment="JSON containing pizzas, toppings, quantities")
+    order_details: Mapped[dict] = mapped_column(JSON, nullable=False, comment="JSON containing pizzas, toppings, quantities")
     
-    # Financial information
-    total_amount = Column(DECIMAL(10, 2), nullable=False, comment="Total order amount in USD")
+    # Financial information - stored as integer cents like PaymentTransaction
+    total_amount_cents: Mapped[int] = mapped_column(Integer, nullable=False, comment="Total order amount in cents")
     
     # Delivery and timing
-    estimated_delivery = Column(Integer, nullable=False, comment="Estimated delivery time in minutes")
+    estimated_delivery: Mapped[int] = mapped_column(Integer, nullable=False, comment="Estimated delivery time in minutes")
     
     # Payment tracking
-    payment_method = Column(String(50), nullable=False, comment="Payment method: card, cash, etc.")
-    payment_status = Column(String(20), nullable=False, comment="Payment status: pending, completed, failed")
+    payment_method: Mapped[str] = mapped_column(String(50), nullable=False, comment="Payment method: card, cash, etc.")
+    payment_status: Mapped[str] = mapped_column(StatusCode(PAYMENT_STATUS_VALUES),
+                                                _status_check('payment_status', PAYMENT_STATUS_VALUES),
+                                                nullable=False, comment="Payment status code: pending, completed, failed")
     
     # Order lifecycle management
-    order_status = Column(String(20), nullable=False, comment="Order status: pending, preparing, ready, delivered")
+    order_status: Mapped[str] = mapped_column(StatusCode(ORDER_STATUS_VALUES),
+                                              _status_check('order_status', ORDER_STATUS_VALUES),
+                                              nullable=False, comment="Order status code: pending, preparing, ready, delivered")
     
     # Interface tracking - distinguishes phone vs web orders
-    interface_type = Column(String(10), nullable=False, comment="Order source: phone or web")
+    interface_type: Mapped[str] = mapped_column(StatusCode(INTERFACE_TYPE_VALUES),
+                                                _status_check('interface_type', INTERFACE_TYPE_VALUES),
+                                                nullable=False, comment="Order source code: phone or web")
+    
+    # Timestamp management with automatic updates; the server defaults stamp
+    # rows written outside the ORM (COPY) from the database clock
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 server_default=func.current_timestamp(),
+                                                 comment="Order creation timestamp")
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 server_default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp(), comment="Last update timestamp")
+    
+    # Relationships - selectin loading fetches children for a whole page of
+    # orders in one IN (...) query instead of one SELECT per order
+    payment_transactions: Mapped[List["PaymentTransaction"]] = relationship(back_populates="order", lazy="selectin")
+    delivery_estimates: Mapped[List["DeliveryEstimateRecord"]] = relationship(back_populates="order", lazy="selectin")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'customer_name', 'phone_number', 'address', 'order_details', 'total_amount',
+        'estimated_delivery', 'payment_method', 'payment_status', 'order_status',
+        'interface_type', 'created_at', 'updated_at'
+    )
+    
+    @hybrid_property
+    def total_amount(self):
+        """Total order amount in USD."""
+        return self.total_amount_cents / 100 if self.total_amount_cents is not None else None
+    
+    @total_amount.setter
+    def total_amount(self, value):
+        self.total_amount_cents = _to_scaled_int(value, 100)
+    
+    @total_amount.expression
+    def total_amount(cls):
+        return cls.total_amount_cents / 100.0
+    
+    @classmethod
+    def insert_one(cls, session, data):
+        """
+        Insert one order with INSERT ... RETURNING and return it loaded.
+        
+        The row comes back from the INSERT itself, so there is no separate
+        flush of a pending instance and no follow-up SELECT for
+        database-generated values like created_at.
+        
+        Args:
+            session: SQLAlchemy session instance
+            data (dict): Order column values, as for insert_many
+            
+        Returns:
+            Order: The inserted order
+        """
+        stmt = insert(cls).returning(cls)
+        return session.scalars(stmt, [_order_row(data)]).one()
     
-    # Timestamp management with automatic updates
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Order creation timestamp")
-    updated_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       onupdate=func.current_timestamp(), comment="Last update timestamp")
+    @classmethod
+    def insert_many(cls, session, orders):
+        """
+        Insert many orders in one statement and return their new IDs.
+        
+        Runs an ORM bulk INSERT ... RETURNING so the driver sends the rows as
+        multi-row VALUES pages (insertmanyvalues) instead of flushing one
+        INSERT per Order instance. A total_amount key is converted to
+        total_amount_cents; every other key must name a column.
+        
+        Args:
+            session: SQLAlchemy session instance
+            orders (list): Order column dicts, one per order
+        
+        Returns:
+            list: New order IDs in the same order as the input rows
+        """
+        if not orders:
+            return []
+        
+        stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        return list(session.scalars(stmt, [_order_row(data) for data in orders]))
     
-    # Relationships
-    payment_transactions = relationship("PaymentTransaction", back_populates="order")
-    delivery_estimates = relationship("DeliveryEstimateRecord", back_populates="order")
+    @classmethod
+    def copy_many(cls, session, orders):
+        """
+        Load many orders with PostgreSQL COPY.
+        
+        Takes the same dicts as insert_many but streams them through
+        copy_rows, which is faster than multi-row INSERT for large batches.
+        COPY reports no generated keys, so only the row count is returned.
+        
+        Args:
+            session: SQLAlchemy session bound to a PostgreSQL engine
+            orders (list): Order column dicts, one per order
+            
+        Returns:
+            int: Number of rows copied
+        """
+        # Timestamps are left out of the COPY column list, so the server
+        # defaults stamp every row
+        return copy_rows(session, cls, [_order_row(data) for data in orders])
     
     def __repr__(self):
-        """String representation for debugging and logging."""
+        """
+        String representation for debugging and logging.
+        
+        Pass the instance as a %r logging argument rather than formatting it
+        into the message, so this only runs when the record is emitted.
+        """
         return f"<Order(id={self.id}, customer='{self.customer_name}', status='{self.order_status}', total=${self.total_amount})>"
     
-    def to_dict(self):
+    # Field subsets for callers that only need part of the row. Pair with
+    # load_only() on the query so unused columns (notably the order_details
+    # JSON) are never selected or deserialized. total_amount is derived from
+    # the total_amount_cents column.
+    MINIMAL_FIELDS = ('id', 'order_status', 'total_amount')
+    FINANCIAL_FIELDS = ('id', 'total_amount', 'payment_method', 'payment_status', 'order_status')
+    
+    def to_dict(self, fields=None):
         """
         Convert order to dictionary for API responses and logging.
         
+        Args:
+            fields (iterable): Optional subset of field names to emit; only
+                these attributes are read, so unloaded columns stay unloaded
+        
         Returns:
             dict: Order data with all fields except sensitive payment info
         """
+        if fields is not None:
+            return {name: _serialize_value(getattr(self, name)) for name in fields}
+        
         return {
             'id': self.id,
             'customer_name': self.customer_name,
             'phone_number': self.phone_number,
             'address': self.address,
             'order_details': self.order_details,
-            'total_amount': float(self.total_amount),
+            'total_amount': self.total_amount_cents / 100,
             'estimated_delivery': self.estimated_delivery,
             'payment_method': self.payment_method,
             'payment_status': self.payment_status,
             'order_status': self.order_status,
             'interface_type': self.interface_type,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None,
+            'updated_at': _iso(self.updated_at) if self.updated_at is not None else None
         }
+    
+    def to_dict_minimal(self):
+        """Convert order to its id/status/total summary for monitoring views."""
+        return self.to_dict(fields=self.MINIMAL_FIELDS)
+    
+    def to_dict_financial(self):
+        """Convert order to its payment-related fields for financial reporting."""
+        return self.to_dict(fields=self.FINANCIAL_FIELDS)
 
 
-class ActiveSession(Base):
+class ActiveSession(JSONSerializableMixin, Base):
     """
     ActiveSession model for tracking live customer interactions.
     
@@ -102,23 +418,33 @@ class ActiveSession(Base):
     __tablename__ = 'active_sessions'
     
     # Primary key - unique session identifier
-    session_id = Column(String(255), primary_key=True, comment="Unique session identifier")
+    session_id: Mapped[str] = mapped_column(String(255), primary_key=True, comment="Unique session identifier")
     
     # Customer identification for session continuity
-    customer_phone = Column(String(20), nullable=True, comment="Customer phone number if available")
+    customer_phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="Customer phone number if available")
     
     # Interface tracking - phone vs web sessions
-    interface_type = Column(String(10), nullable=False, comment="Session interface: phone or web")
+    interface_type: Mapped[str] = mapped_column(StatusCode(INTERFACE_TYPE_VALUES),
+                                                _status_check('interface_type', INTERFACE_TYPE_VALUES),
+                                                nullable=False, comment="Session interface code: phone or web")
     
     # LangGraph agent state management
-    agent_state = Column(String(50), nullable=False, comment="Current agent conversation state")
+    agent_state: Mapped[str] = mapped_column(String(50), nullable=False, comment="Current agent conversation state")
     
     # Temporary order data during conversation flow
-    order_data = Column(JSON, nullable=True, comment="JSON containing partial order data during conversation")
+    order_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="JSON containing partial order data during conversation")
     
     # Session lifecycle tracking
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Session creation timestamp")
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 comment="Session creation timestamp")
+    created_at_epoch: Mapped[int] = mapped_column(Integer, nullable=False, default=lambda: int(time.time()),
+                                                  comment="Session creation time in unix seconds for cheap expiry checks")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'session_id', 'customer_phone', 'interface_type', 'agent_state', 'order_data',
+        'created_at'
+    )
     
     def __repr__(self):
         """String representation for debugging and logging."""
@@ -137,7 +463,7 @@ class ActiveSession(Base):
             'interface_type': self.interface_type,
             'agent_state': self.agent_state,
             'order_data': self.order_data,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None
         }
     
     def is_expired(self, timeout_minutes=30):
@@ -150,42 +476,13 @@ class ActiveSession(Base):
         Returns:
             bool: True if session is expired
         """
-        if not self.created_at:
+        if self.created_at_epoch is None:
             return True
         
-        from datetime import datetime, timedelta
-        timeout = datetime.utcnow() - timedelta(minutes=timeout_minutes)
-        return self.created_at < timeout
-
-
-# Enums for payment and order status
-class PaymentStatus(Enum):
-    """Payment status enumeration."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    SUCCEEDED = "succeeded"
-    FAILED = "failed"
-    CANCELED = "canceled"
-    REQUIRES_ACTION = "requires_action"
-    REFUNDED = "refunded"
-    PARTIALLY_REFUNDED = "partially_refunded"
+        return (time.time() - self.created_at_epoch) > timeout_minutes * 60
 
 
-class OrderStatus(Enum):
-    """Order status enumeration."""
-    PENDING = "pending"
-    PAYMENT_PROCESSING = "payment_processing"
-    PAYMENT_CONFIRMED = "payment_confirmed"
-    PAYMENT_FAILED = "payment_failed"
-    PREPARING = "preparing"
-    READY = "ready"
-    OUT_FOR_DELIVERY = "out_for_delivery"
-    DELIVERED = "delivered"
-    CANCELED = "canceled"
-    REFUNDED = "refunded"
-
-
-class PaymentTransaction(Base):
+class PaymentTransaction(JSONSerializableMixin, Base):
     """
     Payment transaction model for tracking Stripe payments.
     
@@ -195,42 +492,55 @@ class PaymentTransaction(Base):
     __tablename__ = 'payment_transactions'
     
     # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Stripe identifiers
-    payment_intent_id = Column(String(255), unique=True, nullable=False, 
-                              comment="Stripe PaymentIntent ID")
-    stripe_customer_id = Column(String(255), nullable=True,
-                               comment="Stripe Customer ID if available")
+    payment_intent_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, 
+                                                   comment="Stripe PaymentIntent ID")
+    stripe_customer_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True,
+                                                              comment="Stripe Customer ID if available")
     
     # Order relationship
-    order_id = Column(Integer, ForeignKey('orders.id'), nullable=True,
-                     comment="Related order ID")
-    order = relationship("Order", back_populates="payment_transactions")
+    order_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('orders.id'), nullable=True,
+                                                    comment="Related order ID")
+    order: Mapped[Optional["Order"]] = relationship("Order", back_populates="payment_transactions")
     
     # Payment details
-    amount_cents = Column(Integer, nullable=False, comment="Payment amount in cents")
-    currency = Column(String(3), nullable=False, default="usd", comment="Payment currency")
-    payment_method_type = Column(String(50), nullable=True, comment="Payment method type (card, etc.)")
+    amount_cents: Mapped[int] = mapped_column(Integer, nullable=False, comment="Payment amount in cents")
+    currency: Mapped[str] = mapped_column(String(3), nullable=False, default="usd", comment="Payment currency")
+    payment_method_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment="Payment method type (card, etc.)")
     
     # Status tracking
-    status = Column(String(50), nullable=False, default=PaymentStatus.PENDING.value,
-                   comment="Current payment status")
+    status: Mapped[str] = mapped_column(StatusCode(PAYMENT_STATUS_VALUES),
+                                        _status_check('status', PAYMENT_STATUS_VALUES),
+                                        nullable=False, default=PaymentStatus.PENDING.value, comment="Current payment status code")
     
     # Stripe metadata and details
-    stripe_metadata = Column(JSON, nullable=True, comment="Stripe metadata and additional data")
+    stripe_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="Stripe metadata and additional data")
     
     # Failure tracking
-    failure_code = Column(String(100), nullable=True, comment="Failure code if payment failed")
-    failure_message = Column(Text, nullable=True, comment="Failure message if payment failed")
+    failure_code: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="Failure code if payment failed")
+    failure_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="Failure message if payment failed")
     
     # Timeline tracking
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Transaction creation timestamp")
-    updated_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       onupdate=func.current_timestamp(), comment="Last update timestamp")
-    confirmed_at = Column(TIMESTAMP, nullable=True, comment="Payment confirmation timestamp")
-    failed_at = Column(TIMESTAMP, nullable=True, comment="Payment failure timestamp")
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 comment="Transaction creation timestamp")
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp(), comment="Last update timestamp")
+    confirmed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True, comment="Payment confirmation timestamp")
+    failed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True, comment="Payment failure timestamp")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'payment_intent_id', 'stripe_customer_id', 'order_id', 'amount', 'currency',
+        'payment_method_type', 'status', 'failure_code', 'failure_message', 'created_at',
+        'updated_at', 'confirmed_at', 'failed_at'
+    )
+    
+    @property
+    def amount(self):
+        """Amount in dollars."""
+        return self.amount_cents / 100
     
     def __repr__(self):
         """String representation for debugging."""
@@ -249,14 +559,14 @@ class PaymentTransaction(Base):
             'status': self.status,
             'failure_code': self.failure_code,
             'failure_message': self.failure_message,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'confirmed_at': self.confirmed_at.isoformat() if self.confirmed_at else None,
-            'failed_at': self.failed_at.isoformat() if self.failed_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None,
+            'updated_at': _iso(self.updated_at) if self.updated_at is not None else None,
+            'confirmed_at': _iso(self.confirmed_at) if self.confirmed_at is not None else None,
+            'failed_at': _iso(self.failed_at) if self.failed_at is not None else None
         }
 
 
-class PaymentMethodRecord(Base):
+class PaymentMethodRecord(JSONSerializableMixin, Base):
     """
     Payment method record for storing non-sensitive payment method information.
     
@@ -266,37 +576,44 @@ class PaymentMethodRecord(Base):
     __tablename__ = 'payment_methods'
     
     # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Stripe identifiers
-    payment_method_id = Column(String(255), unique=True, nullable=False,
-                              comment="Stripe PaymentMethod ID")
-    stripe_customer_id = Column(String(255), nullable=True,
-                               comment="Associated Stripe Customer ID")
+    payment_method_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False,
+                                                   comment="Stripe PaymentMethod ID")
+    stripe_customer_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True,
+                                                              comment="Associated Stripe Customer ID")
     
     # Payment method details (non-sensitive)
-    method_type = Column(String(50), nullable=False, comment="Payment method type")
+    method_type: Mapped[str] = mapped_column(String(50), nullable=False, comment="Payment method type")
     
     # Card details (safe information only)
-    card_brand = Column(String(20), nullable=True, comment="Card brand (visa, mastercard, etc.)")
-    card_last4 = Column(String(4), nullable=True, comment="Last 4 digits of card")
-    card_exp_month = Column(Integer, nullable=True, comment="Card expiration month")
-    card_exp_year = Column(Integer, nullable=True, comment="Card expiration year")
-    card_funding = Column(String(20), nullable=True, comment="Card funding type (credit, debit, etc.)")
-    card_country = Column(String(2), nullable=True, comment="Card country code")
+    card_brand: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="Card brand (visa, mastercard, etc.)")
+    card_last4: Mapped[Optional[str]] = mapped_column(String(4), nullable=True, comment="Last 4 digits of card")
+    card_exp_month: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="Card expiration month")
+    card_exp_year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="Card expiration year")
+    card_funding: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="Card funding type (credit, debit, etc.)")
+    card_country: Mapped[Optional[str]] = mapped_column(String(2), nullable=True, comment="Card country code")
     
     # Customer information
-    billing_name = Column(String(255), nullable=True, comment="Billing name")
-    billing_email = Column(String(255), nullable=True, comment="Billing email")
+    billing_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="Billing name")
+    billing_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="Billing email")
     
     # Status tracking
-    is_active = Column(Boolean, default=True, nullable=False, comment="Whether payment method is active")
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, comment="Whether payment method is active")
     
     # Timestamp management
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Payment method creation timestamp")
-    updated_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       onupdate=func.current_timestamp(), comment="Last update timestamp")
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 comment="Payment method creation timestamp")
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp(), comment="Last update timestamp")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'payment_method_id', 'stripe_customer_id', 'method_type', 'card_brand',
+        'card_last4', 'card_exp_month', 'card_exp_year', 'card_funding', 'billing_name',
+        'billing_email', 'is_active', 'created_at', 'updated_at'
+    )
     
     def __repr__(self):
         """String representation for debugging."""
@@ -317,12 +634,12 @@ class PaymentMethodRecord(Base):
             'billing_name': self.billing_name,
             'billing_email': self.billing_email,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None,
+            'updated_at': _iso(self.updated_at) if self.updated_at is not None else None
         }
 
 
-class WebhookEvent(Base):
+class WebhookEvent(JSONSerializableMixin, Base):
     """
     Webhook event tracking for Stripe webhook processing.
     
@@ -332,30 +649,105 @@ class WebhookEvent(Base):
     __tablename__ = 'webhook_events'
     
     # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Stripe event details
-    stripe_event_id = Column(String(255), unique=True, nullable=False,
-                            comment="Stripe event ID")
-    event_type = Column(String(100), nullable=False, comment="Stripe event type")
+    stripe_event_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False,
+                                                 comment="Stripe event ID")
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False, comment="Stripe event type")
     
     # Processing status
-    processing_status = Column(String(20), nullable=False, default="received",
-                              comment="Event processing status: received, processing, completed, failed")
+    processing_status: Mapped[str] = mapped_column(StatusCode(WEBHOOK_PROCESSING_STATUS_VALUES),
+                                                   _status_check('processing_status', WEBHOOK_PROCESSING_STATUS_VALUES),
+                                                   nullable=False, default="received",
+                                                   comment="Event processing status code: received, processing, completed, failed")
     
-    # Event data and metadata
-    event_data = Column(JSON, nullable=True, comment="Full Stripe event data")
-    processing_attempts = Column(Integer, nullable=False, default=0,
-                                comment="Number of processing attempts")
+    # Processing metadata
+    processing_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0,
+                                                     comment="Number of processing attempts")
     
     # Error tracking
-    last_error = Column(Text, nullable=True, comment="Last processing error if any")
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="Last processing error if any")
     
     # Timestamp management
-    stripe_created_at = Column(TIMESTAMP, nullable=True, comment="Stripe event creation timestamp")
-    received_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                        comment="Webhook received timestamp")
-    processed_at = Column(TIMESTAMP, nullable=True, comment="Event processing completion timestamp")
+    stripe_created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True, comment="Stripe event creation timestamp")
+    received_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                  comment="Webhook received timestamp")
+    processed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True, comment="Event processing completion timestamp")
+    
+    # Full Stripe payload lives in a 1:1 side table so status scans stay row-narrow;
+    # load it explicitly with .options(joinedload(WebhookEvent.payload))
+    payload: Mapped[Optional["WebhookEventPayload"]] = relationship(
+        "WebhookEventPayload", uselist=False, lazy="noload", cascade="all, delete-orphan"
+    )
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'stripe_event_id', 'event_type', 'processing_status', 'processing_attempts',
+        'last_error', 'stripe_created_at', 'received_at', 'processed_at'
+    )
+    
+    @classmethod
+    def insert_or_ignore(cls, session, **values):
+        """
+        Record a webhook event unless one with the same stripe_event_id exists.
+        
+        Relies on the unique constraint with ON CONFLICT DO NOTHING so
+        deduplication and insert happen in a single statement, without a
+        preceding SELECT.
+        
+        Args:
+            session: SQLAlchemy session instance
+            **values: Column values for the new event row; an event_data
+                value is written to the payload side table
+            
+        Returns:
+            int: ID of the inserted row, or None if the event was a duplicate
+        """
+        dialect = postgresql if session.get_bind().dialect.name == 'postgresql' else sqlite
+        event_data = values.pop('event_data', None)
+        
+        stmt = (
+            dialect.insert(cls)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=['stripe_event_id'])
+            .returning(cls.id)
+        )
+        event_id = session.execute(stmt).scalar()
+        
+        if event_id is not None and event_data is not None:
+            session.execute(insert(WebhookEventPayload).values(event_id=event_id, event_data=event_data))
+        return event_id
+    
+    def _load_payload(self):
+        """
+        Return the payload row, loading it by primary key if it wasn't eager-loaded.
+        
+        The relationship is noload, so an unloaded payload reads as None;
+        a persistent event looks its payload up explicitly instead.
+        """
+        if self.payload is None and self.id is not None:
+            session = object_session(self)
+            if session is not None:
+                payload = session.get(WebhookEventPayload, self.id)
+                if payload is not None:
+                    set_committed_value(self, 'payload', payload)
+        return self.payload
+    
+    @property
+    def event_data(self):
+        """Full Stripe event data, loaded from the side table on first access."""
+        payload = self._load_payload()
+        return payload.event_data if payload is not None else None
+    
+    @event_data.setter
+    def event_data(self, value):
+        """Store the Stripe event data in the side table, updating an existing row."""
+        payload = self._load_payload()
+        if payload is None:
+            self.payload = WebhookEventPayload(event_data=value)
+        else:
+            payload.event_data = value
     
     def __repr__(self):
         """String representation for debugging."""
@@ -370,13 +762,33 @@ class WebhookEvent(Base):
             'processing_status': self.processing_status,
             'processing_attempts': self.processing_attempts,
             'last_error': self.last_error,
-            'stripe_created_at': self.stripe_created_at.isoformat() if self.stripe_created_at else None,
-            'received_at': self.received_at.isoformat() if self.received_at else None,
-            'processed_at': self.processed_at.isoformat() if self.processed_at else None
+            'stripe_created_at': _iso(self.stripe_created_at) if self.stripe_created_at is not None else None,
+            'received_at': _iso(self.received_at) if self.received_at is not None else None,
+            'processed_at': _iso(self.processed_at) if self.processed_at is not None else None
         }
 
 
-class RefundRecord(Base):
+class WebhookEventPayload(Base):
+    """
+    Raw Stripe event body for a webhook event.
+    
+    Kept out of webhook_events so the frequently scanned status and
+    timestamp columns pack many rows per page; the payload is only read
+    when an event is audited or replayed.
+    """
+    __tablename__ = 'webhook_event_payloads'
+    
+    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('webhook_events.id', ondelete='CASCADE'),
+                                          primary_key=True, comment="Owning webhook event")
+    event_data: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(postgresql.JSONB(), 'postgresql'),
+                                                       nullable=True, comment="Full Stripe event data")
+    
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"<WebhookEventPayload(event_id={self.event_id})>"
+
+
+class RefundRecord(JSONSerializableMixin, Base):
     """
     Refund record for tracking payment refunds.
     
@@ -386,34 +798,45 @@ class RefundRecord(Base):
     __tablename__ = 'refunds'
     
     # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Stripe identifiers
-    stripe_refund_id = Column(String(255), unique=True, nullable=False,
-                             comment="Stripe Refund ID")
+    stripe_refund_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False,
+                                                  comment="Stripe Refund ID")
     
     # Payment relationship
-    payment_transaction_id = Column(Integer, ForeignKey('payment_transactions.id'), nullable=False,
-                                   comment="Related payment transaction ID")
-    payment_transaction = relationship("PaymentTransaction")
+    payment_transaction_id: Mapped[int] = mapped_column(Integer, ForeignKey('payment_transactions.id'), nullable=False,
+                                                        comment="Related payment transaction ID")
+    payment_transaction: Mapped["PaymentTransaction"] = relationship("PaymentTransaction", lazy="selectin")
     
     # Refund details
-    amount_cents = Column(Integer, nullable=False, comment="Refund amount in cents")
-    currency = Column(String(3), nullable=False, default="usd", comment="Refund currency")
-    reason = Column(String(100), nullable=True, comment="Refund reason")
+    amount_cents: Mapped[int] = mapped_column(Integer, nullable=False, comment="Refund amount in cents")
+    currency: Mapped[str] = mapped_column(String(3), nullable=False, default="usd", comment="Refund currency")
+    reason: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="Refund reason")
     
     # Status tracking
-    status = Column(String(20), nullable=False, comment="Refund status")
+    status: Mapped[str] = mapped_column(String(20), nullable=False, comment="Refund status")
     
     # Additional information
-    receipt_number = Column(String(100), nullable=True, comment="Refund receipt number")
-    stripe_metadata = Column(JSON, nullable=True, comment="Stripe refund metadata")
+    receipt_number: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="Refund receipt number")
+    stripe_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="Stripe refund metadata")
     
     # Timestamp management
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Refund creation timestamp")
-    updated_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       onupdate=func.current_timestamp(), comment="Last update timestamp")
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 comment="Refund creation timestamp")
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp(), comment="Last update timestamp")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'stripe_refund_id', 'payment_transaction_id', 'amount', 'currency', 'reason',
+        'status', 'receipt_number', 'created_at', 'updated_at'
+    )
+    
+    @property
+    def amount(self):
+        """Amount in dollars."""
+        return self.amount_cents / 100
     
     def __repr__(self):
         """String representation for debugging."""
@@ -430,12 +853,12 @@ class RefundRecord(Base):
             'reason': self.reason,
             'status': self.status,
             'receipt_number': self.receipt_number,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None,
+            'updated_at': _iso(self.updated_at) if self.updated_at is not None else None
         }
 
 
-class DeliveryEstimateRecord(Base):
+class DeliveryEstimateRecord(JSONSerializableMixin, Base):
     """
     Delivery estimate record for tracking delivery time predictions.
     
@@ -445,37 +868,72 @@ class DeliveryEstimateRecord(Base):
     __tablename__ = 'delivery_estimates'
     
     # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
     # Order relationship
-    order_id = Column(Integer, ForeignKey('orders.id'), nullable=False,
-                     comment="Related order ID")
-    order = relationship("Order", back_populates="delivery_estimates")
+    order_id: Mapped[int] = mapped_column(Integer, ForeignKey('orders.id'), nullable=False,
+                                          comment="Related order ID")
+    order: Mapped["Order"] = relationship("Order", back_populates="delivery_estimates")
     
     # Estimation details
-    estimated_minutes = Column(Integer, nullable=False, comment="Total estimated delivery time in minutes")
-    distance_miles = Column(DECIMAL(5, 2), nullable=False, comment="Distance to delivery address in miles")
-    base_time_minutes = Column(Integer, nullable=False, comment="Base preparation time in minutes")
-    distance_time_minutes = Column(Integer, nullable=False, comment="Distance-based delivery time in minutes")
-    load_time_minutes = Column(Integer, nullable=False, comment="Load-based additional time in minutes")
-    random_variation_minutes = Column(Integer, nullable=False, comment="Random variation applied in minutes")
+    estimated_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Total estimated delivery time in minutes")
+    distance_hundredths_miles: Mapped[int] = mapped_column(Integer, nullable=False,
+                                                           comment="Distance to delivery address in hundredths of a mile")
+    base_time_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Base preparation time in minutes")
+    distance_time_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Distance-based delivery time in minutes")
+    load_time_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Load-based additional time in minutes")
+    random_variation_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Random variation applied in minutes")
     
     # Confidence and zone information
-    confidence_score = Column(DECIMAL(3, 2), nullable=False, comment="Estimation confidence score (0.0-1.0)")
-    delivery_zone = Column(String(20), nullable=False, comment="Delivery zone (inner, middle, outer)")
+    confidence_bp: Mapped[int] = mapped_column(Integer, nullable=False, comment="Estimation confidence in basis points (0-10000)")
+    delivery_zone: Mapped[str] = mapped_column(String(20), nullable=False, comment="Delivery zone (inner, middle, outer)")
     
     # Additional factors for analysis
-    factors_data = Column(JSON, nullable=True, comment="Additional estimation factors and metadata")
+    factors_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="Additional estimation factors and metadata")
     
     # Status tracking
-    is_active = Column(Boolean, default=True, nullable=False, comment="Whether this is the current active estimate")
-    actual_delivery_time = Column(Integer, nullable=True, comment="Actual delivery time for accuracy tracking")
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, comment="Whether this is the current active estimate")
+    actual_delivery_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="Actual delivery time for accuracy tracking")
     
     # Timestamp management
-    created_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       comment="Estimate creation timestamp")
-    updated_at = Column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
-                       onupdate=func.current_timestamp(), comment="Last update timestamp")
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 comment="Estimate creation timestamp")
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False, default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp(), comment="Last update timestamp")
+    
+    # Fields emitted by to_dict and to_json_bytes
+    _public_cols = (
+        'id', 'order_id', 'estimated_minutes', 'distance_miles', 'base_time_minutes',
+        'distance_time_minutes', 'load_time_minutes', 'random_variation_minutes',
+        'confidence_score', 'delivery_zone', 'factors_data', 'is_active',
+        'actual_delivery_time', 'created_at', 'updated_at'
+    )
+    
+    @hybrid_property
+    def distance_miles(self):
+        """Distance to delivery address in miles."""
+        return self.distance_hundredths_miles / 100 if self.distance_hundredths_miles is not None else None
+    
+    @distance_miles.setter
+    def distance_miles(self, value):
+        self.distance_hundredths_miles = _to_scaled_int(value, 100)
+    
+    @distance_miles.expression
+    def distance_miles(cls):
+        return cls.distance_hundredths_miles / 100.0
+    
+    @hybrid_property
+    def confidence_score(self):
+        """Estimation confidence score (0.0-1.0)."""
+        return self.confidence_bp / 10000 if self.confidence_bp is not None else None
+    
+    @confidence_score.setter
+    def confidence_score(self, value):
+        self.confidence_bp = _to_scaled_int(value, 10000)
+    
+    @confidence_score.expression
+    def confidence_score(cls):
+        return cls.confidence_bp / 10000.0
     
     def __repr__(self):
         """String representation for debugging."""
@@ -487,21 +945,70 @@ class DeliveryEstimateRecord(Base):
             'id': self.id,
             'order_id': self.order_id,
             'estimated_minutes': self.estimated_minutes,
-            'distance_miles': float(self.distance_miles),
+            'distance_miles': self.distance_hundredths_miles / 100,
             'base_time_minutes': self.base_time_minutes,
             'distance_time_minutes': self.distance_time_minutes,
             'load_time_minutes': self.load_time_minutes,
             'random_variation_minutes': self.random_variation_minutes,
-            'confidence_score': float(self.confidence_score),
+            'confidence_score': self.confidence_bp / 10000,
             'delivery_zone': self.delivery_zone,
             'factors_data': self.factors_data,
             'is_active': self.is_active,
             'actual_delivery_time': self.actual_delivery_time,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(self.created_at) if self.created_at is not None else None,
+            'updated_at': _iso(self.updated_at) if self.updated_at is not None else None
         }
 
 
+def make_engine(database_url, **kwargs):
+    """
+    Create an engine with a connection pool suited to the database backend.
+    
+    SQLite allows a single writer, so file databases use NullPool: each
+    session opens its own connection and releases it (and its locks) as soon
+    as it closes, instead of queueing writers behind pooled long-lived
+    connections. In-memory SQLite needs StaticPool so every session sees the
+    same database. Other backends keep the default QueuePool.
+    
+    Args:
+        database_url (str): SQLAlchemy database URL
+        **kwargs: Extra create_engine options, overriding the defaults
+        
+    Returns:
+        Engine: Configured SQLAlchemy engine
+    """
+    url = make_url(database_url)
+    options = {
+        "echo": False,  # Set to True for SQL query logging
+        "query_cache_size": 1200,  # Compiled-statement cache; default 500
+        "json_serializer": json_dumps,
+        "json_deserializer": json_loads
+    }
+    
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {
+            "check_same_thread": False  # Allow SQLite access from multiple threads
+        }
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+        else:
+            options["poolclass"] = NullPool
+    else:
+        options["pool_pre_ping"] = True  # Verify connections before use
+        options["pool_recycle"] = 3600   # Recycle connections every hour
+        if url.get_driver_name() == "psycopg2":
+            # Let psycopg2 batch executemany() calls (bulk_insert) into
+            # multi-row VALUES statements instead of one INSERT per row;
+            # the option is psycopg2-only and rejected by other drivers
+            options["executemany_mode"] = "values_plus_batch"
+    
+    options.update(kwargs)
+    engine = create_engine(url, **options)
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", _sqlite_pragmas)
+    return engine
+
+
 # Database metadata for table creation and migration
 def create_tables(engine):
     """
@@ -515,6 +1022,189 @@ def create_tables(engine):
     logger.info("Database tables created successfully")
 
 
+def bulk_insert(session, model, rows):
+    """
+    Insert many rows for a model in a single executemany round trip.
+    
+    Uses a Core INSERT with a list of parameter dicts so the driver batches
+    the rows instead of the ORM flushing one INSERT per instance. The
+    statement joins the caller's transaction; nothing is committed here.
+    
+    Args:
+        session: SQLAlchemy session instance
+        model: Mapped model class to insert into
+        rows (list): Column name -> value dicts, one per row
+        
+    Returns:
+        int: Number of rows submitted for insert
+    """
+    if not rows:
+        return 0
+    
+    session.execute(insert(model), rows)
+    logger.debug(f"Bulk inserted {len(rows)} rows into {model.__tablename__}")
+    return len(rows)
+
+
+def copy_rows(session, model, rows):
+    """
+    Load rows into a model's table with PostgreSQL COPY ... FROM STDIN.
+    
+    COPY checks permissions and types once per statement instead of once
+    per row, so it beats even multi-row INSERT for large loads. Values are
+    run through each column type's bind processor first, so JSON and
+    StatusCode columns are stored exactly as an INSERT would store them.
+    The load joins the caller's transaction; nothing is committed here.
+    
+    Args:
+        session: SQLAlchemy session bound to a PostgreSQL engine
+        model: Mapped model class to load into
+        rows (list): Column name -> value dicts, all with the same keys
+        
+    Returns:
+        int: Number of rows copied
+    """
+    if not rows:
+        return 0
+    
+    connection = session.connection()
+    dialect = connection.dialect
+    columns = [model.__table__.c[name] for name in rows[0]]
+    processors = [column.type.bind_processor(dialect) for column in columns]
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+    for row in rows:
+        record = []
+        for column, processor in zip(columns, processors):
+            value = row[column.name]
+            if processor is not None:
+                value = processor(value)
+            record.append(r'\N' if value is None else value)
+        writer.writerow(record)
+    buffer.seek(0)
+    
+    column_list = ", ".join(column.name for column in columns)
+    sql = (
+        f"COPY {model.__tablename__} ({column_list}) FROM STDIN "
+        f"WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')"
+    )
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(sql, buffer)
+    finally:
+        cursor.close()
+    
+    logger.debug(f"Copied {len(rows)} rows into {model.__tablename__}")
+    return len(rows)
+
+
+def stream_rows(session, model, *criteria, batch_size=500):
+    """
+    Iterate over a model's rows in constant memory for exports and reports.
+    
+    Rows are fetched with a server-side cursor and hydrated batch_size at a
+    time instead of materializing the whole result like Query.all(). Eager
+    relationships must use selectin loading (as Order's do); joined eager
+    loading is incompatible with yield_per.
+    
+    Args:
+        session: SQLAlchemy session instance
+        model: Mapped model class to read
+        *criteria: Optional WHERE clauses
+        batch_size (int): Rows hydrated per fetch
+        
+    Returns:
+        ScalarResult: Iterable of model instances
+    """
+    stmt = select(model).where(*criteria).execution_options(
+        stream_results=True, yield_per=batch_size
+    )
+    return session.execute(stmt).scalars()
+
+
+def _delete_in_batches(session, model, key_column, condition, batch_size, order_by=None):
+    """
+    Delete rows matching condition in primary-key batches, committing after each.
+    
+    Keeps each write transaction (and the SQLite WAL) small instead of
+    removing every matching row in one long-running DELETE. Passing the
+    indexed column the condition filters on as order_by makes each batch an
+    index range scan over the oldest rows.
+    
+    Returns:
+        int: Total number of rows deleted
+    """
+    total_deleted = 0
+    
+    while True:
+        batch_keys = select(key_column).where(condition)
+        if order_by is not None:
+            batch_keys = batch_keys.order_by(order_by)
+        batch_keys = batch_keys.limit(batch_size)
+        result = session.execute(
+            delete(model)
+            .where(key_column.in_(batch_keys))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        
+        total_deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return total_deleted
+
+
+def prune_expired_sessions(session, timeout_minutes=30, batch_size=1000):
+    """
+    Delete expired active sessions in batches.
+    
+    Args:
+        session: SQLAlchemy session instance
+        timeout_minutes (int): Session timeout in minutes (default: 30)
+        batch_size (int): Rows deleted per transaction
+        
+    Returns:
+        int: Number of sessions deleted
+    """
+    cutoff_epoch = int(time.time()) - timeout_minutes * 60
+    deleted = _delete_in_batches(
+        session, ActiveSession, ActiveSession.session_id,
+        ActiveSession.created_at_epoch < cutoff_epoch, batch_size,
+        order_by=ActiveSession.created_at_epoch
+    )
+    logger.debug(f"Pruned {deleted} expired sessions")
+    return deleted
+
+
+def prune_webhook_events(session, retention_days=30, batch_size=1000):
+    """
+    Delete webhook events older than the retention window in batches.
+    
+    Args:
+        session: SQLAlchemy session instance
+        retention_days (int): Days of webhook history to keep
+        batch_size (int): Rows deleted per transaction
+        
+    Returns:
+        int: Number of webhook events deleted
+    """
+    cutoff_time = datetime.utcnow() - timedelta(days=retention_days)
+    
+    # Payloads first, so the foreign key holds without relying on ON DELETE CASCADE
+    # (SQLite leaves foreign key enforcement off by default)
+    expired_ids = select(WebhookEvent.id).where(WebhookEvent.received_at < cutoff_time)
+    _delete_in_batches(
+        session, WebhookEventPayload, WebhookEventPayload.event_id,
+        WebhookEventPayload.event_id.in_(expired_ids), batch_size
+    )
+    deleted = _delete_in_batches(
+        session, WebhookEvent, WebhookEvent.id,
+        WebhookEvent.received_at < cutoff_time, batch_size
+    )
+    logger.debug(f"Pruned {deleted} webhook events older than {retention_days} days")
+    return deleted
+
+
 def drop_tables(engine):
     """
     Drop all database tables (for testing and cleanup).
@@ -4,18 +4,112 @@ Handles active session tracking, connection pooling, and real-time data storage.
 """
 
 import os
-import json
+import asyncio
+import socket
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 import time
+import threading
 from contextlib import contextmanager
-import redis
-from redis.connection import ConnectionPool
-from redis.exceptions import ConnectionError, TimeoutError, RedisError
+from functools import lru_cache
+import msgspec
+from cachetools import TTLCache
 
-# Configure logging for Redis operations
+# redis-py is imported on first initialize() so importing this module (and
+# the database package) stays cheap on cold start
+if TYPE_CHECKING:
+    import redis
+
+# Configure logging for Redis operations. Per-operation debug messages use
+# %-style arguments so nothing is formatted unless DEBUG is enabled
 logger = logging.getLogger(__name__)
 
+# Key prefixes and the active session set name, built once instead of
+# formatted per command; the set name is pre-encoded for the command packer
+_SESSION_PREFIX = "session:"
+_CACHE_PREFIX = "cache:"
+_ACTIVE_SESSIONS_KEY = b"active_sessions"
+
+# Commands queued per pipeline round-trip in bulk session operations
+_PIPELINE_BATCH = 500
+
+# Session and cache payload codec: msgpack frames decoded straight from the
+# raw reply bytes, with encoder/decoder built once rather than per call
+_dumps = msgspec.msgpack.Encoder().encode
+_loads = msgspec.msgpack.Decoder().decode
+
+
+# Socket buffer size for pooled connections; the kernel default is too small
+# for pipelined batches and larger session payloads
+SOCKET_BUFFER_SIZE = 512 * 1024
+
+
+@lru_cache(maxsize=None)
+def _buffered_connection_class() -> type:
+    """
+    Build the pooled connection class once redis-py has been imported.
+    
+    Returns:
+        type: Connection subclass with enlarged send/receive socket buffers
+    """
+    from redis.connection import Connection
+    
+    class BufferedConnection(Connection):
+        """TCP Redis connection with enlarged send/receive socket buffers."""
+        
+        def _connect(self):
+            """Open the socket and raise SO_RCVBUF/SO_SNDBUF."""
+            sock = super()._connect()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            return sock
+    
+    return BufferedConnection
+
+
+def _encode_fields(data: Dict[str, Any]) -> List[Any]:
+    """Flatten a session dict into HSET field/value arguments with msgpack-encoded values."""
+    args = []
+    for field, value in data.items():
+        args.extend((field, _dumps(value)))
+    return args
+
+
+def _decode_fields(raw: Dict[Any, bytes]) -> Dict[str, Any]:
+    """Decode an HGETALL reply back into a session dict."""
+    return {
+        (field.decode() if isinstance(field, bytes) else field): _loads(value)
+        for field, value in raw.items()
+    }
+
+
+# Atomic admission control: refuse the session when the active set is at
+# capacity, otherwise store it and register it in the active set.
+# KEYS: active set, session key; ARGV: ttl, max sessions, session id, field/value pairs
+_CREATE_SESSION_SCRIPT = """
+local n = redis.call('SCARD', KEYS[1])
+if n >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('DEL', KEYS[2])
+redis.call('HSET', KEYS[2], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+redis.call('SADD', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Partial update of an existing session hash; missing sessions are not recreated.
+# KEYS: session key; ARGV: ttl, field/value pairs
+_UPDATE_SESSION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
 
 class RedisClient:
     """
@@ -37,12 +131,43 @@ class RedisClient:
         self.max_connections = max_connections
         self.pool = None
         self.client = None
+        self._create_script = None
+        self._update_script = None
+        
+        # asyncio client for event-loop callers, created on first async use
+        self.async_client = None
+        self._async_create_script = None
+        self._async_update_script = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+        
+        # redis-py exception classes, bound on initialize
+        self._connection_errors = ()
+        self._redis_error = ()
         
         # Session management configuration
         self.session_ttl = 30 * 60  # 30 minutes default TTL
         self.max_concurrent_sessions = 20  # Match PRD requirement
         
+        # Fire-and-forget write queue for TTL refreshes and cache writes
+        self.flush_interval = 0.005  # Seconds between background flushes
+        self.flush_threshold = 32  # Queued commands that trigger an inline flush
+        self._pending_pipe = None
+        self._pending_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        
+        # Process-local cache of decoded values in front of cache_get; entries
+        # may lag other processes' writes by up to local_cache_ttl seconds
+        self.local_cache_ttl = 60
+        self._local_cache = TTLCache(maxsize=1024, ttl=self.local_cache_ttl)
+        self._local_lock = threading.RLock()
+        
+        # Parsed INFO subset for get_connection_info, refreshed at most every
+        # info_cache_ttl seconds so monitoring polls don't hammer Redis
+        self.info_cache_ttl = 5.0
+        self._info_cache = (0.0, None)
+        
         logger.info(f"RedisClient initialized with URL: {self.redis_url}")
     
     def initialize(self) -> None:
@@ -50,33 +175,75 @@ class RedisClient:
         Initialize Redis connection pool and client.
         
         Creates connection pool with retry logic and health checking.
+        Safe to call from several threads; only the first call connects.
         """
         if self._initialized:
             logger.debug("Redis client already initialized, skipping...")
             return
         
+        with self._init_lock:
+            if not self._initialized:
+                self._initialize_locked()
+    
+    def _initialize_locked(self) -> None:
+        """Build the pool, client, scripts and flusher; the caller holds _init_lock."""
+        import redis
+        from redis.connection import ConnectionPool
+        from redis.utils import HIREDIS_AVAILABLE
+        
+        self._connection_errors = (redis.ConnectionError, redis.TimeoutError)
+        self._redis_error = redis.RedisError
+        
         try:
-            # Create connection pool with configuration
+            # Create connection pool with configuration. Socket options must be
+            # set here; redis.Redis ignores them when given a pool
+            pool_options = {}
+            if self.redis_url.startswith("redis://"):
+                # TLS (rediss://) and unix socket URLs keep their own connection class
+                pool_options["connection_class"] = _buffered_connection_class()
+            
+            # redis-py picks the C hiredis reply parser automatically when the
+            # package is installed; the pure-Python fallback is far slower on
+            # pipelined and multi-element replies
+            if not HIREDIS_AVAILABLE:
+                logger.warning("hiredis not installed, using the pure-Python Redis reply parser")
+            
             self.pool = ConnectionPool.from_url(
                 self.redis_url,
                 max_connections=self.max_connections,
                 retry_on_timeout=True,
                 socket_timeout=5,
                 socket_connect_timeout=5,
-                health_check_interval=30
+                socket_keepalive=True,
+                health_check_interval=30,
+                **pool_options
             )
             
-            # Create Redis client with connection pool
-            self.client = redis.Redis(
+            # Create Redis client with connection pool. Replies stay raw bytes:
+            # payloads go straight to the msgpack decoder and keys are decoded
+            # explicitly where callers need str
+            client = redis.Redis(
                 connection_pool=self.pool,
-                decode_responses=True,  # Automatically decode byte responses
-                socket_keepalive=True,
-                socket_keepalive_options={}
+                decode_responses=False
             )
             
             # Test connection
-            self.client.ping()
+            client.ping()
+            
+            # Scripts run via EVALSHA once Redis has cached them
+            self._create_script = client.register_script(_CREATE_SESSION_SCRIPT)
+            self._update_script = client.register_script(_UPDATE_SESSION_SCRIPT)
             
+            # Background flusher for writes callers don't wait on
+            self._pending_pipe = client.pipeline(transaction=False)
+            self._flush_stop.clear()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="redis-write-flusher", daemon=True
+            )
+            self._flush_thread.start()
+            
+            # Published last: operations treat a set client as ready to use
+            self.client = client
             self._initialized = True
             logger.info("Redis client initialized successfully")
             
@@ -84,26 +251,89 @@ class RedisClient:
             logger.error(f"Failed to initialize Redis client: {e}")
             raise
     
+    def _lazy_client(self) -> "redis.Redis":
+        """
+        Initialize on first use and return the Redis client.
+        
+        RedisClient operations use ``self.client or self._lazy_client()`` so the
+        steady state costs one attribute check instead of a context manager
+        frame per command.
+        
+        Returns:
+            redis.Redis: Redis client for operations
+        """
+        self.initialize()
+        return self.client
+    
     @contextmanager
     def get_connection(self):
         """
         Context manager for Redis connections with error handling.
         
+        Used by other modules that issue their own commands; operations on this
+        class access the client directly.
+        
         Yields:
             redis.Redis: Redis client for operations
         """
-        if not self._initialized:
-            self.initialize()
-        
         try:
-            yield self.client
-        except (ConnectionError, TimeoutError) as e:
+            yield self.client or self._lazy_client()
+        except self._connection_errors as e:
             logger.error(f"Redis connection error: {e}")
             raise
-        except RedisError as e:
+        except self._redis_error as e:
             logger.error(f"Redis operation error: {e}")
             raise
     
+    # Fire-and-forget Writes
+    
+    def _enqueue(self, command: str, *args, **kwargs) -> None:
+        """
+        Queue a non-critical write on the shared background pipeline.
+        
+        The caller returns without waiting for a round-trip; the command is
+        sent on the next background flush, or immediately once
+        flush_threshold commands are queued. Failures are logged, not raised.
+        
+        Args:
+            command (str): Redis command method name, e.g. "expire"
+            *args: Positional command arguments
+            **kwargs: Keyword command arguments
+        """
+        if self._pending_pipe is None:
+            self._lazy_client()
+        
+        with self._pending_lock:
+            getattr(self._pending_pipe, command)(*args, **kwargs)
+            if len(self._pending_pipe) >= self.flush_threshold:
+                self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Send queued writes; the caller must hold _pending_lock."""
+        if not len(self._pending_pipe):
+            return
+        
+        try:
+            self._pending_pipe.execute()
+        except Exception as e:
+            # Any failure (connection, serialization, ...) drops this batch
+            # but must not kill the flush thread
+            logger.error(f"Background Redis flush failed: {e}")
+            self._pending_pipe.reset()
+    
+    def flush_pending(self) -> None:
+        """Send any queued fire-and-forget writes now."""
+        if self._pending_pipe is None:
+            return
+        
+        with self._pending_lock:
+            self._flush_locked()
+    
+    def _flush_loop(self) -> None:
+        """Background thread body: flush queued writes every flush_interval."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush_pending()
+    
     # Session Management Operations
     
     def create_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
@@ -118,42 +348,43 @@ class RedisClient:
             bool: True if session created successfully
         """
         try:
-            with self.get_connection() as redis_client:
-                # Check if we've reached the maximum concurrent sessions
-                current_sessions = self.get_active_session_count()
-                if current_sessions >= self.max_concurrent_sessions:
-                    logger.warning(
-                        f"Maximum concurrent sessions ({self.max_concurrent_sessions}) reached. "
-                        f"Cannot create new session: {session_id}"
-                    )
-                    return False
-                
-                # Add session creation timestamp
-                session_data['created_at'] = time.time()
-                session_data['last_activity'] = time.time()
-                
-                # Store session with TTL
-                session_key = f"session:{session_id}"
-                redis_client.setex(
-                    session_key,
-                    self.session_ttl,
-                    json.dumps(session_data)
+            redis_client = self.client or self._lazy_client()
+            
+            # Add session creation timestamp
+            now = time.time()
+            session_data['created_at'] = now
+            session_data['last_activity'] = now
+            
+            # Check the concurrent session cap and store the session with TTL
+            # in one atomic round-trip, so concurrent callers cannot overshoot
+            session_key = _SESSION_PREFIX + session_id
+            created = self._create_script(
+                keys=[_ACTIVE_SESSIONS_KEY, session_key],
+                args=[self.session_ttl, self.max_concurrent_sessions, session_id,
+                      *_encode_fields(session_data)],
+                client=redis_client
+            )
+            
+            if not created:
+                logger.warning(
+                    f"Maximum concurrent sessions ({self.max_concurrent_sessions}) reached. "
+                    f"Cannot create new session: {session_id}"
                 )
-                
-                # Add to active sessions set for monitoring
-                redis_client.sadd("active_sessions", session_id)
-                redis_client.expire("active_sessions", self.session_ttl)
-                
-                logger.info(f"Session created: {session_id}")
-                return True
-                
+                return False
+            
+            logger.info(f"Session created: {session_id}")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to create session {session_id}: {e}")
             return False
     
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve session data by session ID.
+        Retrieve session data by session ID and extend its expiration.
+        
+        last_activity reflects the most recent create or update; reads only
+        slide the TTL.
         
         Args:
             session_id (str): Session identifier
@@ -162,22 +393,24 @@ class RedisClient:
             dict: Session data if found, None otherwise
         """
         try:
-            with self.get_connection() as redis_client:
-                session_key = f"session:{session_id}"
-                session_data = redis_client.get(session_key)
-                
-                if session_data:
-                    # Update last activity timestamp
-                    data = json.loads(session_data)
-                    data['last_activity'] = time.time()
-                    redis_client.setex(session_key, self.session_ttl, json.dumps(data))
-                    
-                    logger.debug(f"Session retrieved: {session_id}")
-                    return data
-                
-                logger.debug(f"Session not found: {session_id}")
-                return None
-                
+            redis_client = self.client or self._lazy_client()
+            
+            session_key = _SESSION_PREFIX + session_id
+            
+            # The sliding expiry is the liveness signal, so fields are not
+            # rewritten on reads; the TTL refresh is queued rather than
+            # awaited
+            session_data = redis_client.hgetall(session_key)
+            if session_data:
+                self._enqueue("expire", session_key, self.session_ttl)
+            
+            if session_data:
+                logger.debug("Session retrieved: %s", session_id)
+                return _decode_fields(session_data)
+            
+            logger.debug("Session not found: %s", session_id)
+            return None
+            
         except Exception as e:
             logger.error(f"Failed to get session {session_id}: {e}")
             return None
@@ -194,25 +427,25 @@ class RedisClient:
             bool: True if session updated successfully
         """
         try:
-            with self.get_connection() as redis_client:
-                session_key = f"session:{session_id}"
-                session_data = redis_client.get(session_key)
-                
-                if not session_data:
-                    logger.warning(f"Cannot update non-existent session: {session_id}")
-                    return False
-                
-                # Merge updates with existing data
-                data = json.loads(session_data)
-                data.update(updates)
-                data['last_activity'] = time.time()
-                
-                # Store updated session
-                redis_client.setex(session_key, self.session_ttl, json.dumps(data))
-                
-                logger.debug(f"Session updated: {session_id}")
-                return True
-                
+            redis_client = self.client or self._lazy_client()
+            
+            session_key = _SESSION_PREFIX + session_id
+            
+            # Only the changed fields are written; no read-modify-write
+            fields = dict(updates, last_activity=time.time())
+            updated = self._update_script(
+                keys=[session_key],
+                args=[self.session_ttl, *_encode_fields(fields)],
+                client=redis_client
+            )
+            
+            if not updated:
+                logger.warning(f"Cannot update non-existent session: {session_id}")
+                return False
+            
+            logger.debug("Session updated: %s", session_id)
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to update session {session_id}: {e}")
             return False
@@ -228,22 +461,23 @@ class RedisClient:
             bool: True if session deleted successfully
         """
         try:
-            with self.get_connection() as redis_client:
-                session_key = f"session:{session_id}"
-                
-                # Remove session data
-                deleted = redis_client.delete(session_key)
-                
-                # Remove from active sessions set
-                redis_client.srem("active_sessions", session_id)
-                
-                if deleted:
-                    logger.info(f"Session deleted: {session_id}")
-                    return True
-                else:
-                    logger.warning(f"Session not found for deletion: {session_id}")
-                    return False
-                
+            redis_client = self.client or self._lazy_client()
+            
+            session_key = _SESSION_PREFIX + session_id
+            
+            # Remove session data and active set membership in one round-trip
+            with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(session_key)
+                pipe.srem(_ACTIVE_SESSIONS_KEY, session_id)
+                deleted, _ = pipe.execute()
+            
+            if deleted:
+                logger.info(f"Session deleted: {session_id}")
+                return True
+            else:
+                logger.warning(f"Session not found for deletion: {session_id}")
+                return False
+            
         except Exception as e:
             logger.error(f"Failed to delete session {session_id}: {e}")
             return False
@@ -256,112 +490,458 @@ class RedisClient:
             list: Active session identifiers
         """
         try:
-            with self.get_connection() as redis_client:
-                sessions = redis_client.smembers("active_sessions")
-                logger.debug(f"Retrieved {len(sessions)} active sessions")
-                return list(sessions)
-                
+            redis_client = self.client or self._lazy_client()
+            
+            # Incremental SSCAN keeps Redis responsive if zombie IDs pile up
+            sessions = [
+                session_id.decode()
+                for session_id in redis_client.sscan_iter(_ACTIVE_SESSIONS_KEY, count=100)
+            ]
+            logger.debug("Retrieved %s active sessions", len(sessions))
+            return sessions
+            
         except Exception as e:
             logger.error(f"Failed to get active sessions: {e}")
             return []
     
-    def get_active_session_count(self) -> int:
+    def get_sessions_bulk(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Get count of active sessions for monitoring.
+        Retrieve many sessions with pipelined HGETALLs.
+        
+        Costs one round-trip per _PIPELINE_BATCH sessions instead of one per
+        session. Meant for monitoring, so unlike get_session it does not
+        slide the sessions' TTL.
         
+        Args:
+            session_ids (list): Session identifiers
+            
         Returns:
-            int: Number of active sessions
+            dict: Session data by session ID; missing sessions are omitted
         """
         try:
-            with self.get_connection() as redis_client:
-                count = redis_client.scard("active_sessions")
-                logger.debug(f"Active session count: {count}")
-                return count
+            redis_client = self.client or self._lazy_client()
+            
+            sessions = {}
+            for start in range(0, len(session_ids), _PIPELINE_BATCH):
+                batch = session_ids[start:start + _PIPELINE_BATCH]
+                with redis_client.pipeline(transaction=False) as pipe:
+                    for session_id in batch:
+                        pipe.hgetall(_SESSION_PREFIX + session_id)
+                    results = pipe.execute()
                 
+                sessions.update(
+                    (session_id, _decode_fields(raw))
+                    for session_id, raw in zip(batch, results) if raw
+                )
+            
+            logger.debug("Retrieved %s/%s sessions in bulk", len(sessions), len(session_ids))
+            return sessions
+            
+        except Exception as e:
+            logger.error(f"Failed to get sessions in bulk: {e}")
+            return {}
+    
+    def get_active_session_count(self) -> Optional[int]:
+        """
+        Get count of active sessions for monitoring.
+        
+        SCARD on the active sessions set is O(1), and the set is maintained
+        by the create/delete scripts, so this is an exact live counter.
+        
+        Returns:
+            int: Number of active sessions, or None if Redis is unreachable
+        """
+        try:
+            redis_client = self.client or self._lazy_client()
+            
+            count = redis_client.scard(_ACTIVE_SESSIONS_KEY)
+            logger.debug("Active session count: %s", count)
+            return count
+            
         except Exception as e:
             logger.error(f"Failed to get active session count: {e}")
-            return 0
+            return None
     
     def cleanup_expired_sessions(self) -> int:
         """
         Clean up expired sessions from active sessions set.
         
+        The set is walked with SSCAN and checked one pipelined batch at a
+        time, so neither Redis nor this process holds the whole set at once.
+        Session hashes that have lost their TTL would otherwise never expire;
+        they are UNLINKed (freed off the Redis main thread) along with their
+        set entries.
+        
         Returns:
             int: Number of sessions cleaned up
         """
         try:
-            with self.get_connection() as redis_client:
-                active_sessions = self.get_active_sessions()
-                expired_count = 0
-                
-                for session_id in active_sessions:
-                    session_key = f"session:{session_id}"
-                    if not redis_client.exists(session_key):
-                        # Session expired, remove from active set
-                        redis_client.srem("active_sessions", session_id)
-                        expired_count += 1
-                
-                if expired_count > 0:
-                    logger.info(f"Cleaned up {expired_count} expired sessions")
-                
-                return expired_count
-                
+            redis_client = self.client or self._lazy_client()
+            
+            expired_count = 0
+            batch = []
+            for session_id in redis_client.sscan_iter(_ACTIVE_SESSIONS_KEY, count=_PIPELINE_BATCH):
+                batch.append(session_id.decode())
+                if len(batch) == _PIPELINE_BATCH:
+                    expired_count += self._cleanup_session_batch(redis_client, batch)
+                    batch = []
+            if batch:
+                expired_count += self._cleanup_session_batch(redis_client, batch)
+            
+            if expired_count > 0:
+                logger.info(f"Cleaned up {expired_count} expired sessions")
+            
+            return expired_count
+            
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             return 0
     
+    @staticmethod
+    def _cleanup_session_batch(redis_client: "redis.Redis", batch: List[str]) -> int:
+        """Drop one batch of expired or TTL-less sessions; returns how many were dropped."""
+        # Check a batch of session keys in one round-trip
+        with redis_client.pipeline(transaction=False) as pipe:
+            for session_id in batch:
+                pipe.ttl(_SESSION_PREFIX + session_id)
+            ttls = pipe.execute()
+        
+        # -2: key already expired; -1: key exists but will never expire
+        expired = [session_id for session_id, ttl in zip(batch, ttls) if ttl < 0]
+        if not expired:
+            return 0
+        
+        with redis_client.pipeline(transaction=False) as pipe:
+            leaked = [_SESSION_PREFIX + session_id for session_id, ttl in zip(batch, ttls) if ttl == -1]
+            if leaked:
+                pipe.unlink(*leaked)
+            pipe.srem(_ACTIVE_SESSIONS_KEY, *expired)
+            pipe.execute()
+        return len(expired)
+    
+    # Async Session Operations
+    
+    def _lazy_async_client(self) -> "redis.asyncio.Redis":
+        """
+        Create the redis.asyncio client on first use and return it.
+        
+        The asyncio client keeps its own connection pool; connections are
+        opened lazily by the first command, so this does no network I/O.
+        
+        Returns:
+            redis.asyncio.Redis: Async Redis client for operations
+        """
+        if self.async_client is None:
+            import redis.asyncio as aioredis
+            
+            client = aioredis.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                socket_timeout=5,
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                health_check_interval=30,
+                decode_responses=False
+            )
+            self._async_create_script = client.register_script(_CREATE_SESSION_SCRIPT)
+            self._async_update_script = client.register_script(_UPDATE_SESSION_SCRIPT)
+            self.async_client = client
+        
+        return self.async_client
+    
+    def get_async_client(self) -> "redis.asyncio.Redis":
+        """
+        Get the shared redis.asyncio client for raw commands and pipelines.
+        
+        Returns:
+            redis.asyncio.Redis: Async Redis client
+        """
+        return self._lazy_async_client()
+    
+    async def acreate_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
+        """
+        Async version of create_session for callers running in an event loop.
+        
+        Args:
+            session_id (str): Unique session identifier
+            session_data (dict): Session information and state
+            
+        Returns:
+            bool: True if session created successfully
+        """
+        try:
+            client = self.async_client or self._lazy_async_client()
+            
+            now = time.time()
+            session_data['created_at'] = now
+            session_data['last_activity'] = now
+            
+            created = await self._async_create_script(
+                keys=[_ACTIVE_SESSIONS_KEY, _SESSION_PREFIX + session_id],
+                args=[self.session_ttl, self.max_concurrent_sessions, session_id,
+                      *_encode_fields(session_data)],
+                client=client
+            )
+            
+            if not created:
+                logger.warning(
+                    f"Maximum concurrent sessions ({self.max_concurrent_sessions}) reached. "
+                    f"Cannot create new session: {session_id}"
+                )
+                return False
+            
+            logger.info(f"Session created: {session_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create session {session_id}: {e}")
+            return False
+    
+    async def aget_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Async version of get_session; reads the hash and slides its TTL.
+        
+        Args:
+            session_id (str): Session identifier
+            
+        Returns:
+            dict: Session data if found, None otherwise
+        """
+        try:
+            client = self.async_client or self._lazy_async_client()
+            
+            session_key = _SESSION_PREFIX + session_id
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(session_key)
+                pipe.expire(session_key, self.session_ttl)
+                session_data, _ = await pipe.execute()
+            
+            if session_data:
+                logger.debug("Session retrieved: %s", session_id)
+                return _decode_fields(session_data)
+            
+            logger.debug("Session not found: %s", session_id)
+            return None
+            
+        except Exception as e:
+            logger.error(f"Failed to get session {session_id}: {e}")
+            return None
+    
+    async def aupdate_session(self, session_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Async version of update_session; writes only the changed fields.
+        
+        Args:
+            session_id (str): Session identifier
+            updates (dict): Fields to update
+            
+        Returns:
+            bool: True if session updated successfully
+        """
+        try:
+            client = self.async_client or self._lazy_async_client()
+            
+            fields = dict(updates, last_activity=time.time())
+            updated = await self._async_update_script(
+                keys=[_SESSION_PREFIX + session_id],
+                args=[self.session_ttl, *_encode_fields(fields)],
+                client=client
+            )
+            
+            if not updated:
+                logger.warning(f"Cannot update non-existent session: {session_id}")
+                return False
+            
+            logger.debug("Session updated: %s", session_id)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to update session {session_id}: {e}")
+            return False
+    
+    async def adelete_session(self, session_id: str) -> bool:
+        """
+        Async version of delete_session.
+        
+        Args:
+            session_id (str): Session identifier
+            
+        Returns:
+            bool: True if session deleted successfully
+        """
+        try:
+            client = self.async_client or self._lazy_async_client()
+            
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.delete(_SESSION_PREFIX + session_id)
+                pipe.srem(_ACTIVE_SESSIONS_KEY, session_id)
+                deleted, _ = await pipe.execute()
+            
+            if deleted:
+                logger.info(f"Session deleted: {session_id}")
+                return True
+            else:
+                logger.warning(f"Session not found for deletion: {session_id}")
+                return False
+            
+        except Exception as e:
+            logger.error(f"Failed to delete session {session_id}: {e}")
+            return False
+    
     # Caching Operations
     
     def cache_set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """
         Set cache value with TTL.
         
+        The Redis write is queued on the background pipeline; this process
+        sees the new value immediately through the local cache, other
+        processes after the next flush.
+        
         Args:
             key (str): Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (serialized with msgpack)
             ttl (int): Time to live in seconds
             
         Returns:
-            bool: True if value cached successfully
+            bool: True if value was queued for caching
         """
         try:
-            with self.get_connection() as redis_client:
-                redis_client.setex(f"cache:{key}", ttl, json.dumps(value))
-                logger.debug(f"Cache set: {key}")
-                return True
-                
+            # Cache writes are best-effort; queue instead of waiting on the RTT
+            self._enqueue("setex", _CACHE_PREFIX + key, ttl, _dumps(value))
+            
+            with self._local_lock:
+                # Don't let the local copy outlive a short-lived Redis entry
+                if ttl >= self.local_cache_ttl:
+                    self._local_cache[key] = value
+                else:
+                    self._local_cache.pop(key, None)
+            
+            logger.debug("Cache set: %s", key)
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to set cache {key}: {e}")
             return False
     
-    def cache_get(self, key: str) -> Optional[Any]:
+    def cache_get(self, key: str, local: bool = True) -> Optional[Any]:
         """
         Get cached value.
         
         Args:
             key (str): Cache key
+            local (bool): Use the process-local cache; pass False for keys
+                whose Redis TTL is shorter than local_cache_ttl
             
         Returns:
             Cached value if found, None otherwise
         """
         try:
-            with self.get_connection() as redis_client:
-                value = redis_client.get(f"cache:{key}")
-                if value:
-                    logger.debug(f"Cache hit: {key}")
-                    return json.loads(value)
-                else:
-                    logger.debug(f"Cache miss: {key}")
-                    return None
-                
+            # Hot keys are served decoded from the local cache without an RTT
+            if local:
+                with self._local_lock:
+                    if key in self._local_cache:
+                        logger.debug("Local cache hit: %s", key)
+                        return self._local_cache[key]
+            else:
+                # Send queued writes first so the read sees this process's
+                # latest cache_set for the key
+                self.flush_pending()
+            
+            redis_client = self.client or self._lazy_client()
+            
+            value = redis_client.get(_CACHE_PREFIX + key)
+            if value:
+                logger.debug("Cache hit: %s", key)
+                decoded = _loads(value)
+                if local:
+                    with self._local_lock:
+                        self._local_cache[key] = decoded
+                return decoded
+            else:
+                logger.debug("Cache miss: %s", key)
+                return None
+            
         except Exception as e:
             logger.error(f"Failed to get cache {key}: {e}")
             return None
     
+    def cache_mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several cached values in one round-trip.
+        
+        Preferred over repeated cache_get calls when loading related keys
+        together, e.g. menu, price and config entries at call start.
+        
+        Args:
+            keys (list): Cache keys
+            
+        Returns:
+            dict: Cached values by key; missing keys are omitted
+        """
+        try:
+            found = {}
+            with self._local_lock:
+                for key in keys:
+                    if key in self._local_cache:
+                        found[key] = self._local_cache[key]
+            
+            remaining = [key for key in keys if key not in found]
+            if remaining:
+                redis_client = self.client or self._lazy_client()
+                
+                values = redis_client.mget([_CACHE_PREFIX + key for key in remaining])
+                fetched = {key: _loads(value) for key, value in zip(remaining, values) if value}
+                with self._local_lock:
+                    self._local_cache.update(fetched)
+                found.update(fetched)
+            
+            logger.debug("Cache mget: %s/%s hits", len(found), len(keys))
+            return found
+            
+        except Exception as e:
+            logger.error(f"Failed to get cache keys {keys}: {e}")
+            return {}
+    
+    def cache_mset(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Set several cache values with the same TTL.
+        
+        MSET has no per-key expiry, so the SETEX commands are queued together
+        on the background pipeline and sent in one batch.
+        
+        Args:
+            mapping (dict): Values to cache by key
+            ttl (int): Time to live in seconds
+            
+        Returns:
+            bool: True if values were queued for caching
+        """
+        try:
+            for key, value in mapping.items():
+                self._enqueue("setex", _CACHE_PREFIX + key, ttl, _dumps(value))
+            
+            with self._local_lock:
+                for key, value in mapping.items():
+                    if ttl >= self.local_cache_ttl:
+                        self._local_cache[key] = value
+                    else:
+                        self._local_cache.pop(key, None)
+            
+            logger.debug("Cache mset: %s keys", len(mapping))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to set cache keys {list(mapping)}: {e}")
+            return False
+    
     def cache_delete(self, key: str) -> bool:
         """
         Delete cached value.
         
+        Queued background writes are flushed first, so a pending cache_set
+        can't restore the value after it is deleted.
+        
         Args:
             key (str): Cache key
             
@@ -369,11 +949,17 @@ class RedisClient:
             bool: True if value deleted successfully
         """
         try:
-            with self.get_connection() as redis_client:
-                deleted = redis_client.delete(f"cache:{key}")
-                logger.debug(f"Cache deleted: {key}")
-                return bool(deleted)
-                
+            redis_client = self.client or self._lazy_client()
+            
+            with self._local_lock:
+                self._local_cache.pop(key, None)
+            
+            # A queued SETEX for this key must not land after the delete
+            self.flush_pending()
+            deleted = redis_client.delete(_CACHE_PREFIX + key)
+            logger.debug("Cache deleted: %s", key)
+            return bool(deleted)
+            
         except Exception as e:
             logger.error(f"Failed to delete cache {key}: {e}")
             return False
@@ -388,15 +974,87 @@ class RedisClient:
             bool: True if Redis is accessible and responsive
         """
         try:
-            with self.get_connection() as redis_client:
-                redis_client.ping()
-                logger.debug("Redis health check passed")
-                return True
-                
+            redis_client = self.client or self._lazy_client()
+            
+            redis_client.ping()
+            logger.debug("Redis health check passed")
+            return True
+            
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             return False
     
+    def prewarm(self, connections: int) -> int:
+        """
+        Open connections in the sync pool ahead of the first requests.
+        
+        Args:
+            connections (int): Connections to open, capped at max_connections
+            
+        Returns:
+            int: Number of connections warmed
+        """
+        if self.client is None:
+            self._lazy_client()
+        
+        count = min(connections, self.max_connections)
+        warmed = []
+        try:
+            # Checking out connects; holding them forces distinct connections
+            for _ in range(count):
+                warmed.append(self.pool.get_connection("PING"))
+        finally:
+            for connection in warmed:
+                self.pool.release(connection)
+        
+        return len(warmed)
+    
+    async def aprewarm(self, connections: int) -> int:
+        """
+        Open connections in both the sync pool and the asyncio client's pool.
+        
+        The sync pool is filled from a worker thread so the event loop keeps
+        running; the asyncio pool is filled by concurrent PINGs, each of
+        which needs its own connection.
+        
+        Args:
+            connections (int): Connections to open per pool, capped at max_connections
+            
+        Returns:
+            int: Number of connections warmed per pool
+        """
+        count = await asyncio.to_thread(self.prewarm, connections)
+        
+        client = self.async_client or self._lazy_async_client()
+        await asyncio.gather(*(client.ping() for _ in range(count)))
+        
+        logger.info(f"Prewarmed {count} Redis connections per pool")
+        return count
+    
+    def _get_server_info(self) -> Dict[str, Any]:
+        """
+        Get the clients and memory INFO sections, cached for info_cache_ttl.
+        
+        Returns:
+            dict: Merged INFO fields from both sections
+        """
+        now = time.monotonic()
+        cached_at, info = self._info_cache
+        if info is not None and now - cached_at < self.info_cache_ttl:
+            return info
+        
+        redis_client = self.client or self._lazy_client()
+        
+        # Two small sections in one round-trip instead of the full INFO dump
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.info("clients")
+            pipe.info("memory")
+            clients, memory = pipe.execute()
+        
+        info = {**clients, **memory}
+        self._info_cache = (now, info)
+        return info
+    
     def get_connection_info(self) -> Dict[str, Any]:
         """
         Get Redis connection pool information for monitoring.
@@ -408,17 +1066,16 @@ class RedisClient:
             return {"status": "not_initialized"}
         
         try:
-            with self.get_connection() as redis_client:
-                info = redis_client.info()
-                return {
-                    "status": "connected" if self._initialized else "disconnected",
-                    "connected_clients": info.get("connected_clients", 0),
-                    "used_memory": info.get("used_memory_human", "unknown"),
-                    "active_sessions": self.get_active_session_count(),
-                    "max_concurrent_sessions": self.max_concurrent_sessions,
-                    "pool_created_connections": self.pool.created_connections,
-                    "pool_available_connections": len(self.pool._available_connections)
-                }
+            info = self._get_server_info()
+            return {
+                "status": "connected" if self._initialized else "disconnected",
+                "connected_clients": info.get("connected_clients", 0),
+                "used_memory": info.get("used_memory_human", "unknown"),
+                "active_sessions": self.get_active_session_count(),
+                "max_concurrent_sessions": self.max_concurrent_sessions,
+                "pool_created_connections": self.pool.created_connections,
+                "pool_available_connections": len(self.pool._available_connections)
+            }
         except Exception as e:
             logger.error(f"Failed to get Redis connection info: {e}")
             return {"status": "error", "error": str(e)}
@@ -429,10 +1086,31 @@ class RedisClient:
         
         Should be called during application shutdown.
         """
+        if self._flush_thread:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush_pending()
+        
         if self.pool:
             self.pool.disconnect()
             logger.info("Redis connection pool closed")
+        self.client = None
+        self._pending_pipe = None
         self._initialized = False
+    
+    async def aclose(self) -> None:
+        """
+        Close the sync pool and the asyncio client.
+        
+        Async counterpart of close() for event-loop shutdown hooks.
+        """
+        self.close()
+        
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+            logger.info("Async Redis client closed")
 
 
 # Global Redis client instance
@@ -457,6 +1135,13 @@ def close_redis() -> None:
     redis_client.close()
 
 
+async def close_redis_async() -> None:
+    """
+    Close sync and async Redis connections from an async shutdown hook.
+    """
+    await redis_client.aclose()
+
+
 def get_redis_client() -> RedisClient:
     """
     Get global Redis client instance.
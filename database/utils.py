@@ -3,19 +3,408 @@ Database utility functions for CRUD operations on orders and sessions.
 Provides high-level database operations with error handling and logging.
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import Future
+from cachetools import TTLCache
+from typing import Optional, List, Dict, Any, Iterator
+import orjson
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy.sql import func
+from sqlalchemy import desc, and_, or_, select, insert, delete, update, bindparam, text
 from sqlalchemy.exc import SQLAlchemyError
 from .connection import db_manager
-from .models import Order, ActiveSession
+from .models import (
+    Order, ActiveSession, ACTIVE_ORDER_SQL, bulk_insert, prune_expired_sessions
+)
 from .redis_client import redis_client
 
 # Configure logging for database utilities
 logger = logging.getLogger(__name__)
 
+# Minimum batch size for which bulk order loads switch from INSERT to COPY
+COPY_THRESHOLD = 100
+
+# Hot-path statements built once at import. Values travel as bind parameters,
+# so every call hits the same entry in the engine's compiled-statement cache
+# instead of rebuilding and recompiling a Query.
+_GET_ORDER_STMT = select(Order).where(Order.id == bindparam('id'))
+
+_GET_ORDERS_BY_PHONE_STMT = (
+    select(Order).options(lazyload('*'))
+    .where(Order.phone_number == bindparam('phone'))
+    .order_by(desc(Order.created_at))
+    .limit(bindparam('lim'))
+)
+
+_GET_ACTIVE_ORDERS_STMT = (
+    select(Order).options(lazyload('*'))
+    .where(text(ACTIVE_ORDER_SQL))
+    .order_by(Order.created_at)
+)
+
+_GET_ORDERS_BY_STATUS_STMT = (
+    select(Order).options(lazyload('*'))
+    .where(Order.order_status == bindparam('status'))
+    .order_by(desc(Order.created_at))
+)
+
+# Per-process read-through cache for get_order: status polls and webhook
+# retries re-read the same order within seconds. Cached orders are detached
+# and shared between callers, so they must be treated as read-only.
+_order_cache: TTLCache = TTLCache(maxsize=4096, ttl=5)
+_order_cache_lock = threading.Lock()
+
+# Single-statement status mutators: no SELECT of the row and no ORM flush
+_UPDATE_ORDER_STATUS_STMT = (
+    update(Order)
+    .where(Order.id == bindparam('oid'))
+    .values(order_status=bindparam('status'), updated_at=func.current_timestamp())
+    .execution_options(synchronize_session=False)
+)
+
+_UPDATE_PAYMENT_STATUS_STMT = (
+    update(Order)
+    .where(Order.id == bindparam('oid'))
+    .values(payment_status=bindparam('status'), updated_at=func.current_timestamp())
+    .execution_options(synchronize_session=False)
+)
+
+# Payment status update that merges payment_details into the order_details
+# JSON on the server, in the same statement, per dialect
+_SET_PAYMENT_DETAILS_SQL = {
+    'postgresql': (
+        "UPDATE orders SET order_details = jsonb_set("
+        "coalesce(order_details::jsonb, '{}'::jsonb), '{payment_details}', CAST(:details AS jsonb))::json, "
+        "payment_status = :status, updated_at = CURRENT_TIMESTAMP WHERE id = :oid"
+    ),
+    'sqlite': (
+        "UPDATE orders SET order_details = json_set("
+        "coalesce(order_details, '{}'), '$.payment_details', json(:details)), "
+        "payment_status = :status, updated_at = CURRENT_TIMESTAMP WHERE id = :oid"
+    ),
+}
+_SET_PAYMENT_DETAILS_STMTS = {
+    dialect: text(sql).bindparams(bindparam('status', type_=Order.__table__.c.payment_status.type))
+    for dialect, sql in _SET_PAYMENT_DETAILS_SQL.items()
+}
+
+_GET_SESSION_STMT = select(ActiveSession).where(ActiveSession.session_id == bindparam('session_id'))
+
+# Planner row estimate; PostgreSQL-only, read instead of a COUNT(*) scan
+_ESTIMATE_SESSION_COUNT_STMT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'active_sessions'::regclass"
+)
+
+_DELETE_SESSION_STMT = delete(ActiveSession).where(ActiveSession.session_id == bindparam('session_id'))
+
+
+def _order_columns(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Order column values from caller-supplied data, with default statuses."""
+    return {
+        'customer_name': data['customer_name'],
+        'phone_number': data['phone_number'],
+        'address': data['address'],
+        'order_details': data['order_details'],
+        'total_amount': data['total_amount'],
+        'estimated_delivery': data['estimated_delivery'],
+        'payment_method': data['payment_method'],
+        'payment_status': data.get('payment_status', 'pending'),
+        'order_status': data.get('order_status', 'pending'),
+        'interface_type': data['interface_type']
+    }
+
+
+def _session_columns(session_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """ActiveSession column values from caller-supplied session data."""
+    return {
+        'session_id': session_id,
+        'customer_phone': data.get('customer_phone'),
+        'interface_type': data['interface_type'],
+        'agent_state': data.get('agent_state', 'greeting'),
+        'order_data': data.get('order_data')
+    }
+
+
+def _create_order_operation(session: Session, data: Dict[str, Any]) -> Order:
+    """Insert one order, getting the stored row back from the same statement."""
+    order = Order.insert_one(session, _order_columns(data))
+    
+    # Pass the model as an argument so __repr__ only runs if the record is emitted
+    logger.info("Order created: %r", order)
+    return order
+
+
+def _cached_order(order_id: int) -> Optional[Order]:
+    """Return the cached order for order_id, if any."""
+    with _order_cache_lock:
+        return _order_cache.get(order_id)
+
+
+def _cache_order(order_id: int, order: Optional[Order]) -> Optional[Order]:
+    """Remember a found order in the per-process cache and return it."""
+    if order is not None:
+        with _order_cache_lock:
+            _order_cache[order_id] = order
+    return order
+
+
+def _invalidate_order(order_id: int) -> None:
+    """Drop an order from the per-process cache after it changes."""
+    with _order_cache_lock:
+        _order_cache.pop(order_id, None)
+
+
+def _get_order_operation(session: Session, order_id: int) -> Optional[Order]:
+    """Load one order by primary key."""
+    order = session.execute(_GET_ORDER_STMT, {'id': order_id}).scalar_one_or_none()
+    if order:
+        # Detach before commit so the loaded attributes aren't expired
+        session.expunge(order)
+        logger.debug(f"Order retrieved: ID={order_id}")
+    else:
+        logger.debug(f"Order not found: ID={order_id}")
+    return order
+
+
+# ActiveSession columns mirrored from Redis session updates
+_SESSION_DB_COLUMNS = ('customer_phone', 'agent_state', 'order_data')
+
+# Executemany UPDATE keyed by session; the SET clause comes from each batch's
+# parameter keys, so one statement serves any subset of _SESSION_DB_COLUMNS
+_UPDATE_SESSION_STMT = update(ActiveSession.__table__).where(
+    ActiveSession.__table__.c.session_id == bindparam('sid')
+)
+
+
+class SessionWriteBuffer:
+    """
+    Write-behind buffer for ActiveSession updates.
+    
+    Redis is the authoritative copy of a live session, so the database row
+    only needs to catch up eventually. Updates are coalesced per session
+    (newest value per column wins) and written by a background thread every
+    flush_interval seconds, or inline once flush_threshold updates are
+    pending, as executemany UPDATEs in a single transaction.
+    """
+    
+    def __init__(self, flush_interval: float = 0.2, flush_threshold: int = 50):
+        """
+        Initialize an empty buffer; the flusher thread starts on first use.
+        
+        Args:
+            flush_interval (float): Seconds between background flushes
+            flush_threshold (int): Pending updates that trigger an inline flush
+        """
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+    
+    def put(self, session_id: str, updates: Dict[str, Any]) -> None:
+        """
+        Queue the database-backed fields of a session update.
+        
+        Args:
+            session_id (str): Session identifier
+            updates (dict): Fields to update; fields without a column are ignored
+        """
+        columns = {name: updates[name] for name in _SESSION_DB_COLUMNS if name in updates}
+        if not columns:
+            return
+        
+        with self._lock:
+            self._pending.setdefault(session_id, {}).update(columns)
+            self._pending_count += 1
+            flush_now = self._pending_count >= self.flush_threshold
+            
+            if self._flush_thread is None:
+                self._flush_stop.clear()
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="session-write-behind", daemon=True
+                )
+                self._flush_thread.start()
+        
+        if flush_now:
+            self.flush()
+    
+    def discard(self, session_id: str) -> None:
+        """Drop pending updates for a session that is being deleted."""
+        with self._lock:
+            self._pending.pop(session_id, None)
+    
+    def flush(self) -> int:
+        """
+        Write all pending session updates now.
+        
+        Returns:
+            int: Number of sessions written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+        
+        if not pending:
+            return 0
+        
+        # Group rows by column set so each group is one executemany
+        batches: Dict[tuple, List[Dict[str, Any]]] = {}
+        for session_id, columns in pending.items():
+            batches.setdefault(tuple(sorted(columns)), []).append(dict(columns, sid=session_id))
+        
+        def _flush_operation(session: Session) -> None:
+            for rows in batches.values():
+                session.execute(_UPDATE_SESSION_STMT, rows)
+        
+        try:
+            db_manager.execute_with_retry(_flush_operation)
+            logger.debug("Flushed %d buffered session updates", len(pending))
+            return len(pending)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(pending)} buffered session updates: {e}")
+            self._requeue(pending)
+            return 0
+    
+    def _requeue(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Put updates from a failed flush back for the next one.
+        
+        Columns updated again since the flush began keep their newer value.
+        """
+        with self._lock:
+            for session_id, columns in pending.items():
+                newer = self._pending.get(session_id)
+                self._pending[session_id] = dict(columns, **newer) if newer else columns
+            self._pending_count += len(pending)
+    
+    def _flush_loop(self) -> None:
+        """Background thread body: flush pending updates every flush_interval."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self) -> None:
+        """
+        Stop the flusher thread and write anything still pending.
+        
+        Should be called during application shutdown.
+        """
+        with self._lock:
+            thread, self._flush_thread = self._flush_thread, None
+        
+        if thread:
+            self._flush_stop.set()
+            thread.join()
+        self.flush()
+
+
+# Global write-behind buffer for session updates
+session_write_buffer = SessionWriteBuffer()
+
+# Cache-aside for database session lookups that missed Redis. Found rows are
+# cached briefly; misses are cached as a sentinel so repeated lookups of an
+# unknown ID (probes, polling during repopulation) don't each hit the DB.
+_SESSION_DB_CACHE_PREFIX = "session_db:"
+_SESSION_DB_CACHE_TTL = 60
+_SESSION_MISS = "__MISS__"
+_SESSION_MISS_TTL = 10
+
+# Single-flight: concurrent DB lookups of one session share the first caller's query
+_session_loads: Dict[str, Future] = {}
+_session_loads_lock = threading.Lock()
+
+
+def _get_session_operation(session: Session, session_id: str) -> Optional[Dict[str, Any]]:
+    """Load one session row as a dict."""
+    db_session = session.execute(
+        _GET_SESSION_STMT, {'session_id': session_id}
+    ).scalar_one_or_none()
+    
+    if db_session:
+        logger.debug(f"Session retrieved from database: {session_id}")
+        return db_session.to_dict()
+    else:
+        logger.debug(f"Session not found: {session_id}")
+        return None
+
+
+def _create_session_operation(session: Session, session_id: str, data: Dict[str, Any]) -> bool:
+    """Insert one session row."""
+    # Plain Core INSERT; no ORM instance is needed for a bool result
+    session.execute(insert(ActiveSession), _session_columns(session_id, data))
+    
+    logger.info(f"Session created: {session_id} ({data['interface_type']})")
+    return True
+
+
+def _update_session_operation(session: Session, session_id: str, updates: Dict[str, Any]) -> bool:
+    """Apply session field updates to the database row."""
+    db_session = session.query(ActiveSession).filter(
+        ActiveSession.session_id == session_id
+    ).first()
+    
+    if not db_session:
+        logger.warning(f"Cannot update non-existent session: {session_id}")
+        return False
+    
+    # Update fields
+    if 'customer_phone' in updates:
+        db_session.customer_phone = updates['customer_phone']
+    if 'agent_state' in updates:
+        db_session.agent_state = updates['agent_state']
+    if 'order_data' in updates:
+        db_session.order_data = updates['order_data']
+    
+    logger.debug(f"Session updated in database: {session_id}")
+    return True
+
+
+def _delete_session_operation(session: Session, session_id: str) -> bool:
+    """Delete one session row."""
+    deleted = session.execute(
+        _DELETE_SESSION_STMT, {'session_id': session_id},
+        execution_options={'synchronize_session': False}
+    ).rowcount
+    
+    if deleted:
+        logger.info(f"Session deleted from database: {session_id}")
+        return True
+    else:
+        logger.warning(f"Session not found in database for deletion: {session_id}")
+        return False
+
+
+def _load_session_single_flight(session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a session from the database, joining an in-flight load if one exists.
+    
+    The first caller for a session ID runs the query; callers arriving while
+    it runs wait for and share its result instead of issuing their own.
+    """
+    with _session_loads_lock:
+        future = _session_loads.get(session_id)
+        leader = future is None
+        if leader:
+            future = _session_loads[session_id] = Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        result = db_manager.execute_with_retry(_get_session_operation, session_id)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _session_loads_lock:
+            _session_loads.pop(session_id, None)
+
 
 class OrderManager:
     """
@@ -38,28 +427,6 @@ class OrderManager:
             Order: Created order instance or None if failed
         """
         try:
-            def _create_order_operation(session: Session, data: Dict[str, Any]) -> Order:
-                # Create new order instance
-                order = Order(
-                    customer_name=data['customer_name'],
-                    phone_number=data['phone_number'], 
-                    address=data['address'],
-                    order_details=data['order_details'],
-                    total_amount=data['total_amount'],
-                    estimated_delivery=data['estimated_delivery'],
-                    payment_method=data['payment_method'],
-                    payment_status=data.get('payment_status', 'pending'),
-                    order_status=data.get('order_status', 'pending'),
-                    interface_type=data['interface_type']
-                )
-                
-                # Add to session and flush to get ID
-                session.add(order)
-                session.flush()
-                
-                logger.info(f"Order created: ID={order.id}, Customer={order.customer_name}, Total=${order.total_amount}")
-                return order
-            
             # Execute with retry logic
             return db_manager.execute_with_retry(_create_order_operation, order_data)
             
@@ -67,6 +434,90 @@ class OrderManager:
             logger.error(f"Failed to create order: {e}")
             return None
     
+    @staticmethod
+    async def acreate_order(order_data: Dict[str, Any]) -> Optional[Order]:
+        """
+        Async version of create_order using the shared async connection pool.
+        
+        Args:
+            order_data (dict): Order information including customer details,
+                             order items, payment info, etc.
+                             
+        Returns:
+            Order: Created order instance or None if failed
+        """
+        try:
+            return await db_manager.execute_async_with_retry(_create_order_operation, order_data)
+            
+        except Exception as e:
+            logger.error(f"Failed to create order: {e}")
+            return None
+    
+    @staticmethod
+    def create_orders_bulk(orders_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many orders in a single multi-row INSERT.
+        
+        Args:
+            orders_data (list): Order dicts with the same keys create_order accepts
+        
+        Returns:
+            list: IDs of the created orders, or an empty list if failed
+        """
+        if not orders_data:
+            return []
+        
+        try:
+            def _create_orders_bulk_operation(session: Session, orders: List[Dict[str, Any]]) -> List[int]:
+                rows = [_order_columns(data) for data in orders]
+                
+                order_ids = Order.insert_many(session, rows)
+                logger.info("Bulk created %d orders", len(order_ids))
+                return order_ids
+            
+            return db_manager.execute_with_retry(_create_orders_bulk_operation, orders_data)
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk create {len(orders_data)} orders: {e}")
+            return []
+    
+    @staticmethod
+    def bulk_copy_orders(orders_data: List[Dict[str, Any]]) -> int:
+        """
+        Load a large batch of orders, using PostgreSQL COPY when it pays off.
+        
+        Batches of at least COPY_THRESHOLD rows on PostgreSQL are streamed
+        with COPY; smaller batches and other backends use the multi-row
+        INSERT of create_orders_bulk. Intended for imports and replays where
+        the new order IDs are not needed.
+        
+        Args:
+            orders_data (list): Order dicts with the same keys create_order accepts
+            
+        Returns:
+            int: Number of orders loaded, or 0 if failed
+        """
+        if not orders_data:
+            return 0
+        
+        try:
+            def _bulk_copy_orders_operation(session: Session, orders: List[Dict[str, Any]]) -> int:
+                rows = [_order_columns(data) for data in orders]
+                
+                if len(rows) >= COPY_THRESHOLD and session.get_bind().dialect.name == 'postgresql':
+                    loaded = Order.copy_many(session, rows)
+                else:
+                    loaded = len(Order.insert_many(session, rows))
+                
+                logger.info("Bulk loaded %d orders", loaded)
+                return loaded
+            
+            return db_manager.execute_with_retry(_bulk_copy_orders_operation, orders_data)
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk load {len(orders_data)} orders: {e}")
+            return 0
+    
     @staticmethod
     def get_order(order_id: int) -> Optional[Order]:
         """
@@ -76,18 +527,38 @@ class OrderManager:
             order_id (int): Order identifier
             
         Returns:
-            Order: Order instance or None if not found
+            Order: Order instance or None if not found; read-only, as it
+                   may be shared through the per-process cache
         """
+        order = _cached_order(order_id)
+        if order is not None:
+            return order
+        
         try:
-            def _get_order_operation(session: Session, order_id: int) -> Optional[Order]:
-                order = session.query(Order).filter(Order.id == order_id).first()
-                if order:
-                    logger.debug(f"Order retrieved: ID={order_id}")
-                else:
-                    logger.debug(f"Order not found: ID={order_id}")
-                return order
+            return _cache_order(order_id, db_manager.execute_with_retry(_get_order_operation, order_id))
+            
+        except Exception as e:
+            logger.error(f"Failed to get order {order_id}: {e}")
+            return None
+    
+    @staticmethod
+    async def aget_order(order_id: int) -> Optional[Order]:
+        """
+        Async version of get_order using the shared async connection pool.
+        
+        Args:
+            order_id (int): Order identifier
             
-            return db_manager.execute_with_retry(_get_order_operation, order_id)
+        Returns:
+            Order: Order instance or None if not found; read-only, as it
+                   may be shared through the per-process cache
+        """
+        order = _cached_order(order_id)
+        if order is not None:
+            return order
+        
+        try:
+            return _cache_order(order_id, await db_manager.execute_async_with_retry(_get_order_operation, order_id))
             
         except Exception as e:
             logger.error(f"Failed to get order {order_id}: {e}")
@@ -107,19 +578,17 @@ class OrderManager:
         """
         try:
             def _update_status_operation(session: Session, order_id: int, status: str) -> bool:
-                order = session.query(Order).filter(Order.id == order_id).first()
-                if not order:
+                result = session.execute(_UPDATE_ORDER_STATUS_STMT, {'oid': order_id, 'status': status})
+                if result.rowcount != 1:
                     logger.warning(f"Cannot update status for non-existent order: {order_id}")
                     return False
                 
-                old_status = order.order_status
-                order.order_status = status
-                order.updated_at = datetime.utcnow()
-                
-                logger.info(f"Order {order_id} status updated: {old_status} -> {status}")
+                logger.info(f"Order {order_id} status updated to {status}")
                 return True
             
-            return db_manager.execute_with_retry(_update_status_operation, order_id, status)
+            updated = db_manager.execute_with_retry(_update_status_operation, order_id, status)
+            _invalidate_order(order_id)
+            return updated
             
         except Exception as e:
             logger.error(f"Failed to update order {order_id} status: {e}")
@@ -140,25 +609,25 @@ class OrderManager:
         """
         try:
             def _update_payment_operation(session: Session, order_id: int, status: str, details: Optional[Dict]) -> bool:
-                order = session.query(Order).filter(Order.id == order_id).first()
-                if not order:
+                # One UPDATE either way: payment details are merged into the
+                # JSON column server-side rather than read, merged and rewritten
+                if details:
+                    stmt = _SET_PAYMENT_DETAILS_STMTS[session.get_bind().dialect.name]
+                    params = {'oid': order_id, 'status': status, 'details': orjson.dumps(details).decode()}
+                else:
+                    stmt = _UPDATE_PAYMENT_STATUS_STMT
+                    params = {'oid': order_id, 'status': status}
+                
+                if session.execute(stmt, params).rowcount != 1:
                     logger.warning(f"Cannot update payment for non-existent order: {order_id}")
                     return False
                 
-                old_status = order.payment_status
-                order.payment_status = status
-                order.updated_at = datetime.utcnow()
-                
-                # Update order details with payment information if provided
-                if details:
-                    if not order.order_details:
-                        order.order_details = {}
-                    order.order_details.update({"payment_details": details})
-                
-                logger.info(f"Order {order_id} payment status updated: {old_status} -> {status}")
+                logger.info(f"Order {order_id} payment status updated to {status}")
                 return True
             
-            return db_manager.execute_with_retry(_update_payment_operation, order_id, payment_status, payment_details)
+            updated = db_manager.execute_with_retry(_update_payment_operation, order_id, payment_status, payment_details)
+            _invalidate_order(order_id)
+            return updated
             
         except Exception as e:
             logger.error(f"Failed to update order {order_id} payment status: {e}")
@@ -178,9 +647,9 @@ class OrderManager:
         """
         try:
             def _get_orders_by_phone_operation(session: Session, phone: str, limit: int) -> List[Order]:
-                orders = session.query(Order).filter(
-                    Order.phone_number == phone
-                ).order_by(desc(Order.created_at)).limit(limit).all()
+                orders = session.execute(
+                    _GET_ORDERS_BY_PHONE_STMT, {'phone': phone, 'lim': limit}
+                ).scalars().all()
                 
                 logger.debug(f"Retrieved {len(orders)} orders for phone: {phone}")
                 return orders
@@ -201,12 +670,7 @@ class OrderManager:
         """
         try:
             def _get_active_orders_operation(session: Session) -> List[Order]:
-                orders = session.query(Order).filter(
-                    and_(
-                        Order.order_status.in_(['pending', 'preparing', 'ready']),
-                        Order.payment_status == 'completed'
-                    )
-                ).order_by(Order.created_at).all()
+                orders = session.execute(_GET_ACTIVE_ORDERS_STMT).scalars().all()
                 
                 logger.debug(f"Retrieved {len(orders)} active orders")
                 return orders
@@ -230,9 +694,7 @@ class OrderManager:
         """
         try:
             def _get_orders_by_status_operation(session: Session, status: str) -> List[Order]:
-                orders = session.query(Order).filter(
-                    Order.order_status == status
-                ).order_by(desc(Order.created_at)).all()
+                orders = session.execute(_GET_ORDERS_BY_STATUS_STMT, {'status': status}).scalars().all()
                 
                 logger.debug(f"Retrieved {len(orders)} orders with status: {status}")
                 return orders
@@ -242,6 +704,29 @@ class OrderManager:
         except Exception as e:
             logger.error(f"Failed to get orders by status {status}: {e}")
             return []
+    
+    @staticmethod
+    def iter_orders_by_status(status: str, batch_size: int = 500) -> Iterator[List[Order]]:
+        """
+        Stream orders with a status in batches, for exports and other bulk readers.
+        
+        Rows come from a server-side cursor and are hydrated batch_size at a
+        time, so peak memory is one batch rather than the whole result. The
+        session stays open until the iterator is exhausted or closed, and a
+        streaming read can't be retried midway, so this bypasses
+        execute_with_retry.
+        
+        Args:
+            status (str): Order status to filter by
+            batch_size (int): Orders per yielded batch
+            
+        Yields:
+            list: Order instances, newest first across batches
+        """
+        stmt = _GET_ORDERS_BY_STATUS_STMT.execution_options(stream_results=True, yield_per=batch_size)
+        
+        with db_manager.get_session() as session:
+            yield from session.scalars(stmt, {'status': status}).partitions()
 
 
 class SessionManager:
@@ -272,22 +757,8 @@ class SessionManager:
                 return False
             
             # Create session in database for persistence
-            def _create_session_operation(session: Session, session_id: str, data: Dict[str, Any]) -> bool:
-                db_session = ActiveSession(
-                    session_id=session_id,
-                    customer_phone=data.get('customer_phone'),
-                    interface_type=data['interface_type'],
-                    agent_state=data.get('agent_state', 'greeting'),
-                    order_data=data.get('order_data')
-                )
-                
-                session.add(db_session)
-                session.flush()
-                
-                logger.info(f"Session created: {session_id} ({data['interface_type']})")
-                return True
-            
             db_success = db_manager.execute_with_retry(_create_session_operation, session_id, session_data)
+            redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
             
             if not db_success:
                 # Cleanup Redis session if database creation failed
@@ -302,11 +773,94 @@ class SessionManager:
             redis_client.delete_session(session_id)
             return False
     
+    @staticmethod
+    async def acreate_session(session_id: str, session_data: Dict[str, Any]) -> bool:
+        """
+        Async version of create_session.
+        
+        The Redis and database writes are independent, so they run
+        concurrently and the call takes as long as the slower of the two.
+        If only one side succeeds, that side is rolled back.
+        
+        Args:
+            session_id (str): Unique session identifier
+            session_data (dict): Session information and state
+            
+        Returns:
+            bool: True if session created successfully
+        """
+        redis_success, db_success = await asyncio.gather(
+            redis_client.acreate_session(session_id, session_data),
+            db_manager.execute_async_with_retry(_create_session_operation, session_id, session_data),
+            return_exceptions=True
+        )
+        redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
+        
+        redis_ok = redis_success is True
+        db_ok = db_success is True
+        if redis_ok and db_ok:
+            return True
+        
+        if isinstance(db_success, BaseException):
+            logger.error(f"Failed to create session {session_id}: {db_success}")
+        if not redis_ok:
+            logger.warning(f"Failed to create Redis session: {session_id}")
+        
+        # Compensate for whichever write went through
+        try:
+            if redis_ok:
+                await redis_client.adelete_session(session_id)
+            if db_ok:
+                await db_manager.execute_async_with_retry(_delete_session_operation, session_id)
+        except Exception as e:
+            logger.error(f"Failed to roll back partial session {session_id}: {e}")
+        return False
+    
+    @staticmethod
+    def create_sessions_bulk(sessions_data: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Create many active sessions with a single database INSERT.
+        
+        Each session still passes Redis admission control individually;
+        only the admitted sessions are written to the database, in one
+        multi-row statement.
+        
+        Args:
+            sessions_data (dict): Session data keyed by session identifier
+        
+        Returns:
+            list: IDs of the sessions created in both Redis and the database
+        """
+        admitted = [
+            session_id for session_id, data in sessions_data.items()
+            if redis_client.create_session(session_id, data)
+        ]
+        if not admitted:
+            return []
+        
+        try:
+            rows = [_session_columns(session_id, sessions_data[session_id]) for session_id in admitted]
+            
+            db_manager.execute_with_retry(bulk_insert, ActiveSession, rows)
+            logger.info("Bulk created %d sessions", len(admitted))
+            return admitted
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk create {len(admitted)} sessions: {e}")
+            # Cleanup Redis sessions so the two stores stay consistent
+            for session_id in admitted:
+                redis_client.delete_session(session_id)
+            return []
+    
     @staticmethod
     def get_session(session_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve session data, preferring Redis for speed.
         
+        On a Redis miss the database result, or the fact that there is none,
+        is cached briefly, and concurrent lookups of the same ID share a
+        single query.
+        
         Args:
             session_id (str): Session identifier
             
@@ -320,20 +874,23 @@ class SessionManager:
                 logger.debug(f"Session retrieved from Redis: {session_id}")
                 return session_data
             
-            # Fallback to database
-            def _get_session_operation(session: Session, session_id: str) -> Optional[Dict[str, Any]]:
-                db_session = session.query(ActiveSession).filter(
-                    ActiveSession.session_id == session_id
-                ).first()
-                
-                if db_session:
-                    logger.debug(f"Session retrieved from database: {session_id}")
-                    return db_session.to_dict()
-                else:
-                    logger.debug(f"Session not found: {session_id}")
-                    return None
+            # Fallback to database, through the cache-aside entry. Read it from
+            # Redis only: a miss copied into this process's local cache would
+            # outlive the cache_delete another worker issues on create_session
+            cache_key = _SESSION_DB_CACHE_PREFIX + session_id
+            cached = redis_client.cache_get(cache_key, local=False)
+            if cached == _SESSION_MISS:
+                logger.debug(f"Session not found (cached): {session_id}")
+                return None
+            if cached is not None:
+                return cached
             
-            return db_manager.execute_with_retry(_get_session_operation, session_id)
+            session_data = _load_session_single_flight(session_id)
+            if session_data is not None:
+                redis_client.cache_set(cache_key, session_data, ttl=_SESSION_DB_CACHE_TTL)
+            else:
+                redis_client.cache_set(cache_key, _SESSION_MISS, ttl=_SESSION_MISS_TTL)
+            return session_data
             
         except Exception as e:
             logger.error(f"Failed to get session {session_id}: {e}")
@@ -342,7 +899,12 @@ class SessionManager:
     @staticmethod
     def update_session(session_id: str, updates: Dict[str, Any]) -> bool:
         """
-        Update session data in both Redis and database.
+        Update session data in Redis, with the database following behind.
+        
+        When Redis accepts the update, the database write is queued on
+        session_write_buffer instead of costing a round-trip per turn. If
+        Redis is unavailable or lacks the session, the database row is
+        updated directly.
         
         Args:
             session_id (str): Session identifier
@@ -355,31 +917,50 @@ class SessionManager:
             # Update Redis session
             redis_success = redis_client.update_session(session_id, updates)
             
-            # Update database session
-            def _update_session_operation(session: Session, session_id: str, updates: Dict[str, Any]) -> bool:
-                db_session = session.query(ActiveSession).filter(
-                    ActiveSession.session_id == session_id
-                ).first()
-                
-                if not db_session:
-                    logger.warning(f"Cannot update non-existent session: {session_id}")
-                    return False
-                
-                # Update fields
-                if 'customer_phone' in updates:
-                    db_session.customer_phone = updates['customer_phone']
-                if 'agent_state' in updates:
-                    db_session.agent_state = updates['agent_state']
-                if 'order_data' in updates:
-                    db_session.order_data = updates['order_data']
-                
-                logger.debug(f"Session updated in database: {session_id}")
+            if redis_success:
+                # Redis is authoritative; the database catches up in batches
+                session_write_buffer.put(session_id, updates)
+                logger.debug("Session updated: %s (DB write queued)", session_id)
                 return True
             
+            # Update database session
             db_success = db_manager.execute_with_retry(_update_session_operation, session_id, updates)
+            redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
             
             logger.debug(f"Session updated: {session_id} (Redis: {redis_success}, DB: {db_success})")
-            return redis_success or db_success  # Success if either succeeds
+            return db_success
+            
+        except Exception as e:
+            logger.error(f"Failed to update session {session_id}: {e}")
+            return False
+    
+    @staticmethod
+    async def aupdate_session(session_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Async version of update_session.
+        
+        A Redis hit keeps the queued database write, so the only awaited
+        round-trip is Redis; the database is written directly only when
+        Redis can't take the update.
+        
+        Args:
+            session_id (str): Session identifier
+            updates (dict): Fields to update
+            
+        Returns:
+            bool: True if update successful
+        """
+        try:
+            if await redis_client.aupdate_session(session_id, updates):
+                session_write_buffer.put(session_id, updates)
+                logger.debug("Session updated: %s (DB write queued)", session_id)
+                return True
+            
+            db_success = await db_manager.execute_async_with_retry(_update_session_operation, session_id, updates)
+            redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
+            
+            logger.debug(f"Session updated: {session_id} (Redis: False, DB: {db_success})")
+            return db_success
             
         except Exception as e:
             logger.error(f"Failed to update session {session_id}: {e}")
@@ -397,22 +978,12 @@ class SessionManager:
             bool: True if deletion successful
         """
         try:
-            # Delete from Redis
+            # Delete from Redis and drop any queued database writes
             redis_success = redis_client.delete_session(session_id)
+            session_write_buffer.discard(session_id)
+            redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
             
             # Delete from database
-            def _delete_session_operation(session: Session, session_id: str) -> bool:
-                deleted = session.query(ActiveSession).filter(
-                    ActiveSession.session_id == session_id
-                ).delete()
-                
-                if deleted:
-                    logger.info(f"Session deleted from database: {session_id}")
-                    return True
-                else:
-                    logger.warning(f"Session not found in database for deletion: {session_id}")
-                    return False
-            
             db_success = db_manager.execute_with_retry(_delete_session_operation, session_id)
             
             logger.info(f"Session deleted: {session_id} (Redis: {redis_success}, DB: {db_success})")
@@ -422,6 +993,32 @@ class SessionManager:
             logger.error(f"Failed to delete session {session_id}: {e}")
             return False
     
+    @staticmethod
+    async def adelete_session(session_id: str) -> bool:
+        """
+        Async version of delete_session; Redis and the database are
+        cleared concurrently.
+        
+        Args:
+            session_id (str): Session identifier
+            
+        Returns:
+            bool: True if deletion successful
+        """
+        session_write_buffer.discard(session_id)
+        redis_client.cache_delete(_SESSION_DB_CACHE_PREFIX + session_id)
+        
+        redis_success, db_success = await asyncio.gather(
+            redis_client.adelete_session(session_id),
+            db_manager.execute_async_with_retry(_delete_session_operation, session_id),
+            return_exceptions=True
+        )
+        if isinstance(db_success, BaseException):
+            logger.error(f"Failed to delete session {session_id} from database: {db_success}")
+        
+        logger.info(f"Session deleted: {session_id} (Redis: {redis_success}, DB: {db_success})")
+        return redis_success is True or db_success is True
+    
     @staticmethod
     def get_active_sessions() -> List[Dict[str, Any]]:
         """
@@ -431,14 +1028,9 @@ class SessionManager:
             list: List of active session data
         """
         try:
-            # Use Redis for real-time session data
+            # Use Redis for real-time session data, fetched in one pipeline
             session_ids = redis_client.get_active_sessions()
-            sessions = []
-            
-            for session_id in session_ids:
-                session_data = redis_client.get_session(session_id)
-                if session_data:
-                    sessions.append(session_data)
+            sessions = list(redis_client.get_sessions_bulk(session_ids).values())
             
             logger.debug(f"Retrieved {len(sessions)} active sessions from Redis")
             return sessions
@@ -472,16 +1064,8 @@ class SessionManager:
             # Clean up Redis sessions
             redis_cleaned = redis_client.cleanup_expired_sessions()
             
-            # Clean up database sessions (older than 30 minutes)
-            def _cleanup_db_sessions_operation(session: Session) -> int:
-                cutoff_time = datetime.utcnow() - timedelta(minutes=30)
-                deleted = session.query(ActiveSession).filter(
-                    ActiveSession.created_at < cutoff_time
-                ).delete()
-                
-                return deleted
-            
-            db_cleaned = db_manager.execute_with_retry(_cleanup_db_sessions_operation)
+            # Clean up database sessions (older than 30 minutes) in batches
+            db_cleaned = db_manager.execute_with_retry(prune_expired_sessions)
             
             total_cleaned = redis_cleaned + (db_cleaned or 0)
             if total_cleaned > 0:
@@ -498,22 +1082,33 @@ class SessionManager:
         """
         Get current count of active sessions.
         
+        Redis holds the exact count. When it is unreachable, PostgreSQL
+        reports the planner's row estimate for active_sessions, which is
+        O(1) where COUNT(*) would scan the table; that's close enough for
+        the dashboard.
+        
         Returns:
             int: Number of active sessions
         """
+        # Use Redis for real-time count
+        count = redis_client.get_active_session_count()
+        if count is not None:
+            return count
+        
+        # Fallback to database count
         try:
-            # Use Redis for real-time count
-            return redis_client.get_active_session_count()
-        except Exception:
-            # Fallback to database count
-            try:
-                def _get_session_count_operation(session: Session) -> int:
-                    return session.query(ActiveSession).count()
-                
-                return db_manager.execute_with_retry(_get_session_count_operation)
-            except Exception as e:
-                logger.error(f"Failed to get session count: {e}")
-                return 0
+            def _get_session_count_operation(session: Session) -> int:
+                if session.get_bind().dialect.name == 'postgresql':
+                    estimate = session.execute(_ESTIMATE_SESSION_COUNT_STMT).scalar()
+                    # -1 (or no row) until the table is first vacuumed/analyzed
+                    if estimate is not None and estimate >= 0:
+                        return estimate
+                return session.execute(select(func.count()).select_from(ActiveSession)).scalar()
+            
+            return db_manager.execute_with_retry(_get_session_count_operation)
+        except Exception as e:
+            logger.error(f"Failed to get session count: {e}")
+            return 0
 
 
 # Convenience functions for common operations
@@ -2,18 +2,31 @@
 Pizza Agent - Voice-activated AI pizza ordering system
 Main FastAPI application entry point
 """
+import asyncio
+import inspect
 import logging
-import os
+import sys
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
-from typing import Optional, Dict, Any
+from typing import Awaitable, Callable, Optional, Dict, Any, Tuple, Union
+from decimal import Decimal
+import orjson
+from pydantic import BaseModel, Field
 import uvicorn
+from sqlalchemy import delete
 
+from config.http_client import make_http_client
 from config.settings import settings
 
+# Settings read on request paths, resolved once at import
+DEBUG = settings.debug
+MAX_CONCURRENT_CALLS = settings.max_concurrent_calls
+
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +36,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _root_payload() -> Dict[str, Any]:
+    """Basic API information served at /."""
+    return {
+        "message": "Pizza Agent API",
+        "description": "Voice-activated AI pizza ordering system",
+        "health_check": "/health",
+        "documentation": "/docs"
+    }
+
+
+def _health_payload() -> Dict[str, Any]:
+    """Health check body; built from settings, which don't change at runtime."""
+    # Basic health check - can be extended to check database, Redis, etc.
+    # TODO: Add actual health checks for:
+    # - Database connectivity
+    # - Redis connectivity  
+    # - External API status (OpenAI, Twilio, Stripe)
+    return {
+        "status": "healthy",
+        "service": "pizza-agent",
+        "version": "1.0.0",
+        "environment": settings.environment,
+        "max_concurrent_calls": MAX_CONCURRENT_CALLS,
+        "delivery_radius_miles": settings.delivery_radius_miles
+    }
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -30,20 +70,41 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting Pizza Agent application...")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Redis URL: {settings.redis_url}")
-    logger.info(f"Max concurrent calls: {settings.max_concurrent_calls}")
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Redis URL: %s", settings.redis_url)
+    logger.info("Max concurrent calls: %s", MAX_CONCURRENT_CALLS)
     
-    # Create audio directory for TTS files
-    audio_dir = "static/audio"
-    os.makedirs(audio_dir, exist_ok=True)
-    logger.info(f"Audio directory created: {audio_dir}")
+    # Bound concurrent agent work on the voice webhooks; requests that can't get
+    # a slot quickly are answered with the precomputed busy TwiML
+    app.state.voice_sem = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    app.state.busy_twiml = busy_response_twiml()
     
-    # Initialize database connection (will be implemented in database module)
-    # await init_database()
+    # Call status callbacks are acknowledged at once and applied in batches
+    app.state.status_queue = asyncio.Queue(maxsize=STATUS_QUEUE_MAXSIZE)
+    app.state.status_drainer = asyncio.create_task(_drain_status_queue(app.state.status_queue))
+    
+    # One pooled outbound HTTP client for the whole app, shared with the voice stack
+    app.state.http = make_http_client()
+    speech_processor.http_client = app.state.http
+    
+    # Initialize the database and its long-lived async connection pool
+    await init_database_async()
+    app.state.db_engine = db_manager.async_engine
+    app.state.db_sessionmaker = db_manager.AsyncSessionLocal
+    
+    # Initialize Redis
+    try:
+        redis_client.initialize()
+    except Exception as e:
+        logger.warning("Redis initialization failed (continuing without Redis): %s", e)
     
-    # Initialize Redis connection (will be implemented in database module)
-    # await init_redis()
+    # Open pooled connections now so the first requests don't pay for handshakes
+    try:
+        await db_manager.prewarm_async()
+        if redis_client._initialized:
+            await redis_client.aprewarm(MAX_CONCURRENT_CALLS)
+    except Exception as e:
+        logger.warning("Connection pool prewarm failed: %s", e)
     
     logger.info("Pizza Agent application startup complete")
     
@@ -52,11 +113,22 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Pizza Agent application...")
     
-    # Cleanup database connections
-    # await cleanup_database()
+    # Apply queued call status updates before the connections they use close
+    try:
+        await asyncio.wait_for(app.state.status_queue.join(), STATUS_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Dropping %s queued call status updates", app.state.status_queue.qsize())
+    app.state.status_drainer.cancel()
+    
+    # Write buffered session updates, then cleanup database connections
+    session_write_buffer.close()
+    await close_database_async()
     
     # Cleanup Redis connections
-    # await cleanup_redis()
+    await redis_client.aclose()
+    
+    # Close pooled outbound HTTP connections
+    await app.state.http.aclose()
     
     logger.info("Pizza Agent application shutdown complete")
 
@@ -66,20 +138,30 @@ app = FastAPI(
     title="Pizza Agent API",
     description="Voice-activated AI agent system for pizza ordering using LangChain/LangGraph",
     version="1.0.0",
-    lifespan=lifespan
+    # Schema and interactive docs only in debug; production never builds the
+    # OpenAPI tree or exposes /openapi.json
+    openapi_url="/openapi.json" if DEBUG else None,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url=None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson encoding for every JSON route
 )
 
+# Serialize the static probe payloads once; the handlers return the bytes.
+# Done at import rather than in lifespan so they exist even when the app is
+# served without running its lifespan (e.g. a bare TestClient).
+app.state.root_bytes = orjson.dumps(_root_payload())
+app.state.health_bytes = orjson.dumps(_health_payload())
+
 # Configure CORS for frontend access
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",    # React development server
-        "http://127.0.0.1:3000",   # Local development
-        "http://localhost:5173",   # Vite development server
-        "http://127.0.0.1:5173",   # Vite local
-        "https://pizza-dashboard.vercel.app",  # Production frontend (example)
-        "https://pizza-dashboard.netlify.app", # Alternative production (example)
-    ],
+    # React (3000) and Vite (5173) dev servers on localhost/127.0.0.1, plus the
+    # Vercel and Netlify production frontends (examples)
+    allow_origin_regex=(
+        r"http://(localhost|127\.0\.0\.1):(3000|5173)"
+        r"|https://pizza-dashboard\.(vercel|netlify)\.app"
+    ),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=[
@@ -99,51 +181,118 @@ app.add_middleware(
         "x-ratelimit-reset",
         "x-process-time",
         "x-request-id"
-    ]
+    ],
+    # Let browsers reuse a preflight for a day instead of re-sending OPTIONS
+    # before each dashboard poll
+    max_age=86400
 )
 
+# Compress larger JSON (dashboard, stats, exports); the 1 KB floor keeps small
+# webhook replies and probes uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-@app.get("/health")
-async def health_check():
+
+# Rendered JSON bodies for status and reference endpoints, keyed by endpoint:
+# (monotonic expiry, body). Every hit inside the TTL is a dict lookup with no
+# dict building or JSON encoding.
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+
+
+async def _cached_json_response(
+    key: str,
+    ttl: int,
+    build: Callable[[], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+) -> Response:
     """
-    Health check endpoint for monitoring and load balancers
-    Returns application status and basic metrics
+    Serve build()'s JSON from an in-process cache for ttl seconds.
+    
+    The response carries a matching Cache-Control header so proxies and
+    load balancers can reuse it too. In debug mode the cache is bypassed
+    and responses are marked no-store.
+    """
+    if DEBUG:
+        content = build()
+        if inspect.isawaitable(content):
+            content = await content
+        return ORJSONResponse(content, headers={"Cache-Control": "no-store"})
+    
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= now:
+        content = build()
+        if inspect.isawaitable(content):
+            content = await content
+        entry = _response_cache[key] = (now + ttl, ORJSONResponse(content).body)
+    
+    return Response(
+        content=entry[1],
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={ttl}"}
+    )
+
+
+# Per-key locks so only one coroutine per worker recomputes an expired
+# shared cache entry; created lazily inside the running loop
+_shared_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def _shared_cached_json_response(
+    key: str,
+    ttl: int,
+    build: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Response:
     """
+    Serve build()'s JSON from a Redis key shared by every worker for ttl seconds.
+    
+    On a miss one coroutine per worker recomputes and SETs the body with an
+    expiry while the others wait and then read its result. If Redis is
+    unavailable the body is computed directly.
+    """
+    client = redis_client.get_async_client()
     try:
-        # Basic health check - can be extended to check database, Redis, etc.
-        health_status = {
-            "status": "healthy",
-            "service": "pizza-agent",
-            "version": "1.0.0",
-            "environment": settings.environment,
-            "max_concurrent_calls": settings.max_concurrent_calls,
-            "delivery_radius_miles": settings.delivery_radius_miles
-        }
-        
-        # TODO: Add actual health checks for:
-        # - Database connectivity
-        # - Redis connectivity  
-        # - External API status (OpenAI, Twilio, Stripe)
-        
-        logger.debug("Health check successful")
-        return health_status
-        
+        cached = await client.get(key)
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        raise HTTPException(status_code=503, detail="Service unavailable")
+        logger.warning("Shared cache read failed for %s: %s", key, e)
+        return ORJSONResponse(await build())
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    lock = _shared_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = await client.get(key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
+        content = await build()
+        body = orjson.dumps(content)
+        if "error" not in content:
+            try:
+                await client.set(key, body, ex=ttl)
+            except Exception as e:
+                logger.warning("Shared cache write failed for %s: %s", key, e)
+    
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/health")
+async def health_check(request: Request):
+    """
+    Health check endpoint for monitoring and load balancers
+    Returns application status and basic metrics, pre-serialized at import
+    """
+    return Response(
+        content=request.app.state.health_bytes,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=5"}
+    )
 
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """
-    Root endpoint - basic API information
+    Root endpoint - basic API information, pre-serialized at import
     """
-    return {
-        "message": "Pizza Agent API",
-        "description": "Voice-activated AI pizza ordering system",
-        "health_check": "/health",
-        "documentation": "/docs"
-    }
+    return Response(content=request.app.state.root_bytes, media_type="application/json")
 
 
 @app.get("/status")
@@ -158,12 +307,15 @@ async def get_status():
     # - Recent orders count
     # - Agent availability
     
-    return {
-        "active_calls": 0,  # Placeholder
-        "max_calls": settings.max_concurrent_calls,
-        "system_load": "normal",  # Placeholder
-        "agent_status": "available"  # Placeholder
-    }
+    def _build_status() -> Dict[str, Any]:
+        return {
+            "active_calls": 0,  # Placeholder
+            "max_calls": MAX_CONCURRENT_CALLS,
+            "system_load": "normal",  # Placeholder
+            "agent_status": "available"  # Placeholder
+        }
+    
+    return await _cached_json_response("status", 2, _build_status)
 
 
 # Error handlers
@@ -172,33 +324,108 @@ async def not_found_handler(request, exc):
     """
     Custom 404 handler
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"message": "Endpoint not found", "path": str(request.url.path)}
     )
 
 
-@app.exception_handler(500)
+@app.exception_handler(Exception)
 async def internal_error_handler(request, exc):
     """
-    Custom 500 handler
+    Custom 500 handler for every unhandled exception
+    
+    Endpoints let unexpected errors propagate here instead of each wrapping
+    its body in its own try/except, so they are logged in one format.
     """
-    logger.error(f"Internal server error: {str(exc)}")
-    return JSONResponse(
+    logger.exception("Unhandled error on %s: %s", request.url.path, exc)
+    return ORJSONResponse(
         status_code=500,
-        content={"message": "Internal server error", "error": str(exc) if settings.debug else "Server error"}
+        content={"message": "Internal server error", "error": str(exc) if DEBUG else "Server error"}
     )
 
 
-# Import voice interface handlers
+# Handler dependencies, imported once here rather than inside each request.
+# They come after the app is created so modules importing main don't cycle.
 from voice.twilio_handler import (
     handle_incoming_call_webhook,
     handle_speech_webhook, 
-    handle_status_webhook,
-    handle_recording_webhook
+    handle_recording_webhook,
+    busy_response_twiml,
+    twilio_handler
 )
-from voice.session_manager import get_session_stats
-from fastapi.responses import PlainTextResponse
+from voice.session_manager import get_session_stats, cleanup_sessions, session_manager
+from voice.speech_processing import speech_processor
+from database.connection import db_manager, init_database_async, close_database_async
+from database.models import ActiveSession
+from database.redis_client import redis_client
+from database.utils import session_write_buffer
+from api.webhooks import handle_stripe_webhook
+from payment.stripe_client import stripe_client, create_payment_intent, confirm_payment
+
+
+# Longest a voice webhook waits for a free agent slot before answering busy
+VOICE_SLOT_TIMEOUT = 0.25
+
+# Call status batching: queue bound, most updates applied per batch, how long
+# (seconds) a batch waits to fill, and how long shutdown waits to drain
+STATUS_QUEUE_MAXSIZE = 10_000
+STATUS_BATCH_SIZE = 100
+STATUS_BATCH_WINDOW = 0.05
+STATUS_DRAIN_TIMEOUT = 5
+
+
+async def _drain_status_queue(queue: asyncio.Queue) -> None:
+    """
+    Apply queued call status updates until cancelled.
+    
+    Collects up to STATUS_BATCH_SIZE updates or whatever arrives within
+    STATUS_BATCH_WINDOW of the first, then applies the batch concurrently so
+    a burst of callbacks costs one round of session cleanup, not one each.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + STATUS_BATCH_WINDOW
+        while len(batch) < STATUS_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        results = await asyncio.gather(
+            *(twilio_handler.process_call_status(*update) for update in batch),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error applying call status update: %s", result)
+        for _ in batch:
+            queue.task_done()
+
+
+async def _run_voice_webhook(request: Request, handler: Callable[[Request], Awaitable[str]]) -> PlainTextResponse:
+    """
+    Run a TwiML-producing handler inside the voice concurrency limit.
+    
+    Over capacity, the caller hears the busy message with a 200 response, so
+    Twilio doesn't retry and requests don't pile up behind the semaphore.
+    """
+    voice_sem = request.app.state.voice_sem
+    try:
+        await asyncio.wait_for(voice_sem.acquire(), timeout=VOICE_SLOT_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Voice webhook over capacity, answering busy")
+        return PlainTextResponse(content=request.app.state.busy_twiml, media_type="application/xml")
+    
+    try:
+        twiml_response = await handler(request)
+    finally:
+        voice_sem.release()
+    return PlainTextResponse(content=twiml_response, media_type="application/xml")
 
 
 # Voice interface routes for Twilio webhooks
@@ -208,12 +435,7 @@ async def twilio_incoming_call(request: Request):
     Webhook endpoint for incoming Twilio calls.
     Returns TwiML response for call handling.
     """
-    try:
-        twiml_response = await handle_incoming_call_webhook(request)
-        return PlainTextResponse(content=twiml_response, media_type="application/xml")
-    except Exception as e:
-        logger.error(f"Error in incoming call webhook: {str(e)}")
-        raise HTTPException(status_code=500, detail="Call processing error")
+    return await _run_voice_webhook(request, handle_incoming_call_webhook)
 
 
 @app.post("/voice/speech", response_class=PlainTextResponse)
@@ -222,40 +444,51 @@ async def twilio_speech_input(request: Request):
     Webhook endpoint for speech input from Twilio.
     Processes speech and returns TwiML response.
     """
-    try:
-        twiml_response = await handle_speech_webhook(request)
-        return PlainTextResponse(content=twiml_response, media_type="application/xml")
-    except Exception as e:
-        logger.error(f"Error in speech webhook: {str(e)}")
-        raise HTTPException(status_code=500, detail="Speech processing error")
+    return await _run_voice_webhook(request, handle_speech_webhook)
 
 
-@app.post("/voice/status", response_class=PlainTextResponse)
+@app.post("/voice/status", status_code=204, response_class=Response)
 async def twilio_call_status(request: Request):
     """
     Webhook endpoint for call status updates from Twilio.
     Handles call completion, termination, etc.
+    
+    Always answers 204 with no body; Twilio only needs a 2xx, and
+    acknowledging failures too keeps it from retrying the callback.
+    The update is queued for the batch drainer; only when the queue is full
+    is it applied before answering.
     """
     try:
-        await handle_status_webhook(request)
-        return PlainTextResponse(content="", media_type="text/plain")
+        form_data = await request.form()
+        update = (form_data.get('CallSid'), form_data.get('CallStatus'), form_data.get('CallDuration'))
+        try:
+            request.app.state.status_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            logger.warning("Call status queue full; applying update for %s inline", update[0])
+            await twilio_handler.process_call_status(*update)
     except Exception as e:
-        logger.error(f"Error in status webhook: {str(e)}")
-        return PlainTextResponse(content="", media_type="text/plain")
+        logger.error("Error in status webhook: %s", e)
+    return Response(status_code=204)
 
 
-@app.post("/voice/recording-complete", response_class=PlainTextResponse)
+@app.post("/voice/recording-complete", status_code=204, response_class=Response)
 async def twilio_recording_complete(request: Request):
     """
     Webhook endpoint for recording completion from Twilio.
     Handles recording processing.
+    
+    Always answers 204 with no body, like the status callback.
     """
     try:
         await handle_recording_webhook(request)
-        return PlainTextResponse(content="", media_type="text/plain")
     except Exception as e:
-        logger.error(f"Error in recording webhook: {str(e)}")
-        return PlainTextResponse(content="", media_type="text/plain")
+        logger.error("Error in recording webhook: %s", e)
+    return Response(status_code=204)
+
+
+# Redis key and lifetime (seconds) of the shared session statistics body
+SESSION_STATS_CACHE_KEY = "sessions:stats"
+SESSION_STATS_CACHE_TTL = 2
 
 
 # Session management API endpoints
@@ -264,12 +497,11 @@ async def get_session_statistics():
     """
     Get current session management statistics.
     """
-    try:
-        stats = await get_session_stats()
-        return stats
-    except Exception as e:
-        logger.error(f"Error getting session stats: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to get session statistics")
+    # Polled by every dashboard; Redis-shared so all workers compute it
+    # at most once per TTL
+    return await _shared_cached_json_response(
+        SESSION_STATS_CACHE_KEY, SESSION_STATS_CACHE_TTL, get_session_stats
+    )
 
 
 @app.post("/api/sessions/cleanup")
@@ -277,13 +509,8 @@ async def cleanup_sessions_endpoint():
     """
     Manually trigger cleanup of expired sessions.
     """
-    try:
-        from voice.session_manager import cleanup_sessions
-        cleaned_count = await cleanup_sessions()
-        return {"message": f"Cleaned up {cleaned_count} expired sessions"}
-    except Exception as e:
-        logger.error(f"Error cleaning up sessions: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to cleanup sessions")
+    cleaned_count = await cleanup_sessions()
+    return {"message": f"Cleaned up {cleaned_count} expired sessions"}
 
 
 @app.post("/api/sessions/reset")
@@ -291,45 +518,31 @@ async def reset_session_counter():
     """
     Reset the session counter and clear all active sessions (for development/testing).
     """
-    try:
-        from voice.session_manager import session_manager
-        from database.redis_client import get_redis_async
-        
-        # Reset Redis counter and clear active sessions set
-        redis_client = await get_redis_async()
-        with redis_client.get_connection() as conn:
-            conn.set(session_manager.session_count_key, 0)
-            conn.delete(session_manager.active_sessions_key)
-        
-        # Also clear database active sessions
-        from database.connection import db_manager
-        from database.models import ActiveSession
-        with db_manager.get_session() as db_session:
-            db_session.query(ActiveSession).delete()
-            db_session.commit()
-        
-        return {"message": "All session data reset to 0"}
-    except Exception as e:
-        logger.error(f"Error resetting session data: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to reset session data")
+    # Reset Redis counter and clear active sessions set in one MULTI/EXEC round-trip
+    async with redis_client.get_async_client().pipeline(transaction=True) as pipe:
+        pipe.set(session_manager.session_count_key, 0)
+        pipe.delete(session_manager.active_sessions_key)
+        await pipe.execute()
+    
+    # Also clear database active sessions with a single DELETE statement
+    async with db_manager.get_async_session() as db_session:
+        await db_session.execute(delete(ActiveSession).execution_options(synchronize_session=False))
+    
+    return {"message": "All session data reset to 0"}
 
 
 # Payment webhook endpoints
-@app.post("/webhooks/stripe")
+@app.post("/webhooks/stripe", response_model=None, include_in_schema=False)
 async def stripe_webhook_handler(request: Request, background_tasks: BackgroundTasks):
     """
     Stripe webhook endpoint for payment event processing.
     Handles payment status updates, failures, and disputes.
+    
+    The handler reads the raw body once for signature verification; the
+    result is returned as a ready response so FastAPI does not re-encode it.
     """
-    try:
-        from api.webhooks import handle_stripe_webhook
-        result = await handle_stripe_webhook(request, background_tasks)
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in Stripe webhook: {str(e)}")
-        raise HTTPException(status_code=500, detail="Webhook processing failed")
+    result = await handle_stripe_webhook(request, background_tasks)
+    return ORJSONResponse(result)
 
 
 @app.get("/api/payments/methods")
@@ -337,37 +550,48 @@ async def get_supported_payment_methods():
     """
     Get supported payment methods and configuration.
     """
-    try:
-        from payment.stripe_client import stripe_client
-        methods_info = await stripe_client.payment_validator.get_supported_payment_methods()
-        return methods_info
-    except Exception as e:
-        logger.error(f"Error getting payment methods: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to get payment methods")
+    # Static configuration; cached for five minutes
+    return await _cached_json_response(
+        "payment_methods", 300, stripe_client.payment_validator.get_supported_payment_methods
+    )
+
+
+class PaymentCustomerInfo(BaseModel):
+    """Customer details attached to a payment intent."""
+    name: Optional[str] = Field(default=None, max_length=100)
+    email: Optional[str] = None
+
+
+class PaymentOrderInfo(BaseModel):
+    """Order details recorded in payment intent metadata."""
+    order_id: Optional[str] = None
+    session_id: Optional[str] = None
+    customer_phone: Optional[str] = None
+    pizza_count: int = Field(default=0, ge=0)
+    delivery_address: Optional[str] = Field(default=None, max_length=500)
+
+
+class PaymentIntentRequest(BaseModel):
+    """JSON body for creating a payment intent."""
+    amount: Decimal = Field(gt=0, decimal_places=2)
+    customer_info: Optional[PaymentCustomerInfo] = None
+    order_info: Optional[PaymentOrderInfo] = None
 
 
 @app.post("/api/payments/intent")
-async def create_payment_intent_endpoint(
-    amount: float,
-    customer_info: Optional[Dict[str, Any]] = None,
-    order_info: Optional[Dict[str, Any]] = None
-):
+async def create_payment_intent_endpoint(req: PaymentIntentRequest):
     """
     Create a payment intent for order processing.
     """
-    try:
-        from payment.stripe_client import create_payment_intent
-        result = await create_payment_intent(amount, customer_info, order_info)
-        
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=400, detail=result.get("errors", ["Payment intent creation failed"]))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error creating payment intent: {str(e)}")
-        raise HTTPException(status_code=500, detail="Payment intent creation failed")
+    result = await create_payment_intent(
+        float(req.amount),
+        req.customer_info.model_dump(exclude_none=True) if req.customer_info else None,
+        req.order_info.model_dump(exclude_none=True) if req.order_info else None
+    )
+    
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result.get("errors", ["Payment intent creation failed"]))
+    return result
 
 
 @app.post("/api/payments/{payment_intent_id}/confirm")
@@ -375,19 +599,11 @@ async def confirm_payment_endpoint(payment_intent_id: str):
     """
     Confirm a payment intent.
     """
-    try:
-        from payment.stripe_client import confirm_payment
-        result = await confirm_payment(payment_intent_id)
-        
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=400, detail=result.get("errors", ["Payment confirmation failed"]))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error confirming payment: {str(e)}")
-        raise HTTPException(status_code=500, detail="Payment confirmation failed")
+    result = await confirm_payment(payment_intent_id)
+    
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result.get("errors", ["Payment confirmation failed"]))
+    return result
 
 
 # Include dashboard API routes
@@ -399,16 +615,51 @@ app.include_router(dashboard_router, prefix="/api", tags=["dashboard"])
 app.include_router(websocket_router, prefix="/api", tags=["websocket"])
 app.include_router(metrics_router, prefix="/api", tags=["metrics"])
 
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles whose responses may be cached for a year.
+    
+    TTS audio files are named after the text and voice they were generated
+    from, so a given URL never changes content and Twilio (or any proxy in
+    front of it) can keep it instead of re-fetching it through Python.
+    """
+    
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# Mount static files for TTS audio, unless a reverse proxy serves them.
+# static/audio already exists: SpeechProcessor creates it with Path.mkdir when
+# voice.speech_processing is imported above, once per import of this module.
+if settings.serve_static_files:
+    app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+
+
 # Add middleware for rate limiting and error handling
 from api.middleware import RateLimitMiddleware, ErrorHandlingMiddleware, RequestLoggingMiddleware
 
-# Mount static files for TTS audio
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
 # Add middleware in reverse order (last added = first executed)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(ErrorHandlingMiddleware)
-app.add_middleware(RateLimitMiddleware, default_calls=1000, default_period=3600)
+app.add_middleware(
+    RateLimitMiddleware,
+    default_calls=1000,
+    default_period=3600,
+    # Twilio and Stripe throttle their own callbacks, and all Twilio traffic
+    # arrives from a few IPs, so per-client limits would only reject calls
+    exempt_paths={
+        "/voice/incoming",
+        "/voice/speech",
+        "/voice/status",
+        "/voice/recording-complete",
+        "/webhooks/stripe",
+        "/health",
+        "/"
+    }
+)
 
 
 if __name__ == "__main__":
@@ -420,6 +671,10 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug,
+        reload=DEBUG,
+        workers=1 if DEBUG else settings.workers,
+        # uvloop event loop and httptools parser; not available on Windows
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
@@ -5,22 +5,52 @@ Tracks estimation accuracy, API performance, and system metrics.
 
 import logging
 import asyncio
+import sys
 import time
+from itertools import chain, count
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
-import statistics
+import numpy as np
+import orjson
+from starlette.concurrency import run_in_threadpool
 
-from database import get_db_session
+from database import db_manager
 from database.models import DeliveryEstimateRecord, Order, OrderStatus
-from database.redis_client import get_redis_async
+from database.redis_client import redis_client
 from config.logging_config import get_logger
 from config.settings import settings
 
 # Configure logging
 logger = get_logger(__name__)
 
+# High-volume estimation metrics live in hourly counter hashes and one capped
+# stream instead of a key per data point
+COUNTERS_KEY_PREFIX = "delivery:counters:"
+RESPONSE_TIMES_KEY = "delivery:resp_times"
+RESPONSE_TIMES_MAXLEN = 10000
+
+# Estimation samples wait in a bounded queue and are written by a background
+# consumer, at most METRICS_BATCH_SIZE per pipeline
+METRICS_QUEUE_MAXSIZE = 4096
+METRICS_BATCH_SIZE = 128
+
+# Rows hydrated per fetch when streaming estimates for accuracy analysis
+ACCURACY_BATCH_SIZE = 1000
+
+# Seconds a built performance dashboard is served to repeat polls
+DASHBOARD_CACHE_TTL = 30
+
+
+# Lunch (11-14) and dinner (17-21) rush hours, local wall-clock time
+_PEAK_HOURS = frozenset(range(11, 15)) | frozenset(range(17, 22))
+
+
+def _counters_key(timestamp: float) -> str:
+    """Hourly counter hash key (UTC), e.g. delivery:counters:2024061512."""
+    return COUNTERS_KEY_PREFIX + time.strftime("%Y%m%d%H", time.gmtime(timestamp))
+
 
 class PerformanceMetric(Enum):
     """Performance metric types for delivery estimation."""
@@ -32,7 +62,17 @@ class PerformanceMetric(Enum):
     PEAK_LOAD_PERFORMANCE = "peak_load_performance"
 
 
-@dataclass
+# Per-point metric key prefixes, built once instead of formatting
+# metric_type.value on every record
+_METRIC_KEY_PREFIXES = {m: f"delivery_metric:{m.value}:" for m in PerformanceMetric}
+
+
+# dataclass(slots=True) drops the per-instance __dict__; the option exists
+# from Python 3.10, older interpreters get plain dataclasses
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceData:
     """Performance data point."""
     metric_type: PerformanceMetric
@@ -41,7 +81,7 @@ class PerformanceData:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EstimationAccuracy:
     """Estimation accuracy analysis."""
     average_error_minutes: float
@@ -50,6 +90,43 @@ class EstimationAccuracy:
     accuracy_within_10_min: float  # Percentage accurate within 10 minutes
     total_comparisons: int
     confidence_correlation: float  # How well confidence predicts accuracy
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert accuracy analysis to dictionary for the performance dashboard."""
+        return asdict(self)
+
+
+def _load_accuracy_samples(start_time: datetime) -> np.ndarray:
+    """
+    Load (error minutes, confidence) pairs for estimates since start_time.
+    
+    Runs a synchronous ORM query, so async callers go through
+    run_in_threadpool. Rows for active estimates on delivered orders are
+    streamed ACCURACY_BATCH_SIZE at a time and reduced straight into one
+    float64 array; the median needs every error anyway.
+    
+    Returns:
+        np.ndarray: Array of shape (n, 2); empty when there are no samples
+    """
+    with db_manager.get_session() as session:
+        rows = session.query(
+            DeliveryEstimateRecord.actual_delivery_time,
+            DeliveryEstimateRecord.estimated_minutes,
+            DeliveryEstimateRecord.confidence_bp
+        ).join(Order, Order.id == DeliveryEstimateRecord.order_id).filter(
+            Order.order_status == OrderStatus.DELIVERED.value,
+            Order.updated_at >= start_time,
+            DeliveryEstimateRecord.actual_delivery_time.isnot(None),
+            DeliveryEstimateRecord.is_active == True
+        ).yield_per(ACCURACY_BATCH_SIZE)
+        
+        return np.fromiter(
+            chain.from_iterable(
+                (abs(actual - estimated), confidence_bp / 10000)  # Basis points to 0.0-1.0
+                for actual, estimated, confidence_bp in rows
+            ),
+            dtype=np.float64
+        ).reshape(-1, 2)
 
 
 class DeliveryPerformanceMonitor:
@@ -63,8 +140,20 @@ class DeliveryPerformanceMonitor:
         """Initialize performance monitor."""
         self.performance_cache_ttl = 300  # 5 minutes cache
         self.metrics_retention_days = 30
+        self.counters_ttl = self.metrics_retention_days * 86400
         self.accuracy_check_interval = 3600  # 1 hour
         
+        # Background writer for estimation samples; created on first use
+        # inside the running event loop
+        self._metrics_queue: Optional[asyncio.Queue] = None
+        self._metrics_consumer: Optional[asyncio.Task] = None
+        
+        # Sequence suffix that keeps per-point keys unique within a millisecond
+        self._metric_seq = count()
+        
+        # Last built dashboard as (time.monotonic() when built, dashboard)
+        self._dashboard_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         # Performance thresholds
         self.thresholds = {
             "api_response_time_ms": 2000,  # 2 seconds max
@@ -73,6 +162,10 @@ class DeliveryPerformanceMonitor:
             "error_rate_max": 0.05  # 5% maximum error rate
         }
         
+        # Thresholds read on the estimation path, cached as plain attributes
+        self._api_rt_threshold = self.thresholds["api_response_time_ms"]
+        self._cache_hit_min = self.thresholds["cache_hit_rate_min"]
+        
         logger.info("DeliveryPerformanceMonitor initialized")
     
     async def track_estimation_performance(
@@ -85,6 +178,9 @@ class DeliveryPerformanceMonitor:
         """
         Track performance metrics for a single estimation.
         
+        The sample is queued for the background consumer, so the estimator
+        doesn't wait on Redis; when the queue is full the sample is dropped.
+        
         Args:
             estimation_time_ms (float): Time taken to calculate estimate in milliseconds
             cache_hit (bool): Whether the result came from cache
@@ -92,27 +188,13 @@ class DeliveryPerformanceMonitor:
             estimation_id (str): Optional unique identifier for the estimation
         """
         try:
-            # Track API response time
-            await self._record_metric(
-                PerformanceMetric.API_RESPONSE_TIME,
-                estimation_time_ms,
-                {"cache_hit": cache_hit, "confidence": confidence_score}
-            )
-            
-            # Track cache performance
-            cache_metric = 1.0 if cache_hit else 0.0
-            await self._record_metric(
-                PerformanceMetric.CACHE_HIT_RATE,
-                cache_metric,
-                {"estimation_id": estimation_id}
-            )
-            
-            # Increment estimation count
-            await self._record_metric(
-                PerformanceMetric.ESTIMATION_COUNT,
-                1.0,
-                {"timestamp": datetime.utcnow().isoformat()}
-            )
+            self._start_consumer()
+            try:
+                self._metrics_queue.put_nowait(
+                    (time.time(), estimation_time_ms, cache_hit, float(confidence_score), estimation_id)
+                )
+            except asyncio.QueueFull:
+                logger.debug("Metrics queue full, dropping estimation sample")
             
             # Check for performance alerts
             await self._check_performance_alerts(estimation_time_ms, cache_hit)
@@ -122,6 +204,74 @@ class DeliveryPerformanceMonitor:
         except Exception as e:
             logger.warning(f"Error tracking estimation performance: {e}")
     
+    def _start_consumer(self):
+        """Start the metrics consumer in the running loop if it isn't running."""
+        consumer = self._metrics_consumer
+        if (
+            consumer is not None
+            and not consumer.done()
+            and consumer.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        
+        self._metrics_queue = asyncio.Queue(maxsize=METRICS_QUEUE_MAXSIZE)
+        self._metrics_consumer = asyncio.create_task(self._drain_metrics(self._metrics_queue))
+    
+    async def _drain_metrics(self, queue: asyncio.Queue):
+        """Write queued estimation samples in batches until cancelled."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < METRICS_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await self._write_estimation_samples(batch)
+            except Exception as e:
+                logger.warning(f"Error writing estimation metrics: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _write_estimation_samples(
+        self,
+        batch: List[Tuple[float, float, bool, float, Optional[str]]]
+    ):
+        """
+        Write a batch of estimation samples in one pipelined round-trip.
+        
+        Counters are summed per hourly hash first, so a batch costs one
+        HINCRBY per counter plus one XADD per response time sample.
+        """
+        counters: Dict[str, Dict[str, int]] = {}
+        for timestamp, _, cache_hit, _, _ in batch:
+            hour = counters.setdefault(_counters_key(timestamp), {})
+            hour["count"] = hour.get("count", 0) + 1
+            field = "cache_hits" if cache_hit else "cache_misses"
+            hour[field] = hour.get(field, 0) + 1
+        
+        client = redis_client.get_async_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for counters_key, fields in counters.items():
+                for field, amount in fields.items():
+                    pipe.hincrby(counters_key, field, amount)
+                pipe.expire(counters_key, self.counters_ttl)
+            
+            for _, estimation_time_ms, cache_hit, confidence_score, estimation_id in batch:
+                response_time = {
+                    "ms": estimation_time_ms,
+                    "cache": int(cache_hit),
+                    "confidence": confidence_score
+                }
+                if estimation_id:
+                    response_time["id"] = estimation_id
+                pipe.xadd(
+                    RESPONSE_TIMES_KEY,
+                    response_time,
+                    maxlen=RESPONSE_TIMES_MAXLEN,
+                    approximate=True
+                )
+            await pipe.execute()
+    
     async def track_estimation_error(
         self, 
         error_type: str,
@@ -137,21 +287,54 @@ class DeliveryPerformanceMonitor:
             context (dict): Additional context about the error
         """
         try:
-            await self._record_metric(
-                PerformanceMetric.ERROR_RATE,
-                1.0,
-                {
-                    "error_type": error_type,
-                    "error_message": error_message,
-                    "context": context or {}
-                }
-            )
+            client = redis_client.get_async_client()
+            counters_key = _counters_key(time.time())
+            
+            # Total and per-type error counters for this hour
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hincrby(counters_key, "errors", 1)
+                pipe.hincrby(counters_key, f"errors:{error_type}", 1)
+                pipe.expire(counters_key, self.counters_ttl)
+                await pipe.execute()
             
             logger.warning(f"Estimation error tracked: {error_type} - {error_message}")
             
         except Exception as e:
             logger.error(f"Error tracking estimation error: {e}")
     
+    async def get_estimation_counters(self, hours: int = 24) -> Dict[str, int]:
+        """
+        Sum the hourly estimation counters over a recent window.
+        
+        Reads one hash per hour, so the cost doesn't grow with request volume.
+        
+        Args:
+            hours (int): Number of hours to include, ending with the current one
+            
+        Returns:
+            dict: Counter totals (count, cache_hits, cache_misses, errors, ...)
+        """
+        try:
+            client = redis_client.get_async_client()
+            now = time.time()
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for hour in range(hours):
+                    pipe.hgetall(_counters_key(now - hour * 3600))
+                hourly = await pipe.execute()
+            
+            totals: Dict[str, int] = {}
+            for counters in hourly:
+                for field, value in counters.items():
+                    field = field.decode() if isinstance(field, bytes) else field
+                    totals[field] = totals.get(field, 0) + int(value)
+            
+            return totals
+            
+        except Exception as e:
+            logger.warning(f"Error reading estimation counters: {e}")
+            return {}
+    
     async def analyze_estimation_accuracy(
         self, 
         timeframe_hours: int = 24
@@ -168,68 +351,51 @@ class DeliveryPerformanceMonitor:
         try:
             start_time = datetime.utcnow() - timedelta(hours=timeframe_hours)
             
-            async with get_db_session() as session:
-                # Get estimates with actual delivery times
-                completed_orders = session.query(Order).join(DeliveryEstimateRecord).filter(
-                    Order.order_status == OrderStatus.DELIVERED.value,
-                    Order.updated_at >= start_time,
-                    DeliveryEstimateRecord.actual_delivery_time.isnot(None)
-                ).all()
-                
-                if not completed_orders:
-                    logger.info("No completed orders with actual times found for accuracy analysis")
-                    return EstimationAccuracy(0, 0, 0, 0, 0, 0)
-                
-                errors = []
-                confidence_scores = []
-                
-                for order in completed_orders:
-                    for estimate in order.delivery_estimates:
-                        if estimate.actual_delivery_time and estimate.is_active:
-                            # Calculate error (actual - estimated)
-                            error = abs(estimate.actual_delivery_time - estimate.estimated_minutes)
-                            errors.append(error)
-                            confidence_scores.append(float(estimate.confidence_score))
-                
-                if not errors:
-                    return EstimationAccuracy(0, 0, 0, 0, 0, 0)
-                
-                # Calculate accuracy metrics
-                avg_error = statistics.mean(errors)
-                median_error = statistics.median(errors)
-                
-                # Percentage within thresholds
-                within_5_min = sum(1 for e in errors if e <= 5) / len(errors)
-                within_10_min = sum(1 for e in errors if e <= 10) / len(errors)
-                
-                # Confidence correlation (simplified)
-                confidence_correlation = self._calculate_confidence_correlation(errors, confidence_scores)
-                
-                accuracy = EstimationAccuracy(
-                    average_error_minutes=avg_error,
-                    median_error_minutes=median_error,
-                    accuracy_within_5_min=within_5_min,
-                    accuracy_within_10_min=within_10_min,
-                    total_comparisons=len(errors),
-                    confidence_correlation=confidence_correlation
-                )
-                
-                # Store accuracy metric
-                await self._record_metric(
-                    PerformanceMetric.ESTIMATION_ACCURACY,
-                    avg_error,
-                    {
-                        "median_error": median_error,
-                        "accuracy_5min": within_5_min,
-                        "accuracy_10min": within_10_min,
-                        "total_comparisons": len(errors)
-                    }
-                )
-                
-                logger.info(f"Accuracy analysis: avg_error={avg_error:.1f}min, {within_5_min:.1%} within 5min")
-                
-                return accuracy
-                
+            data = await run_in_threadpool(_load_accuracy_samples, start_time)
+            
+            if not data.size:
+                logger.info("No completed orders with actual times found for accuracy analysis")
+                return EstimationAccuracy(0, 0, 0, 0, 0, 0)
+            
+            errors = data[:, 0]
+            confidence_scores = data[:, 1]
+            
+            # Calculate accuracy metrics
+            avg_error = float(errors.mean())
+            median_error = float(np.median(errors))
+            
+            # Percentage within thresholds
+            within_5_min = float((errors <= 5).mean())
+            within_10_min = float((errors <= 10).mean())
+            
+            # Confidence correlation (simplified)
+            confidence_correlation = self._calculate_confidence_correlation(errors, confidence_scores)
+            
+            accuracy = EstimationAccuracy(
+                average_error_minutes=avg_error,
+                median_error_minutes=median_error,
+                accuracy_within_5_min=within_5_min,
+                accuracy_within_10_min=within_10_min,
+                total_comparisons=int(errors.size),
+                confidence_correlation=confidence_correlation
+            )
+            
+            # Store accuracy metric
+            await self._record_metric(
+                PerformanceMetric.ESTIMATION_ACCURACY,
+                avg_error,
+                {
+                    "median_error": median_error,
+                    "accuracy_5min": within_5_min,
+                    "accuracy_10min": within_10_min,
+                    "total_comparisons": int(errors.size)
+                }
+            )
+            
+            logger.info(f"Accuracy analysis: avg_error={avg_error:.1f}min, {within_5_min:.1%} within 5min")
+            
+            return accuracy
+            
         except Exception as e:
             logger.error(f"Error analyzing estimation accuracy: {e}")
             return EstimationAccuracy(0, 0, 0, 0, 0, 0)
@@ -238,19 +404,48 @@ class DeliveryPerformanceMonitor:
         """
         Get comprehensive performance dashboard data.
         
+        A fully built dashboard is reused for DASHBOARD_CACHE_TTL seconds, so
+        frequent polling doesn't rerun the accuracy query each time.
+        
         Returns:
             dict: Performance metrics and analysis
         """
+        cached = self._dashboard_cache
+        if cached is not None and time.monotonic() - cached[0] < DASHBOARD_CACHE_TTL:
+            return cached[1]
+        
         try:
-            dashboard = {
-                "current_performance": await self._get_current_performance_metrics(),
-                "accuracy_analysis": (await self.analyze_estimation_accuracy()).to_dict(),
-                "api_performance": await self._get_api_performance_metrics(),
-                "cache_performance": await self._get_cache_performance_metrics(),
-                "error_summary": await self._get_error_summary(),
-                "optimization_recommendations": await self._get_optimization_recommendations(),
-                "generated_at": datetime.utcnow().isoformat()
-            }
+            # The sections are independent; fetch them concurrently so the
+            # dashboard waits for the slowest one rather than their sum
+            sections = (
+                ("current_performance", self._get_current_performance_metrics()),
+                ("accuracy_analysis", self.analyze_estimation_accuracy()),
+                ("api_performance", self._get_api_performance_metrics()),
+                ("cache_performance", self._get_cache_performance_metrics()),
+                ("error_summary", self._get_error_summary()),
+                ("optimization_recommendations", self._get_optimization_recommendations())
+            )
+            results = await asyncio.gather(
+                *(coro for _, coro in sections),
+                return_exceptions=True
+            )
+            
+            dashboard = {}
+            failed = False
+            for (name, _), result in zip(sections, results):
+                if isinstance(result, Exception):
+                    # One failed section shouldn't blank the whole dashboard
+                    logger.warning(f"Error building dashboard section {name}: {result}")
+                    result = {"error": str(result)}
+                    failed = True
+                elif isinstance(result, EstimationAccuracy):
+                    result = result.to_dict()
+                dashboard[name] = result
+            dashboard["generated_at"] = datetime.utcnow().isoformat()
+            
+            # A partial dashboard isn't reused; the next poll retries it
+            if not failed:
+                self._dashboard_cache = (time.monotonic(), dashboard)
             
             logger.info("Generated performance dashboard")
             return dashboard
@@ -273,7 +468,7 @@ class DeliveryPerformanceMonitor:
             recommendations = []
             
             # Check hit rate
-            if cache_stats.get("hit_rate", 0) < self.thresholds["cache_hit_rate_min"]:
+            if cache_stats.get("hit_rate", 0) < self._cache_hit_min:
                 recommendations.append({
                     "type": "increase_cache_ttl",
                     "current_ttl": 3600,
@@ -318,9 +513,7 @@ class DeliveryPerformanceMonitor:
         """
         try:
             current_hour = datetime.now().hour
-            
-            # Define peak hours
-            is_peak = (11 <= current_hour <= 14) or (17 <= current_hour <= 21)
+            is_peak = current_hour in _PEAK_HOURS
             
             if is_peak:
                 # Get current load metrics
@@ -339,7 +532,7 @@ class DeliveryPerformanceMonitor:
                 )
                 
                 # Check for performance degradation
-                if load_metrics.get("response_time_avg", 0) > self.thresholds["api_response_time_ms"]:
+                if load_metrics.get("response_time_avg", 0) > self._api_rt_threshold:
                     await self._trigger_performance_alert("high_response_time", load_metrics)
                 
                 return {
@@ -367,29 +560,19 @@ class DeliveryPerformanceMonitor:
             return 0.0
         
         try:
-            # Simple correlation calculation
+            # Pearson correlation, vectorized
             # Higher confidence should correlate with lower errors
-            paired_data = list(zip(confidence_scores, [-e for e in errors]))  # Negative error for correlation
-            
-            if len(paired_data) < 2:
-                return 0.0
+            x = np.asarray(confidence_scores, dtype=np.float64)
+            y = -np.asarray(errors, dtype=np.float64)  # Negative error for correlation
             
-            # Calculate Pearson correlation coefficient
-            n = len(paired_data)
-            sum_x = sum(x for x, y in paired_data)
-            sum_y = sum(y for x, y in paired_data)
-            sum_xy = sum(x * y for x, y in paired_data)
-            sum_x2 = sum(x * x for x, y in paired_data)
-            sum_y2 = sum(y * y for x, y in paired_data)
+            # Constant input has no defined correlation; corrcoef yields NaN
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlation = np.corrcoef(x, y)[0, 1]
             
-            numerator = n * sum_xy - sum_x * sum_y
-            denominator = ((n * sum_x2 - sum_x * sum_x) * (n * sum_y2 - sum_y * sum_y)) ** 0.5
-            
-            if denominator == 0:
+            if np.isnan(correlation):
                 return 0.0
             
-            correlation = numerator / denominator
-            return max(-1.0, min(1.0, correlation))  # Clamp to [-1, 1]
+            return float(np.clip(correlation, -1.0, 1.0))  # Clamp to [-1, 1]
             
         except Exception as e:
             logger.warning(f"Error calculating confidence correlation: {e}")
@@ -402,21 +585,43 @@ class DeliveryPerformanceMonitor:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """Record performance metric in cache and database."""
+        await self._flush_metrics([self._build_metric(metric_type, value, metadata)])
+    
+    def _build_metric(
+        self, 
+        metric_type: PerformanceMetric, 
+        value: float, 
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, bytes]:
+        """
+        Build the Redis key and JSON payload for one metric record.
+        
+        The key ends in epoch milliseconds plus a sequence number, so records
+        written in the same instant don't overwrite each other; the payload
+        carries no separate timestamp.
+        """
+        metric_data = {
+            "type": metric_type.value,
+            "value": value,
+            "metadata": metadata or {}
+        }
+        
+        metric_key = _METRIC_KEY_PREFIXES[metric_type] + self._point_key_suffix()
+        return metric_key, orjson.dumps(metric_data, default=str)
+    
+    def _point_key_suffix(self) -> str:
+        """Unique "<epoch ms>:<seq>" suffix for per-point metric and alert keys."""
+        return f"{int(time.time() * 1000)}:{next(self._metric_seq)}"
+    
+    async def _flush_metrics(self, batch: List[Tuple[str, bytes]]):
+        """Store metric records in Redis with TTL, in one pipelined round-trip."""
         try:
-            redis_client = await get_redis_async()
-            
-            metric_data = {
-                "type": metric_type.value,
-                "value": value,
-                "timestamp": datetime.utcnow().isoformat(),
-                "metadata": metadata or {}
-            }
-            
-            # Store in Redis with TTL
-            metric_key = f"delivery_metric:{metric_type.value}:{int(time.time())}"
+            client = redis_client.get_async_client()
             
-            with redis_client.get_connection() as conn:
-                conn.setex(metric_key, self.performance_cache_ttl, str(metric_data))
+            async with client.pipeline(transaction=False) as pipe:
+                for metric_key, payload in batch:
+                    pipe.setex(metric_key, self.performance_cache_ttl, payload)
+                await pipe.execute()
             
         except Exception as e:
             logger.warning(f"Error recording metric: {e}")
@@ -426,11 +631,11 @@ class DeliveryPerformanceMonitor:
         try:
             alerts = []
             
-            if response_time_ms > self.thresholds["api_response_time_ms"]:
+            if response_time_ms > self._api_rt_threshold:
                 alerts.append({
                     "type": "high_response_time",
                     "value": response_time_ms,
-                    "threshold": self.thresholds["api_response_time_ms"]
+                    "threshold": self._api_rt_threshold
                 })
             
             # Check cache hit rate trend
@@ -450,11 +655,9 @@ class DeliveryPerformanceMonitor:
             logger.warning(f"Performance alert: {alert_type} - {alert_data}")
             
             # Store alert in Redis for dashboard
-            redis_client = await get_redis_async()
-            alert_key = f"delivery_alert:{alert_type}:{int(time.time())}"
-            
-            with redis_client.get_connection() as conn:
-                conn.setex(alert_key, 3600, str(alert_data))  # 1 hour TTL
+            client = redis_client.get_async_client()
+            alert_key = f"delivery_alert:{alert_type}:{self._point_key_suffix()}"
+            await client.setex(alert_key, 3600, orjson.dumps(alert_data, default=str))  # 1 hour TTL
             
         except Exception as e:
             logger.error(f"Error triggering performance alert: {e}")
@@ -546,17 +749,6 @@ class DeliveryPerformanceMonitor:
         }
 
 
-# Add to EstimationAccuracy for serialization
-EstimationAccuracy.to_dict = lambda self: {
-    'average_error_minutes': self.average_error_minutes,
-    'median_error_minutes': self.median_error_minutes,
-    'accuracy_within_5_min': self.accuracy_within_5_min,
-    'accuracy_within_10_min': self.accuracy_within_10_min,
-    'total_comparisons': self.total_comparisons,
-    'confidence_correlation': self.confidence_correlation
-}
-
-
 # Create global performance monitor instance
 delivery_performance_monitor = DeliveryPerformanceMonitor()
 
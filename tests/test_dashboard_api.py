@@ -14,6 +14,7 @@ from fastapi import FastAPI
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+import main
 from main import app
 from database.models import Base, Order, OrderStatus, PaymentStatus
 from database import get_db_session
@@ -122,6 +123,32 @@ class TestAuthentication:
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
     
+    def test_health_endpoint_serves_startup_bytes(self, test_client):
+        """Test that the health body is the payload serialized at import."""
+        response = test_client.get("/health")
+        
+        assert response.content == app.state.health_bytes
+        assert response.headers["cache-control"] == "public, max-age=5"
+    
+    def test_status_endpoint_cached_outside_debug(self, test_client, monkeypatch):
+        """Test that status responses are reused within their TTL and marked cacheable."""
+        monkeypatch.setattr(main, "DEBUG", False)
+        monkeypatch.setattr(main, "_response_cache", {})
+        
+        first = test_client.get("/status")
+        second = test_client.get("/status")
+        
+        assert first.headers["cache-control"] == "public, max-age=2"
+        assert first.content == second.content
+        assert list(main._response_cache) == ["status"]
+    
+    def test_small_responses_not_compressed(self, test_client):
+        """Test that responses under the gzip threshold are sent as-is."""
+        response = test_client.get("/health", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+    
     def test_dashboard_status_requires_auth(self, test_client):
         """Test that dashboard status requires authentication."""
         response = test_client.get("/api/dashboard/status")
@@ -0,0 +1,623 @@
+"""
+Test suite for the database layer.
+Tests SQLAlchemy model helpers against an in-memory SQLite database.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text, select
+from sqlalchemy.orm import sessionmaker, load_only, joinedload
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.pool import NullPool, StaticPool
+
+from database.base import Base
+from database.connection import make_async_engine
+from database.models import (
+    Order, ActiveSession, PaymentTransaction, PaymentMethodRecord,
+    WebhookEvent, WebhookEventPayload, RefundRecord, DeliveryEstimateRecord, OrderStatus,
+    ORDER_STATUS_VALUES, bulk_insert, copy_rows, make_engine,
+    prune_expired_sessions, stream_rows
+)
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with all tables created."""
+    engine = make_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def sample_order(db_session):
+    """Persisted order for serialization tests."""
+    order = Order(
+        customer_name="Test Customer",
+        phone_number="+15551234567",
+        address="123 Test St, Test City, CA",
+        order_details={"pizzas": [{"size": "large", "toppings": ["pepperoni"]}]},
+        total_amount=18.99,
+        estimated_delivery=35,
+        payment_method="card",
+        payment_status="completed",
+        order_status="preparing",
+        interface_type="phone"
+    )
+    db_session.add(order)
+    db_session.commit()
+    return order
+
+
+class TestModelHelpers:
+    """Test suite for module-level model helpers."""
+
+    def test_models_share_one_metadata(self):
+        """Test that every model registers its table on the shared Base."""
+        models = (Order, ActiveSession, PaymentTransaction, PaymentMethodRecord,
+                  WebhookEvent, RefundRecord, DeliveryEstimateRecord)
+
+        assert {id(model.metadata) for model in models} == {id(Base.metadata)}
+
+    def test_make_engine_pool_selection(self, tmp_path):
+        """Test that SQLite engines get a pool matching their storage."""
+        memory_engine = make_engine("sqlite://")
+        file_engine = make_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+
+        assert isinstance(memory_engine.pool, StaticPool)
+        assert isinstance(file_engine.pool, NullPool)
+
+    def test_make_async_engine_swaps_driver(self, tmp_path):
+        """Test that async engines use the asyncio driver and the SQLite pool rules."""
+        engine = make_async_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+
+        assert engine.url.drivername == "sqlite+aiosqlite"
+        assert isinstance(engine.sync_engine.pool, NullPool)
+
+    def test_make_engine_batches_executemany_for_psycopg2_only(self, monkeypatch):
+        """Test that the psycopg2-only executemany_mode isn't passed to other drivers."""
+        from database import models
+
+        created = {}
+        monkeypatch.setattr(models, "create_engine", lambda url, **options: created.setdefault(url.drivername, options))
+
+        make_engine("postgresql://pizza@localhost/pizza")
+        make_engine("postgresql+psycopg://pizza@localhost/pizza")
+
+        assert created["postgresql"]["executemany_mode"] == "values_plus_batch"
+        assert "executemany_mode" not in created["postgresql+psycopg"]
+
+    def test_bulk_insert_rows(self, db_session):
+        """Test that bulk_insert writes every row in one call."""
+        rows = [
+            {"session_id": f"bulk-{i}", "interface_type": "web", "agent_state": "greeting"}
+            for i in range(5)
+        ]
+
+        inserted = bulk_insert(db_session, ActiveSession, rows)
+        db_session.commit()
+
+        assert inserted == 5
+        assert db_session.query(ActiveSession).count() == 5
+
+    def test_bulk_insert_empty(self, db_session):
+        """Test that an empty row list is a no-op."""
+        assert bulk_insert(db_session, ActiveSession, []) == 0
+
+    def test_order_insert_many_returns_ids_in_order(self, db_session):
+        """Test that bulk order inserts convert amounts and return IDs in input order."""
+        rows = [
+            {
+                "customer_name": f"Customer {i}", "phone_number": "+15551234567",
+                "address": "123 Test St", "order_details": {"pizzas": []},
+                "total_amount": 10 + i, "estimated_delivery": 30, "payment_method": "card",
+                "payment_status": "pending", "order_status": "pending", "interface_type": "web"
+            }
+            for i in range(3)
+        ]
+
+        order_ids = Order.insert_many(db_session, rows)
+        db_session.commit()
+
+        assert len(order_ids) == 3
+        assert [db_session.get(Order, order_id).total_amount_cents for order_id in order_ids] == [1000, 1100, 1200]
+        assert Order.insert_many(db_session, []) == []
+
+    def test_order_insert_one_returns_loaded_order(self, db_session):
+        """Test that a single insert returns the stored row, including server-side defaults."""
+        order = Order.insert_one(db_session, {
+            "customer_name": "Returning Customer", "phone_number": "+15551234567",
+            "address": "123 Test St", "order_details": {"pizzas": []}, "total_amount": 12.5,
+            "estimated_delivery": 30, "payment_method": "card", "payment_status": "pending",
+            "order_status": "pending", "interface_type": "phone"
+        })
+
+        assert order.id is not None
+        assert order.total_amount_cents == 1250
+        assert order.created_at is not None
+        assert db_session.get(Order, order.id) is order
+
+    def test_copy_rows_streams_processed_csv(self):
+        """Test that COPY receives bind-processed values with explicit NULL markers."""
+        session = MagicMock()
+        connection = session.connection.return_value
+        connection.dialect = postgresql.psycopg2.dialect()
+        cursor = connection.connection.cursor.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.update(sql=sql, data=buf.read())
+
+        rows = [{"session_id": "s-1", "interface_type": "web", "order_data": {"a": 1}, "customer_phone": None}]
+
+        assert copy_rows(session, ActiveSession, rows) == 1
+        assert copied["sql"].startswith(
+            "COPY active_sessions (session_id, interface_type, order_data, customer_phone) FROM STDIN"
+        )
+        assert copied["data"] == 's-1\t1\t"{""a"": 1}"\t\\N\n'
+        cursor.close.assert_called_once()
+
+    def test_stream_rows_filters_and_batches(self, db_session):
+        """Test that streaming yields every matching row across batches."""
+        rows = [
+            {"session_id": f"s-{i}", "interface_type": "phone" if i % 2 else "web",
+             "agent_state": "greeting"}
+            for i in range(6)
+        ]
+        bulk_insert(db_session, ActiveSession, rows)
+        db_session.commit()
+
+        streamed = stream_rows(
+            db_session, ActiveSession, ActiveSession.interface_type == "phone", batch_size=2
+        )
+
+        assert sorted(s.session_id for s in streamed) == ["s-1", "s-3", "s-5"]
+
+    def test_sqlite_pragmas_applied_on_connect(self, db_session):
+        """Test that the connect listener tunes every SQLite connection."""
+        assert db_session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert db_session.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert db_session.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+    @pytest.mark.asyncio
+    async def test_sqlite_pragmas_applied_to_async_engine(self, tmp_path):
+        """Test that aiosqlite connections get the same WAL and busy_timeout setup."""
+        engine = make_async_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+        try:
+            async with engine.connect() as conn:
+                assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+                assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 30000
+                assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+        finally:
+            await engine.dispose()
+
+    def test_json_columns_use_orjson(self, db_session):
+        """Test that JSON columns are written by orjson, including naive datetimes."""
+        bulk_insert(db_session, ActiveSession, [{
+            "session_id": "json-1", "interface_type": "web", "agent_state": "greeting",
+            "order_data": {"placed": datetime(2024, 1, 2, 3, 4, 5), "pizzas": 2}
+        }])
+        db_session.commit()
+
+        raw = db_session.execute(text("SELECT order_data FROM active_sessions")).scalar()
+        assert raw == '{"placed":"2024-01-02T03:04:05+00:00","pizzas":2}'
+        assert db_session.get(ActiveSession, "json-1").order_data["pizzas"] == 2
+
+    def test_json_columns_accept_int_keys(self, db_session):
+        """Test that dicts keyed by ints serialize like json.dumps instead of raising."""
+        bulk_insert(db_session, ActiveSession, [{
+            "session_id": "json-2", "interface_type": "web", "agent_state": "greeting",
+            "order_data": {1: "large", 2: "small"}
+        }])
+        db_session.commit()
+
+        raw = db_session.execute(text("SELECT order_data FROM active_sessions")).scalar()
+        assert raw == '{"1":"large","2":"small"}'
+
+
+class TestOrderSerialization:
+    """Test suite for Order.to_dict variants."""
+
+    def test_to_dict_field_subset(self, sample_order):
+        """Test that to_dict emits only the requested fields."""
+        data = sample_order.to_dict(fields=('id', 'customer_name'))
+
+        assert data == {"id": sample_order.id, "customer_name": "Test Customer"}
+
+    def test_to_dict_minimal_skips_unloaded_columns(self, db_session, sample_order):
+        """Test that the minimal serializer works with load_only queries."""
+        db_session.expunge_all()
+        order = db_session.query(Order).options(
+            load_only(Order.id, Order.order_status, Order.total_amount_cents)
+        ).one()
+
+        data = order.to_dict_minimal()
+
+        assert data == {"id": order.id, "order_status": "preparing", "total_amount": 18.99}
+        assert "order_details" not in order.__dict__
+
+    def test_cached_lookup_statements_bind_values(self, db_session, sample_order):
+        """Test that the module-level lookup statements take their values as bind parameters."""
+        from database.utils import _GET_ORDER_STMT, _GET_ORDERS_BY_PHONE_STMT
+
+        assert db_session.execute(_GET_ORDER_STMT, {"id": sample_order.id}).scalar_one() is sample_order
+        assert db_session.execute(_GET_ORDER_STMT, {"id": -1}).scalar_one_or_none() is None
+        by_phone = db_session.execute(
+            _GET_ORDERS_BY_PHONE_STMT, {"phone": "+15551234567", "lim": 1}
+        ).scalars().all()
+        assert by_phone == [sample_order]
+
+    def test_status_update_statement_skips_select(self, db_session, sample_order):
+        """Test that the status mutator statement updates by ID and reports missing orders."""
+        from database.utils import _UPDATE_ORDER_STATUS_STMT
+
+        hit = db_session.execute(_UPDATE_ORDER_STATUS_STMT, {"oid": sample_order.id, "status": "ready"})
+        miss = db_session.execute(_UPDATE_ORDER_STATUS_STMT, {"oid": -1, "status": "ready"})
+        db_session.commit()
+        db_session.expire_all()
+
+        assert (hit.rowcount, miss.rowcount) == (1, 0)
+        assert sample_order.order_status == "ready"
+
+    def test_payment_details_merged_server_side(self, db_session, sample_order):
+        """Test that payment details are merged into order_details by a single UPDATE."""
+        from database.utils import _SET_PAYMENT_DETAILS_STMTS
+
+        stmt = _SET_PAYMENT_DETAILS_STMTS["sqlite"]
+        details = {"intent_id": "pi_123", "amount": 1899}
+        hit = db_session.execute(stmt, {"oid": sample_order.id, "status": "succeeded", "details": json.dumps(details)})
+        miss = db_session.execute(stmt, {"oid": -1, "status": "succeeded", "details": "{}"})
+        db_session.commit()
+        db_session.expire_all()
+
+        assert (hit.rowcount, miss.rowcount) == (1, 0)
+        assert sample_order.payment_status == "succeeded"
+        assert sample_order.order_details["payment_details"] == details
+        assert "pizzas" in sample_order.order_details
+
+    def test_active_orders_query_uses_partial_index(self, db_session, sample_order):
+        """Test that the active-orders query matches rows and is planned on its partial index."""
+        from database.models import ACTIVE_ORDER_SQL
+        from database.utils import _GET_ACTIVE_ORDERS_STMT
+
+        db_session.execute(text(f"CREATE INDEX idx_orders_active ON orders(created_at) WHERE {ACTIVE_ORDER_SQL}"))
+        compiled = str(_GET_ACTIVE_ORDERS_STMT.compile(db_session.get_bind()))
+        plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+
+        assert db_session.execute(_GET_ACTIVE_ORDERS_STMT).scalars().all() == [sample_order]
+        assert any("idx_orders_active" in row[-1] for row in plan)
+
+    def test_phone_lookup_seeks_phone_recent_index(self, db_session, sample_order):
+        """Test that caller-ID lookups seek and order by the phone/recency index."""
+        from database.utils import _GET_ORDERS_BY_PHONE_STMT
+
+        db_session.execute(text(
+            "CREATE INDEX idx_orders_phone_recent "
+            "ON orders(phone_number, created_at DESC, order_status, total_amount_cents, estimated_delivery)"
+        ))
+        params = {"phone": "+15551234567", "lim": 5}
+        compiled = _GET_ORDERS_BY_PHONE_STMT.compile(db_session.get_bind())
+        values = compiled.construct_params(params)
+        plan = db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", tuple(values[name] for name in compiled.positiontup)
+        ).all()
+        orders = db_session.execute(_GET_ORDERS_BY_PHONE_STMT, params).scalars().all()
+
+        assert [order.id for order in orders] == [sample_order.id]
+        assert any("USING INDEX idx_orders_phone_recent" in row[-1] for row in plan)
+        assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+    def test_iter_orders_by_status_yields_batches(self, db_session, monkeypatch):
+        """Test that status streaming yields every matching order in fixed-size batches."""
+        from contextlib import contextmanager
+        from database import utils
+
+        Order.insert_many(db_session, [
+            {
+                "customer_name": f"Customer {i}", "phone_number": "+15551234567",
+                "address": "123 Test St", "order_details": {"pizzas": []},
+                "total_amount": 10, "estimated_delivery": 30, "payment_method": "card",
+                "payment_status": "pending", "order_status": "preparing" if i < 5 else "ready",
+                "interface_type": "web"
+            }
+            for i in range(6)
+        ])
+        db_session.commit()
+        manager = MagicMock()
+        manager.get_session = contextmanager(lambda: (yield db_session))
+        monkeypatch.setattr(utils, "db_manager", manager)
+
+        batches = list(utils.OrderManager.iter_orders_by_status("preparing", batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert {order.order_status for batch in batches for order in batch} == {"preparing"}
+
+    def test_repr_formats_on_demand(self, sample_order):
+        """Test that the order repr renders the key identifying fields."""
+        assert repr(sample_order) == (
+            f"<Order(id={sample_order.id}, customer='Test Customer', "
+            "status='preparing', total=$18.99)>"
+        )
+
+    def test_to_json_bytes_matches_to_dict(self, sample_order):
+        """Test that orjson serialization emits the same payload as to_dict."""
+        assert json.loads(sample_order.to_json_bytes()) == sample_order.to_dict()
+
+    def test_status_stored_as_integer_code(self, db_session, sample_order):
+        """Test that statuses round-trip as strings but are stored as codes."""
+        raw = db_session.execute(text("SELECT order_status FROM orders")).scalar()
+        preparing = db_session.query(Order).filter(
+            Order.order_status == OrderStatus.PREPARING
+        ).one()
+
+        assert raw == ORDER_STATUS_VALUES.index("preparing")
+        assert preparing.order_status == "preparing"
+
+    def test_unknown_status_rejected(self, db_session):
+        """Test that values outside the vocabulary cannot be written."""
+        with pytest.raises(Exception, match="Unknown status value"):
+            db_session.execute(select(Order).where(Order.order_status == "teleported")).all()
+
+    def test_total_amount_stored_as_cents(self, sample_order):
+        """Test that dollar amounts round-trip through the integer cents column."""
+        assert sample_order.total_amount_cents == 1899
+        assert sample_order.total_amount == 18.99
+        assert sample_order.to_dict()["total_amount"] == 18.99
+
+
+class TestActiveSession:
+    """Test suite for ActiveSession model behaviour."""
+
+    def test_is_expired_uses_epoch_column(self, db_session):
+        """Test that expiry is computed from the epoch creation time."""
+        fresh = ActiveSession(session_id="fresh", interface_type="web", agent_state="greeting")
+        stale = ActiveSession(
+            session_id="stale", interface_type="web", agent_state="greeting",
+            created_at_epoch=int(time.time()) - 31 * 60
+        )
+        db_session.add_all([fresh, stale])
+        db_session.commit()
+
+        assert fresh.created_at_epoch is not None
+        assert not fresh.is_expired()
+        assert stale.is_expired()
+        assert not stale.is_expired(timeout_minutes=60)
+
+    def test_prune_expired_sessions_in_batches(self, db_session):
+        """Test that expired sessions are deleted across several batches."""
+        expired_epoch = int(time.time()) - 60 * 60
+        rows = [
+            {"session_id": f"old-{i}", "interface_type": "phone",
+             "agent_state": "greeting", "created_at_epoch": expired_epoch}
+            for i in range(7)
+        ]
+        rows.append({"session_id": "live", "interface_type": "web", "agent_state": "greeting"})
+        bulk_insert(db_session, ActiveSession, rows)
+        db_session.commit()
+
+        deleted = prune_expired_sessions(db_session, batch_size=3)
+
+        assert deleted == 7
+        assert [s.session_id for s in db_session.query(ActiveSession)] == ["live"]
+
+
+class TestSessionWriteBuffer:
+    """Test suite for write-behind session updates."""
+
+    def test_flush_coalesces_updates_per_session(self, db_session, monkeypatch):
+        """Test that buffered updates keep the newest value and land in one flush."""
+        from database import utils
+
+        bulk_insert(db_session, ActiveSession, [
+            {"session_id": sid, "interface_type": "phone", "agent_state": "greeting"}
+            for sid in ("call-1", "call-2", "call-3")
+        ])
+        db_session.commit()
+        manager = MagicMock()
+        manager.execute_with_retry.side_effect = lambda operation: operation(db_session)
+        monkeypatch.setattr(utils, "db_manager", manager)
+
+        buffer = utils.SessionWriteBuffer(flush_threshold=100)
+        buffer._flush_thread = MagicMock()  # Flush by hand, not from the thread
+        buffer.put("call-1", {"agent_state": "ordering", "last_activity": 1.0})
+        buffer.put("call-1", {"agent_state": "payment", "order_data": {"pizzas": 2}})
+        buffer.put("call-2", {"customer_phone": "+15550000000"})
+        buffer.put("call-3", {"agent_state": "confirmation"})
+        buffer.discard("call-3")
+
+        assert buffer.flush() == 2
+        db_session.commit()
+        db_session.expire_all()
+        rows = {s.session_id: s for s in db_session.query(ActiveSession)}
+        assert (rows["call-1"].agent_state, rows["call-1"].order_data) == ("payment", {"pizzas": 2})
+        assert rows["call-2"].customer_phone == "+15550000000"
+        assert rows["call-3"].agent_state == "greeting"
+        manager.execute_with_retry.assert_called_once()
+
+
+    def test_failed_flush_keeps_updates(self, monkeypatch):
+        """Test that updates survive a failed flush without overwriting newer values."""
+        from database import utils
+
+        manager = MagicMock()
+        manager.execute_with_retry.side_effect = RuntimeError("database is locked")
+        monkeypatch.setattr(utils, "db_manager", manager)
+
+        buffer = utils.SessionWriteBuffer(flush_threshold=100)
+        buffer._flush_thread = MagicMock()  # Flush by hand, not from the thread
+        buffer.put("call-1", {"agent_state": "ordering", "customer_phone": "+15550000000"})
+        buffer.put("call-2", {"agent_state": "payment"})
+        original_requeue = buffer._requeue
+
+        def _requeue_after_newer_update(pending):
+            buffer._pending["call-1"] = {"agent_state": "payment"}
+            original_requeue(pending)
+
+        monkeypatch.setattr(buffer, "_requeue", _requeue_after_newer_update)
+
+        assert buffer.flush() == 0
+        assert buffer._pending == {
+            "call-1": {"agent_state": "payment", "customer_phone": "+15550000000"},
+            "call-2": {"agent_state": "payment"}
+        }
+
+
+class TestOrderCache:
+    """Test suite for the per-process get_order cache."""
+
+    def test_get_order_reads_through_and_invalidates(self, db_session, sample_order, monkeypatch):
+        """Test that repeat reads skip the database until the order is updated."""
+        from database import utils
+
+        manager = MagicMock()
+        manager.execute_with_retry.side_effect = lambda operation, *args: operation(db_session, *args)
+        monkeypatch.setattr(utils, "db_manager", manager)
+        monkeypatch.setattr(utils, "redis_client", MagicMock())
+        monkeypatch.setattr(utils, "_order_cache", utils.TTLCache(maxsize=16, ttl=60))
+
+        first = utils.OrderManager.get_order(sample_order.id)
+        second = utils.OrderManager.get_order(sample_order.id)
+        assert first is second
+        assert first.customer_name == "Test Customer"
+        assert manager.execute_with_retry.call_count == 1
+
+        assert utils.OrderManager.update_order_status(sample_order.id, "ready") is True
+        assert utils.OrderManager.get_order(sample_order.id).order_status == "ready"
+        assert manager.execute_with_retry.call_count == 3
+
+
+class TestSessionLookup:
+    """Test suite for database session lookups behind Redis."""
+
+    def test_session_count_falls_back_to_database(self, db_session, monkeypatch):
+        """Test that the database count is used when Redis cannot report one."""
+        from database import utils
+
+        bulk_insert(db_session, ActiveSession, [
+            {"session_id": f"count-{i}", "interface_type": "web", "agent_state": "greeting"}
+            for i in range(3)
+        ])
+        db_session.commit()
+        manager = MagicMock()
+        manager.execute_with_retry.side_effect = lambda operation: operation(db_session)
+        redis = MagicMock()
+        redis.get_active_session_count.return_value = None
+        monkeypatch.setattr(utils, "db_manager", manager)
+        monkeypatch.setattr(utils, "redis_client", redis)
+
+        assert utils.SessionManager.get_session_count() == 3
+        redis.get_active_session_count.return_value = 7
+        assert utils.SessionManager.get_session_count() == 7
+
+    def test_cached_session_miss_read_from_redis_only(self, monkeypatch):
+        """Test that the negative-cache sentinel isn't pinned in the local cache."""
+        from database import utils
+
+        redis = MagicMock()
+        redis.get_session.return_value = None
+        redis.cache_get.return_value = utils._SESSION_MISS
+        monkeypatch.setattr(utils, "redis_client", redis)
+
+        assert utils.SessionManager.get_session("call-1") is None
+        redis.cache_get.assert_called_once_with("session_db:call-1", local=False)
+
+    def test_concurrent_loads_share_one_query(self, monkeypatch):
+        """Test that callers arriving during an in-flight load reuse its result."""
+        from database import utils
+
+        release = threading.Event()
+        manager = MagicMock()
+        manager.execute_with_retry.side_effect = lambda *args: release.wait(5) and {"session_id": "call-1"}
+        monkeypatch.setattr(utils, "db_manager", manager)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(utils._load_session_single_flight, "call-1") for _ in range(3)]
+            while not utils._session_loads:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [{"session_id": "call-1"}] * 3
+        manager.execute_with_retry.assert_called_once()
+        assert utils._session_loads == {}
+
+    @pytest.mark.asyncio
+    async def test_acreate_session_rolls_back_redis_on_db_failure(self, monkeypatch):
+        """Test that a failed database insert removes the concurrently created Redis session."""
+        from unittest.mock import AsyncMock
+        from database import utils
+
+        manager = MagicMock()
+        manager.execute_async_with_retry = AsyncMock(side_effect=RuntimeError("db down"))
+        redis = MagicMock()
+        redis.acreate_session = AsyncMock(return_value=True)
+        redis.adelete_session = AsyncMock(return_value=True)
+        monkeypatch.setattr(utils, "db_manager", manager)
+        monkeypatch.setattr(utils, "redis_client", redis)
+
+        created = await utils.SessionManager.acreate_session("call-1", {"interface_type": "phone"})
+
+        assert created is False
+        redis.acreate_session.assert_awaited_once()
+        redis.adelete_session.assert_awaited_once_with("call-1")
+
+
+class TestWebhookEvent:
+    """Test suite for webhook event deduplication."""
+
+    def test_insert_or_ignore_skips_duplicates(self, db_session):
+        """Test that a repeated Stripe event ID is ignored in one statement."""
+        first = WebhookEvent.insert_or_ignore(
+            db_session, stripe_event_id="evt_123", event_type="payment_intent.succeeded"
+        )
+        duplicate = WebhookEvent.insert_or_ignore(
+            db_session, stripe_event_id="evt_123", event_type="payment_intent.succeeded"
+        )
+        db_session.commit()
+
+        assert first is not None
+        assert duplicate is None
+        assert db_session.query(WebhookEvent).count() == 1
+
+    def test_payload_stored_in_side_table(self, db_session):
+        """Test that event payloads are only loaded when explicitly requested."""
+        event_id = WebhookEvent.insert_or_ignore(
+            db_session, stripe_event_id="evt_456", event_type="charge.failed",
+            event_data={"object": {"id": "ch_1"}}
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        narrow = db_session.get(WebhookEvent, event_id)
+        assert narrow.payload is None
+        assert narrow.event_data == {"object": {"id": "ch_1"}}
+        db_session.expunge_all()
+        full = db_session.query(WebhookEvent).options(joinedload(WebhookEvent.payload)).one()
+
+        assert full.event_data == {"object": {"id": "ch_1"}}
+        assert db_session.query(WebhookEventPayload).count() == 1
+
+    def test_event_data_setter_updates_existing_payload(self, db_session):
+        """Test that assigning event_data rewrites the existing payload row."""
+        event_id = WebhookEvent.insert_or_ignore(
+            db_session, stripe_event_id="evt_789", event_type="charge.refunded",
+            event_data={"object": {"id": "ch_2"}}
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        event = db_session.get(WebhookEvent, event_id)
+        event.event_data = {"object": {"id": "ch_2", "refunded": True}}
+        db_session.commit()
+
+        assert db_session.query(WebhookEventPayload).count() == 1
+        assert db_session.get(WebhookEventPayload, event_id).event_data["object"]["refunded"] is True
@@ -10,13 +10,18 @@ import json
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 from decimal import Decimal
+from contextlib import contextmanager
+
+from sqlalchemy.orm import sessionmaker
 
 from agents.delivery_estimator import (
     DeliveryEstimator, DeliveryEstimate, GoogleMapsClient, 
     LoadCalculator, DeliveryZone, delivery_estimator
 )
-from database.models import Order, OrderStatus, DeliveryEstimateRecord
+from database.base import Base
+from database.models import Order, OrderStatus, DeliveryEstimateRecord, make_engine
 from database import get_db_session
+from monitoring.delivery_performance import DeliveryPerformanceMonitor, EstimationAccuracy, PerformanceMetric
 
 
 class TestGoogleMapsClient:
@@ -587,6 +592,133 @@ class TestPerformanceAndResilience:
             assert estimate.confidence_score < 1.0
 
 
+class TestDeliveryPerformanceMonitor:
+    """Test delivery estimation performance analysis."""
+    
+    @pytest.fixture
+    def monitor(self):
+        """DeliveryPerformanceMonitor instance for testing."""
+        return DeliveryPerformanceMonitor()
+    
+    def test_confidence_correlation(self, monitor):
+        """Test that confident estimates with small errors correlate positively."""
+        errors = [1.0, 3.0, 6.0, 12.0]
+        confidence_scores = [0.95, 0.85, 0.6, 0.3]
+        
+        correlation = monitor._calculate_confidence_correlation(errors, confidence_scores)
+        
+        assert 0.9 < correlation <= 1.0
+        assert monitor._calculate_confidence_correlation([5.0, 5.0, 5.0], [0.9, 0.5, 0.1]) == 0.0
+        assert monitor._calculate_confidence_correlation([5.0], [0.9]) == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_estimation_metrics_batched_in_background(self, monitor):
+        """Test that queued estimation samples are written by the consumer in one pipeline."""
+        mock_client = MagicMock()
+        pipe = mock_client.pipeline.return_value.__aenter__.return_value
+        pipe.execute = AsyncMock()
+        
+        with patch('monitoring.delivery_performance.redis_client') as mock_redis_client:
+            mock_redis_client.get_async_client.return_value = mock_client
+            await monitor.track_estimation_performance(120.0, cache_hit=True, confidence_score=0.8)
+            await monitor.track_estimation_performance(340.0, cache_hit=False, confidence_score=0.6)
+            await asyncio.wait_for(monitor._metrics_queue.join(), 1)
+            monitor._metrics_consumer.cancel()
+        
+        assert mock_client.pipeline.call_count == 1
+        counters = {c.args[1]: c.args[2] for c in pipe.hincrby.call_args_list}
+        assert counters == {"count": 2, "cache_hits": 1, "cache_misses": 1}
+        assert pipe.xadd.call_count == 2
+        assert pipe.xadd.call_args_list[0].args[0] == "delivery:resp_times"
+        assert pipe.xadd.call_args_list[0].args[1]["ms"] == 120.0
+        pipe.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_accuracy_analysis_reads_delivered_estimates(self, monitor):
+        """Test accuracy statistics for active estimates on delivered orders in SQLite."""
+        engine = make_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        db_session = sessionmaker(bind=engine)()
+        order_ids = Order.insert_many(db_session, [
+            {
+                "customer_name": f"Customer {i}", "phone_number": "+15551234567",
+                "address": "123 Test St", "order_details": {"pizzas": []},
+                "total_amount": 10, "estimated_delivery": 30, "payment_method": "card",
+                "payment_status": "completed", "order_status": "delivered",
+                "interface_type": "phone"
+            }
+            for i in range(4)
+        ])
+        samples = [(30, 28, 9000, True), (45, 35, 6000, True), (25, 26, 9500, True),
+                   (50, 30, 3000, True), (90, 20, 1000, False)]
+        db_session.add_all([
+            DeliveryEstimateRecord(
+                order_id=order_ids[i % 4], estimated_minutes=estimated,
+                distance_hundredths_miles=250, base_time_minutes=15,
+                distance_time_minutes=10, load_time_minutes=0,
+                random_variation_minutes=0, confidence_bp=confidence_bp,
+                delivery_zone="inner", is_active=is_active, actual_delivery_time=actual
+            )
+            for i, (actual, estimated, confidence_bp, is_active) in enumerate(samples)
+        ])
+        db_session.commit()
+        manager = MagicMock()
+        manager.get_session = contextmanager(lambda: (yield db_session))
+        
+        try:
+            with patch('monitoring.delivery_performance.db_manager', manager), \
+                 patch.object(monitor, '_record_metric', new_callable=AsyncMock):
+                accuracy = await monitor.analyze_estimation_accuracy(timeframe_hours=24)
+        finally:
+            db_session.close()
+            engine.dispose()
+        
+        assert accuracy.total_comparisons == 4
+        assert accuracy.average_error_minutes == pytest.approx(8.25)
+        assert accuracy.median_error_minutes == pytest.approx(6.0)
+        assert accuracy.accuracy_within_5_min == pytest.approx(0.5)
+        assert accuracy.accuracy_within_10_min == pytest.approx(0.75)
+        assert accuracy.confidence_correlation > 0.9
+    
+    @pytest.mark.asyncio
+    async def test_dashboard_survives_failed_section(self, monitor):
+        """Test that one failing dashboard section doesn't blank the others."""
+        with patch.object(monitor, 'analyze_estimation_accuracy', new_callable=AsyncMock) as mock_accuracy, \
+             patch.object(monitor, '_get_error_summary', side_effect=RuntimeError("redis down")):
+            mock_accuracy.return_value = EstimationAccuracy(4.0, 3.0, 0.6, 0.9, 10, 0.5)
+            dashboard = await monitor.get_performance_dashboard()
+        
+        assert dashboard["error_summary"] == {"error": "redis down"}
+        assert dashboard["accuracy_analysis"]["total_comparisons"] == 10
+        assert "cache_performance" in dashboard
+        assert "generated_at" in dashboard
+        assert monitor._dashboard_cache is None
+    
+    @pytest.mark.asyncio
+    async def test_dashboard_reused_within_ttl(self, monitor):
+        """Test that repeat dashboard polls within the TTL don't rebuild it."""
+        with patch.object(monitor, 'analyze_estimation_accuracy', new_callable=AsyncMock) as mock_accuracy:
+            mock_accuracy.return_value = EstimationAccuracy(4.0, 3.0, 0.6, 0.9, 10, 0.5)
+            first = await monitor.get_performance_dashboard()
+            second = await monitor.get_performance_dashboard()
+            
+            monitor._dashboard_cache = (monitor._dashboard_cache[0] - 60, first)
+            await monitor.get_performance_dashboard()
+        
+        assert second is first
+        assert mock_accuracy.await_count == 2
+    
+    def test_metric_keys_unique_within_same_instant(self, monitor):
+        """Test that metric records built together get distinct keys and no timestamp field."""
+        with patch('monitoring.delivery_performance.time.time', return_value=1718452800.0):
+            key_a, payload_a = monitor._build_metric(PerformanceMetric.ESTIMATION_ACCURACY, 4.0)
+            key_b, _ = monitor._build_metric(PerformanceMetric.ESTIMATION_ACCURACY, 5.0)
+        
+        assert key_a != key_b
+        assert key_a.startswith("delivery_metric:estimation_accuracy:1718452800000:")
+        assert set(json.loads(payload_a)) == {"type", "value", "metadata"}
+
+
 if __name__ == "__main__":
     """
     Run delivery estimation tests.
@@ -532,6 +532,27 @@ class TestPaymentIntegration:
             response = client.get("/api/payments/methods")
             assert response.status_code == 200
     
+    def test_payment_intent_endpoint_json_body(self, client):
+        """Test that payment intents are created from a validated JSON body."""
+        with patch('main.create_payment_intent', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = {"success": True, "payment_intent_id": "pi_body_test"}
+            
+            response = client.post("/api/payments/intent", json={
+                "amount": "25.50",
+                "customer_info": {"name": "John Doe"},
+                "order_info": {"order_id": "123", "pizza_count": 2}
+            })
+            
+            assert response.status_code == 200
+            mock_create.assert_awaited_once_with(
+                25.5,
+                {"name": "John Doe"},
+                {"order_id": "123", "pizza_count": 2}
+            )
+            
+            response = client.post("/api/payments/intent", json={"amount": "-5"})
+            assert response.status_code == 422
+    
     def test_webhook_endpoint(self, client):
         """Test Stripe webhook endpoint."""
         # Mock webhook request
@@ -0,0 +1,248 @@
+"""
+Test suite for the Redis client.
+Tests session management against a mocked Redis connection.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from database.redis_client import (
+    RedisClient, _buffered_connection_class, _ACTIVE_SESSIONS_KEY, _dumps, _loads, _decode_fields
+)
+
+
+@pytest.fixture
+def client():
+    """RedisClient wired to a mocked Redis connection."""
+    redis_client = RedisClient(redis_url="redis://localhost:6379")
+    redis_client.client = MagicMock()
+    redis_client._create_script = MagicMock(return_value=1)
+    redis_client._update_script = MagicMock(return_value=1)
+    redis_client._pending_pipe = MagicMock()
+    redis_client._initialized = True
+    return redis_client
+
+
+class TestSessionManagement:
+    """Test suite for session create/delete operations."""
+
+    def test_create_session_runs_admission_script(self, client):
+        """Test that the cap check and write happen in one script call."""
+        assert client.create_session("call-1", {"interface_type": "phone"}) is True
+
+        kwargs = client._create_script.call_args.kwargs
+        ttl, max_sessions, session_id, *pairs = kwargs["args"]
+        fields = dict(zip(pairs[::2], pairs[1::2]))
+        assert kwargs["keys"] == [_ACTIVE_SESSIONS_KEY, "session:call-1"]
+        assert _loads(fields["interface_type"]) == "phone"
+        assert (ttl, max_sessions, session_id) == (client.session_ttl, 20, "call-1")
+        assert _loads(fields["created_at"]) == _loads(fields["last_activity"])
+
+    def test_create_session_rejected_at_capacity(self, client):
+        """Test that a refused admission reports failure."""
+        client._create_script.return_value = 0
+
+        assert client.create_session("call-21", {}) is False
+
+    def test_delete_session_pipelines_commands(self, client):
+        """Test that session data and set membership are removed together."""
+        pipe = client.client.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [1, 1]
+
+        assert client.delete_session("call-1") is True
+        pipe.delete.assert_called_once_with("session:call-1")
+        pipe.srem.assert_called_once_with(_ACTIVE_SESSIONS_KEY, "call-1")
+
+    def test_cleanup_removes_expired_in_one_srem(self, client):
+        """Test that expired and TTL-less sessions are found with one pipelined TTL batch."""
+        client.client.sscan_iter.return_value = iter([b"live", b"gone-1", b"stuck-1"])
+        pipe = client.client.pipeline.return_value.__enter__.return_value
+        pipe.execute.side_effect = [[120, -2, -1], [1, 2]]
+
+        assert client.cleanup_expired_sessions() == 2
+        pipe.unlink.assert_called_once_with("session:stuck-1")
+        pipe.srem.assert_called_once_with(_ACTIVE_SESSIONS_KEY, "gone-1", "stuck-1")
+
+    def test_get_session_decodes_hash_fields(self, client):
+        """Test that a session hash is decoded and its TTL refresh queued."""
+        client.client.hgetall.return_value = {b"agent_state": _dumps("greeting"), b"turns": _dumps(3)}
+
+        assert client.get_session("call-1") == {"agent_state": "greeting", "turns": 3}
+        client._pending_pipe.expire.assert_called_once_with("session:call-1", client.session_ttl)
+        client.client.expire.assert_not_called()
+
+    def test_update_session_writes_only_changed_fields(self, client):
+        """Test that updates send just the changed fields to the update script."""
+        assert client.update_session("call-1", {"agent_state": "ordering"}) is True
+
+        ttl, *pairs = client._update_script.call_args.kwargs["args"]
+        fields = _decode_fields(dict(zip(pairs[::2], pairs[1::2])))
+        assert ttl == client.session_ttl
+        assert set(fields) == {"agent_state", "last_activity"}
+        assert fields["agent_state"] == "ordering"
+
+    def test_update_missing_session_fails(self, client):
+        """Test that updating an unknown session does not recreate it."""
+        client._update_script.return_value = 0
+
+        assert client.update_session("ghost", {"agent_state": "ordering"}) is False
+
+    def test_get_active_sessions_decodes_ids(self, client):
+        """Test that raw set members are returned as str session IDs."""
+        client.client.sscan_iter.return_value = iter([b"call-1"])
+
+        assert client.get_active_sessions() == ["call-1"]
+
+    def test_get_sessions_bulk_pipelines_hgetall(self, client):
+        """Test that many sessions are read in one pipeline and misses are dropped."""
+        pipe = client.client.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [{b"agent_state": _dumps("greeting")}, {}]
+
+        assert client.get_sessions_bulk(["call-1", "gone"]) == {"call-1": {"agent_state": "greeting"}}
+        assert pipe.hgetall.call_count == 2
+        pipe.execute.assert_called_once()
+
+
+class TestAsyncSessions:
+    """Test suite for the redis.asyncio session operations."""
+
+    @pytest.fixture
+    def async_client(self, client):
+        """Client with a mocked asyncio Redis connection."""
+        client.async_client = MagicMock()
+        client._async_create_script = AsyncMock(return_value=1)
+        client._async_update_script = AsyncMock(return_value=1)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_acreate_session_runs_admission_script(self, async_client):
+        """Test that async creation shares the atomic admission script."""
+        assert await async_client.acreate_session("call-1", {"interface_type": "web"}) is True
+
+        kwargs = async_client._async_create_script.call_args.kwargs
+        assert kwargs["keys"] == [_ACTIVE_SESSIONS_KEY, "session:call-1"]
+        assert kwargs["client"] is async_client.async_client
+
+    @pytest.mark.asyncio
+    async def test_aget_session_decodes_hash_fields(self, async_client):
+        """Test that async reads decode the hash and slide the TTL together."""
+        pipe = async_client.async_client.pipeline.return_value.__aenter__.return_value
+        pipe.execute = AsyncMock(return_value=[{b"agent_state": _dumps("payment")}, 1])
+
+        assert await async_client.aget_session("call-1") == {"agent_state": "payment"}
+        pipe.expire.assert_called_once_with("session:call-1", async_client.session_ttl)
+
+
+class TestCaching:
+    """Test suite for cache operations."""
+
+    def test_cache_round_trip_uses_msgpack(self, client):
+        """Test that cached values are stored as msgpack and decoded on read."""
+        client.cache_set("menu", {"sizes": ["small", "large"]}, ttl=60)
+        key, ttl, payload = client._pending_pipe.setex.call_args.args
+        client._local_cache.clear()
+        client.client.get.return_value = payload
+
+        assert (key, ttl) == ("cache:menu", 60)
+        assert client.cache_get("menu") == {"sizes": ["small", "large"]}
+
+    def test_cache_get_serves_hot_keys_locally(self, client):
+        """Test that repeat reads skip Redis until the key is deleted."""
+        client.client.get.return_value = _dumps({"large": 18.99})
+
+        assert client.cache_get("prices") == {"large": 18.99}
+        assert client.cache_get("prices") == {"large": 18.99}
+        assert client.client.get.call_count == 1
+
+        client.cache_delete("prices")
+        client.cache_get("prices")
+        assert client.client.get.call_count == 2
+
+    def test_cache_get_without_local_always_reads_redis(self, client):
+        """Test that short-lived keys are not pinned in the local cache."""
+        client.client.get.return_value = _dumps([{"id": 1}])
+
+        assert client.cache_get("short_lived", local=False) == [{"id": 1}]
+        assert client.cache_get("short_lived", local=False) == [{"id": 1}]
+        assert client.client.get.call_count == 2
+
+    def test_cache_delete_flushes_queued_write_first(self, client):
+        """Test that a pending cache_set can't land after cache_delete."""
+        calls = []
+        client._pending_pipe.__len__.return_value = 1
+        client._pending_pipe.execute.side_effect = lambda: calls.append("flush")
+        client.client.delete.side_effect = lambda key: calls.append("delete")
+
+        client.cache_set("session_db:call-1", "miss", ttl=10)
+        client.cache_delete("session_db:call-1")
+
+        assert calls == ["flush", "delete"]
+
+    def test_queued_writes_flush_at_threshold(self, client):
+        """Test that the background pipeline is sent once enough writes queue up."""
+        client._pending_pipe.__len__.return_value = client.flush_threshold
+
+        client.cache_set("menu", {}, ttl=60)
+
+        client._pending_pipe.execute.assert_called_once()
+
+
+    def test_flush_failure_keeps_background_loop_running(self, client):
+        """Test that a non-Redis error in a flush is logged and the loop keeps going."""
+        client._pending_pipe.__len__.return_value = 1
+        client._pending_pipe.execute.side_effect = [TypeError("can not serialize"), None]
+        client.flush_interval = 0
+        client._flush_stop.wait = MagicMock(side_effect=[False, False, True])
+
+        client._flush_loop()
+
+        assert client._pending_pipe.execute.call_count == 2
+        client._pending_pipe.reset.assert_called_once()
+
+
+class TestConnectionPool:
+    """Test suite for connection pool configuration and monitoring."""
+
+    def test_connection_info_caches_server_info(self, client):
+        """Test that INFO is fetched by section and reused within the TTL."""
+        client.pool = MagicMock(created_connections=2, _available_connections=[])
+        client.client.scard.return_value = 3
+        pipe = client.client.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [{"connected_clients": 4}, {"used_memory_human": "1M"}]
+
+        first = client.get_connection_info()
+        second = client.get_connection_info()
+
+        assert first == second
+        assert first["connected_clients"] == 4
+        assert first["used_memory"] == "1M"
+        assert pipe.execute.call_count == 1
+
+    def test_prewarm_holds_distinct_connections(self, client):
+        """Test that prewarm opens up to max_connections and returns them all."""
+        client.pool = MagicMock()
+        client.max_connections = 3
+
+        assert client.prewarm(5) == 3
+        assert client.pool.get_connection.call_count == 3
+        assert client.pool.release.call_count == 3
+
+    def test_tcp_pool_uses_buffered_connections(self):
+        """Test that plain TCP URLs get enlarged socket buffers and keepalive."""
+        redis_client = RedisClient(redis_url="redis://localhost:6379")
+        with patch("redis.Redis"):
+            redis_client.initialize()
+        redis_client.close()
+
+        assert redis_client.pool.connection_class is _buffered_connection_class()
+        assert redis_client.pool.connection_kwargs["socket_keepalive"] is True
+
+    def test_cache_mget_fetches_misses_in_one_call(self, client):
+        """Test that bulk reads combine local hits with a single MGET."""
+        client.cache_set("sizes", ["small", "large"], ttl=3600)
+        client.client.mget.return_value = [_dumps({"large": 18.99}), None]
+
+        values = client.cache_mget(["sizes", "prices", "specials"])
+
+        assert values == {"sizes": ["small", "large"], "prices": {"large": 18.99}}
+        client.client.mget.assert_called_once_with(["cache:prices", "cache:specials"])
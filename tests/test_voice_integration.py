@@ -14,7 +14,7 @@ from voice.twilio_handler import TwilioHandler
 from voice.session_manager import SessionManager
 from voice.speech_processing import SpeechProcessor
 from agents.states import StateManager
-from main import app
+from main import app, _run_voice_webhook, _drain_status_queue, get_session_statistics
 
 
 class TestVoiceIntegration:
@@ -202,6 +202,58 @@ class TestVoiceIntegration:
             stats = response.json()
             assert "total_active_sessions" in stats
     
+    @pytest.mark.asyncio
+    async def test_voice_webhook_answers_busy_when_saturated(self, mock_request):
+        """Test that voice webhooks return busy TwiML instead of queueing past the limit."""
+        mock_request.app = Mock()
+        mock_request.app.state.voice_sem = asyncio.Semaphore(0)
+        mock_request.app.state.busy_twiml = "<Response><Hangup/></Response>"
+        handler = AsyncMock(return_value="<Response/>")
+        
+        response = await _run_voice_webhook(mock_request, handler)
+        
+        assert response.status_code == 200
+        assert response.body == b"<Response><Hangup/></Response>"
+        handler.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_status_updates_drained_from_queue(self):
+        """Test that queued call status updates are applied by the background drainer."""
+        queue = asyncio.Queue()
+        for i in range(3):
+            queue.put_nowait((f"test_call_{i}", "completed", "60"))
+        
+        with patch('main.twilio_handler') as mock_handler:
+            mock_handler.process_call_status = AsyncMock()
+            drainer = asyncio.create_task(_drain_status_queue(queue))
+            await asyncio.wait_for(queue.join(), 1)
+            drainer.cancel()
+        
+        assert mock_handler.process_call_status.await_count == 3
+        mock_handler.process_call_status.assert_any_await("test_call_0", "completed", "60")
+    
+    @pytest.mark.asyncio
+    async def test_session_stats_shared_through_redis(self):
+        """Test that session stats are computed once and then served from Redis."""
+        stored = {}
+        redis_mock = AsyncMock()
+        redis_mock.get.side_effect = lambda key: stored.get(key)
+        redis_mock.set.side_effect = lambda key, value, ex: stored.__setitem__(key, value)
+        stats = {"total_active_sessions": 3, "phone_sessions": 3, "web_sessions": 0}
+        
+        with patch('main.redis_client') as mock_redis_client, \
+             patch('main.get_session_stats', new_callable=AsyncMock) as mock_stats:
+            mock_redis_client.get_async_client.return_value = redis_mock
+            mock_stats.return_value = stats
+            
+            first = await get_session_statistics()
+            second = await get_session_statistics()
+        
+        assert json.loads(first.body) == stats
+        assert second.body == first.body
+        mock_stats.assert_awaited_once()
+        redis_mock.set.assert_awaited_once_with("sessions:stats", first.body, ex=2)
+    
     @pytest.mark.asyncio
     async def test_concurrent_session_limits(self, session_manager):
         """Test concurrent session limit enforcement."""
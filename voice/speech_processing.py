@@ -7,16 +7,17 @@ import logging
 import tempfile
 import os
 import asyncio
-import aiohttp
 import io
 from typing import Optional, Union, Dict, Any
 from pathlib import Path
 import wave
 import json
 
+import httpx
 from openai import AsyncOpenAI
 import requests
 
+from config.http_client import make_http_client
 from config.settings import settings
 from pathlib import Path
 
@@ -35,6 +36,10 @@ class SpeechProcessor:
     def __init__(self):
         """Initialize speech processor with OpenAI client and audio settings."""
         self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        
+        # Shared pooled client for audio downloads; the app installs its own at
+        # startup, otherwise one is created on first use
+        self.http_client: Optional[httpx.AsyncClient] = None
         self.sample_rate = settings.audio_sample_rate  # 16kHz for optimal Whisper performance
         self.supported_formats = ['wav', 'mp3', 'mp4', 'm4a', 'ogg', 'webm']
         
@@ -205,15 +210,17 @@ class SpeechProcessor:
             # Handle URL (Twilio recording)
             if isinstance(audio_source, str) and audio_source.startswith('http'):
                 logger.info(f"Downloading audio from URL: {audio_source}")
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(audio_source) as response:
-                        if response.status == 200:
-                            audio_data = await response.read()
-                            logger.info(f"Downloaded {len(audio_data)} bytes from URL")
-                            return audio_data
-                        else:
-                            logger.error(f"Failed to download audio: HTTP {response.status}")
-                            return None
+                if self.http_client is None:
+                    self.http_client = make_http_client()
+                
+                response = await self.http_client.get(audio_source)
+                if response.status_code == 200:
+                    audio_data = response.content
+                    logger.info(f"Downloaded {len(audio_data)} bytes from URL")
+                    return audio_data
+                else:
+                    logger.error(f"Failed to download audio: HTTP {response.status_code}")
+                    return None
             
             # Handle file path
             elif isinstance(audio_source, str) and os.path.exists(audio_source):
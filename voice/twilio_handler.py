@@ -167,15 +167,11 @@ class TwilioHandler:
         """
         try:
             form_data = await request.form()
-            call_sid = form_data.get('CallSid')
-            call_status = form_data.get('CallStatus')
-            call_duration = form_data.get('CallDuration')
-            
-            logger.info(f"Call status update: {call_sid} status: {call_status} duration: {call_duration}s")
-            
-            # Handle call completion/termination
-            if call_status in ['completed', 'busy', 'failed', 'no-answer', 'canceled']:
-                await self._handle_call_termination(call_sid, call_status, call_duration)
+            await self.process_call_status(
+                form_data.get('CallSid'),
+                form_data.get('CallStatus'),
+                form_data.get('CallDuration')
+            )
             
             return ""  # Status webhooks don't need TwiML response
             
@@ -183,6 +179,29 @@ class TwilioHandler:
             logger.error(f"Error handling call status: {str(e)}")
             return ""
     
+    async def process_call_status(
+        self,
+        call_sid: Optional[str],
+        call_status: Optional[str],
+        call_duration: Optional[str]
+    ) -> None:
+        """
+        Apply one parsed call status update.
+        
+        Split from handle_call_status so updates can be queued by the web
+        layer and applied later in batches.
+        
+        Args:
+            call_sid (str): Twilio call identifier
+            call_status (str): Reported call status
+            call_duration (str): Call duration in seconds
+        """
+        logger.info(f"Call status update: {call_sid} status: {call_status} duration: {call_duration}s")
+        
+        # Handle call completion/termination
+        if call_status in ['completed', 'busy', 'failed', 'no-answer', 'canceled']:
+            await self._handle_call_termination(call_sid, call_status, call_duration)
+    
     async def handle_recording_completed(self, request: Request) -> str:
         """
         Handle completed recording webhook from Twilio.
@@ -496,6 +515,11 @@ async def handle_incoming_call_webhook(request: Request) -> str:
     return await twilio_handler.handle_incoming_call(request)
 
 
+def busy_response_twiml() -> str:
+    """TwiML turning a caller away while the system is at capacity."""
+    return twilio_handler._create_busy_response()
+
+
 async def handle_speech_webhook(request: Request) -> str:
     """FastAPI route handler for speech input webhooks."""
     return await twilio_handler.handle_speech_input(request)